@@ -1,20 +1,35 @@
-from flask import Flask, jsonify
+from flask import Flask, jsonify, request
 from flask_cors import CORS
 from werkzeug.security import generate_password_hash
 from datetime import datetime
+import click
+import json
 import os
 
 # Import configuration
 from config.settings import Config
 from config.database import (
-    MONGO_CONNECTED, 
+    is_connected, 
+    db, 
     users_collection, 
     jobs_collection, 
     applications_collection
 )
+from config.indexes import apply_indexes, check_query_shapes
 
 # Import utilities
 from utils.text_extraction import PDF_SUPPORT, DOCX_SUPPORT
+from utils.extraction_pool import get_extraction_metrics
+from utils.ocr import OCR_SUPPORT, get_ocr_metrics
+from utils.cache import get_cache_metrics
+from utils.helpers import serialize_doc, get_authenticated_user
+from utils.json_encoding import FastJSONProvider
+from utils.bulk_import import import_resumes, iter_zip_entries, iter_directory_entries, load_roster
+from utils.application_store import migrate_application_texts
+from utils.job_counters import reconcile_job_counters
+from utils.rollups import rebuild_rollups
+from utils.ocr_queue import sweep_ocr_pending, retry_pending_extractions
+from utils.job_refs import migrate_job_ids
 
 # Import route blueprints
 from routes import auth_bp, jobs_bp, applications_bp, analytics_bp
@@ -27,6 +42,9 @@ def create_app():
     # Load configuration
     app.config.from_object(Config)
     
+    # orjson-backed jsonify() that encodes ObjectId/datetime natively
+    app.json = FastJSONProvider(app)
+    
     # Enable CORS
     CORS(app, supports_credentials=True)
     
@@ -44,6 +62,7 @@ def create_app():
     # Register health check and error handlers
     register_routes(app)
     register_error_handlers(app)
+    register_commands(app)
     
     return app
 
@@ -55,20 +74,34 @@ def register_routes(app):
     @app.route('/api/health', methods=['GET'])
     def health_check():
         """Health check endpoint"""
+        mongo_connected = is_connected()
         return jsonify({
             'status': 'healthy',
             'message': 'HR Resume Review Backend API is running!',
             'timestamp': datetime.now().isoformat(),
             'version': '1.0.0',
             'database': 'MongoDB',
-            'mongo_connected': MONGO_CONNECTED,
+            'mongo_connected': mongo_connected,
             'pdf_support': PDF_SUPPORT,
             'docx_support': DOCX_SUPPORT,
+            'ocr_support': OCR_SUPPORT,
             'stats': {
-                'total_jobs': jobs_collection.count_documents({}) if MONGO_CONNECTED else 0,
-                'total_applications': applications_collection.count_documents({}) if MONGO_CONNECTED else 0
+                'total_jobs': jobs_collection.count_documents({}) if mongo_connected else 0,
+                'total_applications': applications_collection.count_documents({}) if mongo_connected else 0
             }
         })
+    
+    @app.route('/api/metrics', methods=['GET'])
+    def metrics():
+        """Runtime metrics for background workers"""
+        if not get_authenticated_user(request):
+            return jsonify({'success': False, 'message': 'Unauthorized'}), 401
+        return jsonify({
+            'success': True,
+            'extraction': get_extraction_metrics(),
+            'ocr': get_ocr_metrics(),
+            'cache': get_cache_metrics()
+        })
 
 
 def register_error_handlers(app):
@@ -87,6 +120,110 @@ def register_error_handlers(app):
         return jsonify({'success': False, 'message': 'File too large. Maximum size is 16MB'}), 413
 
 
+def register_commands(app):
+    """Register Flask CLI commands (run with `flask --app app <command>`)"""
+    
+    @app.cli.command('bulk-import')
+    @click.argument('job_id')
+    @click.argument('source', type=click.Path(exists=True))
+    @click.option('--roster', type=click.File('rb'), help='CSV with filename, name, email, ... columns')
+    @click.option('--report', type=click.Path(), help='Write per-file outcomes to this JSON file')
+    def bulk_import_command(job_id, source, roster, report):
+        """Import a ZIP archive or directory of resumes for a job"""
+        from bson import ObjectId
+        
+        try:
+            job = jobs_collection.find_one({'_id': ObjectId(job_id)})
+        except Exception:
+            raise click.ClickException('Invalid job ID')
+        if not job:
+            raise click.ClickException('Job not found')
+        
+        max_size = app.config['MAX_CONTENT_LENGTH']
+        if os.path.isdir(source):
+            entries = iter_directory_entries(source, max_size)
+        else:
+            entries = iter_zip_entries(source, max_size)
+        summary = import_resumes(serialize_doc(job), entries, load_roster(roster) if roster else {},
+                                 app.config['UPLOAD_FOLDER'])
+        
+        for result in summary['results']:
+            if result['status'] != 'imported':
+                click.echo(f"  {result['status']:<9} {result['file']}: {result.get('message', '')}")
+        click.echo(f"✅ Imported {summary['imported']} of {summary['total']} "
+                   f"({summary['duplicate']} duplicates, {summary['skipped']} skipped, {summary['failed']} failed)")
+        
+        if report:
+            with open(report, 'w') as f:
+                json.dump(summary, f, indent=2)
+    
+    @app.cli.command('migrate-indexes')
+    @click.option('--check', is_flag=True, help='Only explain() route query shapes and fail on any COLLSCAN')
+    def migrate_indexes_command(check):
+        """Apply the index specs in config/indexes.py"""
+        if not check:
+            for name in apply_indexes(db):
+                click.echo(f"  {name}")
+            click.echo("✅ Indexes up to date")
+        
+        failures = check_query_shapes(db)
+        for name, stages in failures:
+            click.echo(f"❌ {name}: {' -> '.join(stages)}")
+        if failures:
+            raise click.ClickException(f"{len(failures)} query shapes do a collection scan")
+        click.echo("✅ All query shapes use an index")
+    
+    @app.cli.command('reconcile-job-counters')
+    @click.argument('job_id', required=False)
+    def reconcile_job_counters_command(job_id):
+        """Recompute applicant_count/status_counts on jobs from applications"""
+        changed = reconcile_job_counters(job_id)
+        click.echo(f"✅ Repaired counters on {changed} jobs")
+    
+    @app.cli.command('rebuild-rollups')
+    def rebuild_rollups_command():
+        """Recompute the analytics rollups from jobs and applications"""
+        written = rebuild_rollups()
+        click.echo(f"✅ Rebuilt {written} rollup documents")
+    
+    @app.cli.command('process-ocr-pending')
+    def process_ocr_pending_command():
+        """OCR scanned resumes still waiting for background OCR and rescore their applications"""
+        total = 0
+        while True:
+            # Stops once a pass makes no progress (e.g. the rest is claimed by a running server)
+            finished = sweep_ocr_pending(app.config['UPLOAD_FOLDER'], run_inline=True)
+            if not finished:
+                break
+            total += finished
+        click.echo(f"✅ Processed {total} pending scanned resumes")
+    
+    @app.cli.command('retry-extractions')
+    def retry_extractions_command():
+        """Re-extract and rescore applications whose extraction found the worker pool busy or timed out"""
+        total = 0
+        while True:
+            finished = retry_pending_extractions(app.config['UPLOAD_FOLDER'])
+            if not finished:
+                break
+            total += finished
+        click.echo(f"✅ Finished {total} pending extractions")
+    
+    @app.cli.command('migrate-job-ids')
+    @click.option('--batch-size', default=500, show_default=True)
+    def migrate_job_ids_command(batch_size):
+        """Convert string applications.job_id references to ObjectId"""
+        for collection, (converted, failed) in migrate_job_ids(batch_size).items():
+            click.echo(f"  {collection}: {converted} converted, {failed} left as strings")
+        click.echo("✅ Job references migrated (set JOB_ID_LEGACY_READS=false once nothing is left)")
+    
+    @app.cli.command('migrate-application-texts')
+    def migrate_application_texts_command():
+        """Move inline resume text/analysis of existing applications to application_texts"""
+        moved = migrate_application_texts()
+        click.echo(f"✅ Moved text fields for {moved} applications")
+
+
 def init_default_data():
     """Initialize database with default HR user only"""
     if users_collection.count_documents({}) == 0:
@@ -111,11 +248,13 @@ if __name__ == '__main__':
     print("🚀  HR Resume Review Backend Server (MongoDB)")
     print("="*65)
     print(f"\n📁 Upload folder: {app.config['UPLOAD_FOLDER']}")
-    print(f"🔌 MongoDB Connected: {'✅ Yes' if MONGO_CONNECTED else '❌ No'}")
+    mongo_connected = is_connected()
+    print(f"🔌 MongoDB Connected: {'✅ Yes' if mongo_connected else '❌ No'}")
     print(f"📄 PDF Support: {'✅ Enabled' if PDF_SUPPORT else '❌ Disabled'}")
     print(f"📝 DOCX Support: {'✅ Enabled' if DOCX_SUPPORT else '❌ Disabled'}")
+    print(f"🔍 OCR Fallback: {'✅ Enabled (model loads on first scanned resume)' if OCR_SUPPORT else '❌ Disabled'}")
     
-    if MONGO_CONNECTED:
+    if mongo_connected:
         # Initialize default data
         init_default_data()
     
@@ -140,9 +279,12 @@ if __name__ == '__main__':
     print("   POST   /api/applications/<id>/rescore - Recalculate ATS scores [Auth]")
     print("   GET    /api/applications/<id>/ats-breakdown - Get detailed ATS breakdown")
     print("   POST   /api/jobs/<id>/rescore-all - Rescore all applications [Auth]")
+    print("   POST   /api/jobs/<id>/bulk-import - Import a ZIP of resumes [Auth]")
+    print("   GET    /api/jobs/<id>/applications/export?format=csv|ndjson - Stream an export [Auth]")
     print("\n📊 Analytics:")
     print("   GET    /api/analytics/overview   - Dashboard overview [Auth]")
     print("   GET    /api/analytics/job/<id>   - Job analytics [Auth]")
+    print("   GET    /api/metrics              - Extraction/cache/runtime metrics [Auth]")
     print("\n" + "-"*65)
     print("🔑 Default HR Login Credentials:")
     print("   Email:    hr@company.com")
@@ -0,0 +1,133 @@
+"""
+ASGI deployment.
+
+Serves the hot, I/O-bound routes (job listing/detail, application
+listing/detail, application submit and the health check) from async Quart
+blueprints backed by motor; every other route, CORS preflight included,
+is dispatched to the existing Flask app through asgiref's WSGI adapter, so
+the API contract is unchanged.
+
+Run with an ASGI server, e.g.:
+    pip install -r requirements-async.txt
+    uvicorn asgi:app --host 0.0.0.0 --port 5000 --workers 4
+"""
+
+from datetime import datetime
+
+from werkzeug.exceptions import HTTPException
+from werkzeug.routing import RoutingException
+
+try:
+    from quart import Quart, jsonify, request
+    from asgiref.wsgi import WsgiToAsgi
+except ImportError as e:
+    raise ImportError('The ASGI deployment needs quart, motor and asgiref '
+                      '(pip install -r requirements-async.txt)') from e
+
+from config.settings import Config
+from config.async_database import MOTOR_SUPPORT, async_collection, is_connected_async
+from utils.text_extraction import PDF_SUPPORT, DOCX_SUPPORT
+from utils.json_encoding import FastJSONProvider
+from utils.ocr import OCR_SUPPORT
+from async_routes import jobs_bp, applications_bp
+from app import app as wsgi_app
+
+if not MOTOR_SUPPORT:
+    raise ImportError('The ASGI deployment needs motor (pip install -r requirements-async.txt)')
+
+
+def create_async_app():
+    """Quart app with the async blueprints"""
+    app = Quart(__name__)
+    app.config.from_object(Config)
+    app.json = FastJSONProvider(app)
+    
+    app.register_blueprint(jobs_bp)
+    app.register_blueprint(applications_bp)
+    
+    register_routes(app)
+    register_error_handlers(app)
+    return app
+
+
+def register_routes(app):
+    """Async health check and the CORS headers flask-cors adds on the WSGI side"""
+    
+    @app.route('/', methods=['GET'])
+    @app.route('/api/health', methods=['GET'])
+    async def health_check():
+        """Health check endpoint"""
+        mongo_connected = await is_connected_async()
+        return jsonify({
+            'status': 'healthy',
+            'message': 'HR Resume Review Backend API is running!',
+            'timestamp': datetime.now().isoformat(),
+            'version': '1.0.0',
+            'database': 'MongoDB',
+            'mongo_connected': mongo_connected,
+            'pdf_support': PDF_SUPPORT,
+            'docx_support': DOCX_SUPPORT,
+            'ocr_support': OCR_SUPPORT,
+            'stats': {
+                'total_jobs': await async_collection('jobs').count_documents({}) if mongo_connected else 0,
+                'total_applications': (await async_collection('applications').count_documents({})
+                                       if mongo_connected else 0)
+            }
+        })
+    
+    @app.after_request
+    async def add_cors_headers(response):
+        # Same as CORS(app, supports_credentials=True): reflect the origin
+        origin = request.headers.get('Origin')
+        if origin:
+            response.headers['Access-Control-Allow-Origin'] = origin
+            response.headers['Access-Control-Allow-Credentials'] = 'true'
+            response.vary.add('Origin')
+        return response
+
+
+def register_error_handlers(app):
+    """Same error bodies as the Flask app"""
+    
+    @app.errorhandler(500)
+    async def internal_error(e):
+        return jsonify({'success': False, 'message': 'Internal server error'}), 500
+    
+    @app.errorhandler(413)
+    async def file_too_large(e):
+        return jsonify({'success': False, 'message': 'File too large. Maximum size is 16MB'}), 413
+
+
+class Dispatcher:
+    """Routes each HTTP request to the async app if it has a matching route, else to WSGI"""
+    
+    def __init__(self, async_app, wsgi_app):
+        self.async_app = async_app
+        self.wsgi_app = WsgiToAsgi(wsgi_app)
+    
+    def _handles(self, scope):
+        if scope['method'] == 'OPTIONS':
+            return False  # preflight is answered by flask-cors
+        try:
+            self.async_app.url_map.bind('').match(scope['path'], method=scope['method'])
+            return True
+        except (HTTPException, RoutingException):
+            return False
+    
+    async def __call__(self, scope, receive, send):
+        if scope['type'] == 'http' and not self._handles(scope):
+            await self.wsgi_app(scope, receive, send)
+        else:
+            # websocket and lifespan events go to Quart
+            await self.async_app(scope, receive, send)
+
+
+async_app = create_async_app()
+app = Dispatcher(async_app, wsgi_app)
+
+
+if __name__ == '__main__':
+    import uvicorn
+    
+    print("🚀  HR Resume Review Backend Server (ASGI)")
+    uvicorn.run(app, host='0.0.0.0', port=5000)
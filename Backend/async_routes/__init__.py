@@ -0,0 +1,4 @@
+from .jobs import jobs_bp
+from .applications import applications_bp
+
+__all__ = ['jobs_bp', 'applications_bp']
@@ -0,0 +1,165 @@
+"""
+Async (Quart + motor) versions of the application list, detail and submit
+routes in routes/applications.py.
+
+Reads go through motor so a request waiting on MongoDB or on a slow upload
+holds no thread. Resume saving, text extraction and scoring are CPU/file
+bound and run on a bounded thread pool, together with the write path
+(insert, job counters, rollups), which reuses the synchronous helpers so
+both deployments keep identical side effects.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from quart import Blueprint, Response, jsonify, request, current_app
+from bson import ObjectId
+from pymongo.errors import DuplicateKeyError
+
+from config.async_database import async_collection
+from config.indexes import EMAIL_COLLATION
+from config.settings import ASYNC_EXECUTOR_WORKERS
+from routes.applications import (
+    applications_query,
+    application_stats,
+    application_form_data,
+    validate_application,
+    duplicate_query,
+    build_application,
+    store_application,
+    submitted_response
+)
+from utils.helpers import serialize_doc
+from utils.cache import get_cached_job_async
+from utils.application_store import summary_projection, merge_text_fields
+from utils.json_encoding import stream_json_async
+from utils.pagination import (
+    paginate_async,
+    paginate_with_counts_async,
+    sorted_find,
+    count_by_async,
+    parse_limit,
+    parse_flag,
+    InvalidCursor
+)
+
+applications_bp = Blueprint('applications', __name__, url_prefix='/api')
+
+_executor = ThreadPoolExecutor(max_workers=ASYNC_EXECUTOR_WORKERS, thread_name_prefix='async-offload')
+
+
+async def run_blocking(func, *args):
+    """Run a blocking call on the offload pool without blocking the event loop"""
+    return await asyncio.get_running_loop().run_in_executor(_executor, func, *args)
+
+
+@applications_bp.route('/applications', methods=['GET'])
+async def get_applications():
+    """Get applications with optional filters (keyset paginated with ?limit=&cursor=)"""
+    projection = summary_projection(request.args.get('fields'))
+    if not projection:
+        # An empty projection would return whole documents, text fields included
+        return jsonify({'success': False, 'message': 'No valid fields requested'}), 400
+    cursor = request.args.get('cursor')
+    try:
+        limit = parse_limit(request.args.get('limit'))
+    except ValueError:
+        return jsonify({'success': False, 'message': 'Invalid limit'}), 400
+    include_total = parse_flag(request.args.get('include_total'), default=not cursor)
+    
+    query, sort_field, sort_order = applications_query(
+        request.args.get('job_id'), request.args.get('status'), request.args.get('sort_by', 'score'))
+    applications = async_collection('applications')
+    
+    if limit is None:
+        try:
+            rows = sorted_find(applications, query, sort_field, sort_order, cursor, projection)
+        except InvalidCursor as e:
+            return jsonify({'success': False, 'message': str(e)}), 400
+        tail = {'next_cursor': None}
+        if include_total:
+            tail['stats'] = application_stats(await count_by_async(applications, query, 'status'))
+        return Response(stream_json_async(rows, 'applications', {'success': True}, tail),
+                        mimetype='application/json')
+    
+    try:
+        if include_total:
+            docs, next_cursor, counts = await paginate_with_counts_async(
+                applications, query, sort_field, sort_order, limit, cursor, projection)
+        else:
+            docs, next_cursor = await paginate_async(applications, query, sort_field, sort_order,
+                                                     limit, cursor, projection)
+    except InvalidCursor as e:
+        return jsonify({'success': False, 'message': str(e)}), 400
+    
+    response = {'success': True, 'applications': serialize_doc(docs), 'next_cursor': next_cursor}
+    if include_total:
+        response['stats'] = application_stats(counts)
+    return jsonify(response)
+
+
+@applications_bp.route('/applications/<app_id>', methods=['GET'])
+async def get_application(app_id):
+    """Get single application by ID"""
+    try:
+        oid = ObjectId(app_id)
+    except:
+        return jsonify({'success': False, 'message': 'Invalid application ID'}), 400
+    
+    application, text = await asyncio.gather(
+        async_collection('applications').find_one({'_id': oid}),
+        async_collection('application_texts').find_one({'_id': oid}, {'job_id': 0})
+    )
+    if not application:
+        return jsonify({'success': False, 'message': 'Application not found'}), 404
+    merge_text_fields(application, text)
+    
+    job = None
+    if application.get('job_id'):
+        try:
+            job = await get_cached_job_async(application['job_id'], async_collection('jobs'))
+        except:
+            pass
+    
+    return jsonify({'success': True, 'application': serialize_doc(application), 'job': job})
+
+
+@applications_bp.route('/jobs/<job_id>/apply', methods=['POST'])
+async def submit_application(job_id):
+    """Submit a job application"""
+    try:
+        job = await get_cached_job_async(job_id, async_collection('jobs'))
+    except:
+        return jsonify({'success': False, 'message': 'Invalid job ID'}), 400
+    
+    if not job:
+        return jsonify({'success': False, 'message': 'Job not found'}), 404
+    
+    if job['status'] != 'active':
+        return jsonify({'success': False, 'message': 'This job is no longer accepting applications'}), 400
+    
+    # The body is received without holding a thread
+    if request.content_type and 'multipart/form-data' in request.content_type:
+        data, resume_file = application_form_data(await request.form, await request.files)
+    else:
+        data = await request.get_json() or {}
+        resume_file = None
+        print(f"📥 JSON Application received: {data}")
+    
+    error = validate_application(data)
+    if error:
+        return jsonify({'success': False, 'message': error}), 400
+    
+    existing = await async_collection('applications').find_one(
+        duplicate_query(job_id, data), collation=EMAIL_COLLATION)
+    if existing:
+        print(f"❌ Duplicate application: {data['email']} already applied")
+        return jsonify({'success': False, 'message': 'You have already applied for this job'}), 400
+    
+    application = await run_blocking(build_application, job, data, resume_file, current_app.config['UPLOAD_FOLDER'])
+    try:
+        inserted_id = await run_blocking(store_application, job, application)
+    except DuplicateKeyError:
+        return jsonify({'success': False, 'message': 'You have already applied for this job'}), 400
+    
+    return jsonify(submitted_response(inserted_id, application)), 201
@@ -0,0 +1,69 @@
+"""
+Async (Quart + motor) versions of the job read routes in routes/jobs.py.
+Query building and serialization are shared with the WSGI blueprint so
+both deployments return identical responses.
+"""
+
+from quart import Blueprint, Response, jsonify, request
+from bson import ObjectId
+
+from config.async_database import async_collection
+from routes.jobs import jobs_query, job_summary, jobs_tail
+from utils.json_encoding import stream_json_async
+from utils.pagination import paginate_async, sorted_find, parse_limit, parse_flag, InvalidCursor
+
+jobs_bp = Blueprint('jobs', __name__, url_prefix='/api/jobs')
+
+
+@jobs_bp.route('', methods=['GET'])
+async def get_jobs():
+    """Get all jobs with optional filters"""
+    status = request.args.get('status')
+    department = request.args.get('department')
+    search = request.args.get('search', '').lower()
+    cursor = request.args.get('cursor')
+    try:
+        limit = parse_limit(request.args.get('limit'))
+    except ValueError:
+        return jsonify({'success': False, 'message': 'Invalid limit'}), 400
+    include_total = parse_flag(request.args.get('include_total'), default=not cursor)
+    
+    query = jobs_query(status, department, search)
+    jobs = async_collection('jobs')
+    
+    if limit is None:
+        try:
+            rows = sorted_find(jobs, query, 'created_at', -1, cursor)
+        except InvalidCursor as e:
+            return jsonify({'success': False, 'message': str(e)}), 400
+        total = await jobs.count_documents(query) if include_total and cursor else None
+        body = stream_json_async(rows, 'jobs', {'success': True}, jobs_tail(include_total, total),
+                                 transform=job_summary)
+        return Response(body, mimetype='application/json')
+    
+    try:
+        docs, next_cursor = await paginate_async(jobs, query, 'created_at', -1, limit, cursor)
+    except InvalidCursor as e:
+        return jsonify({'success': False, 'message': str(e)}), 400
+    jobs_list = [job_summary(job) for job in docs]
+    
+    response = {'success': True, 'jobs': jobs_list, 'next_cursor': next_cursor}
+    if include_total:
+        complete = not cursor and next_cursor is None
+        response['total'] = len(jobs_list) if complete else await jobs.count_documents(query)
+    return jsonify(response)
+
+
+@jobs_bp.route('/<job_id>', methods=['GET'])
+async def get_job(job_id):
+    """Get single job by ID"""
+    try:
+        oid = ObjectId(job_id)
+    except:
+        return jsonify({'success': False, 'message': 'Invalid job ID'}), 400
+    
+    job = await async_collection('jobs').find_one({'_id': oid})
+    if not job:
+        return jsonify({'success': False, 'message': 'Job not found'}), 404
+    
+    return jsonify({'success': True, 'job': job_summary(job)})
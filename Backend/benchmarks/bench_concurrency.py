@@ -0,0 +1,184 @@
+"""
+Concurrent request capacity: WSGI vs ASGI deployment.
+
+Drives already-running servers with a closed-loop asyncio load generator
+(N concurrent clients, each sending its next request as soon as the
+previous one completes) and reports requests/sec, error counts and latency
+percentiles per deployment, endpoint and concurrency level. Only the
+standard library is used, so the load generator itself needs no extra
+dependencies.
+
+Start both deployments against the same database first, e.g.:
+    gunicorn -w 4 --threads 8 -b 127.0.0.1:5000 app:app      # WSGI
+    uvicorn asgi:app --workers 4 --port 8000                 # ASGI
+
+Usage (from the Backend directory):
+    python -m benchmarks.bench_concurrency
+    python -m benchmarks.bench_concurrency --concurrency 16 --concurrency 256 --duration 20
+    python -m benchmarks.bench_concurrency --apply-job <job_id>    # also POST applications
+    python -m benchmarks.bench_concurrency --save                  # write baseline JSON
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import uuid
+from datetime import datetime
+from urllib.parse import urlsplit
+
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baselines', 'concurrency.json')
+
+DEFAULT_PATHS = ['/api/health', '/api/jobs?limit=20', '/api/applications?limit=50']
+DEFAULT_CONCURRENCY = [1, 16, 64, 256]
+
+
+def _apply_body():
+    """JSON body for one application with a unique email"""
+    token = uuid.uuid4().hex[:12]
+    return json.dumps({
+        'student_name': f'Bench {token}',
+        'email': f'bench-{token}@example.com',
+        'skills': ['Python', 'MongoDB']
+    }).encode('utf-8')
+
+
+async def _request(host, port, method, path, body=None, timeout=30):
+    """One HTTP/1.1 request on a fresh connection; returns the status code"""
+    reader, writer = await asyncio.wait_for(asyncio.open_connection(host, port), timeout)
+    try:
+        head = [f'{method} {path} HTTP/1.1', f'Host: {host}:{port}', 'Connection: close']
+        if body is not None:
+            head += ['Content-Type: application/json', f'Content-Length: {len(body)}']
+        writer.write(('\r\n'.join(head) + '\r\n\r\n').encode('ascii') + (body or b''))
+        await writer.drain()
+        status_line = await asyncio.wait_for(reader.readline(), timeout)
+        # Drain the response so the server finishes writing it
+        while await asyncio.wait_for(reader.read(64 * 1024), timeout):
+            pass
+        return int(status_line.split()[1])
+    finally:
+        writer.close()
+
+
+async def _run_level(base_url, method, path, concurrency, duration, body_factory):
+    """Closed-loop load at one concurrency level for duration seconds"""
+    url = urlsplit(base_url)
+    host, port = url.hostname, url.port or 80
+    latencies = []
+    errors = 0
+    deadline = time.perf_counter() + duration
+
+    async def client():
+        nonlocal errors
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            try:
+                status = await _request(host, port, method, path, body_factory() if body_factory else None)
+                ok = status < 500
+            except (OSError, asyncio.TimeoutError, ValueError, IndexError):
+                ok = False
+            if ok:
+                latencies.append(time.perf_counter() - started)
+            else:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    result = {'requests': len(latencies), 'errors': errors,
+              'req_per_sec': round(len(latencies) / elapsed, 1) if elapsed else None}
+    if latencies:
+        latencies.sort()
+        result.update({
+            'p50_ms': round(statistics.median(latencies) * 1000, 1),
+            'p95_ms': round(latencies[int(len(latencies) * 0.95) - 1] * 1000, 1),
+            'p99_ms': round(latencies[max(int(len(latencies) * 0.99) - 1, 0)] * 1000, 1)
+        })
+    return result
+
+
+def run_benchmarks(targets, cases, levels, duration):
+    """Run every (deployment, endpoint, concurrency) combination and return the results"""
+    results = []
+    for case in cases:
+        for concurrency in levels:
+            for deployment, base_url in targets:
+                result = asyncio.run(_run_level(base_url, case['method'], case['path'], concurrency,
+                                                duration, case.get('body')))
+                result.update({'deployment': deployment, 'method': case['method'], 'path': case['path'],
+                               'concurrency': concurrency})
+                results.append(result)
+                _print_result(result)
+    return results
+
+
+def _print_result(result):
+    name = f"{result['deployment']:<5} {result['method']:<4} {result['path']:<34} c={result['concurrency']:<4}"
+    if not result['requests']:
+        print(f"{name}  no successful requests ({result['errors']} errors)")
+        return
+    print(f"{name}  {result['req_per_sec']:>8.1f} req/s  p50 {result['p50_ms']:>7.1f} ms  "
+          f"p95 {result['p95_ms']:>7.1f} ms  p99 {result['p99_ms']:>7.1f} ms  errors {result['errors']}")
+
+
+def print_summary(results):
+    """ASGI throughput relative to WSGI for each endpoint and concurrency level"""
+    by_key = {(r['method'], r['path'], r['concurrency'], r['deployment']): r for r in results}
+    print("\nASGI vs WSGI (req/s):")
+    for (method, path, concurrency, deployment), asgi in by_key.items():
+        if deployment != 'asgi':
+            continue
+        wsgi = by_key.get((method, path, concurrency, 'wsgi'))
+        if not wsgi or not wsgi['req_per_sec'] or not asgi['req_per_sec']:
+            continue
+        ratio = asgi['req_per_sec'] / wsgi['req_per_sec']
+        print(f"  {method:<4} {path:<34} c={concurrency:<4} {ratio:>6.2f}x")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Compare concurrent request capacity of the WSGI and ASGI servers')
+    parser.add_argument('--wsgi', default='http://127.0.0.1:5000', help='WSGI deployment base URL')
+    parser.add_argument('--asgi', default='http://127.0.0.1:8000', help='ASGI deployment base URL')
+    parser.add_argument('--only', choices=['wsgi', 'asgi'], help='Benchmark a single deployment')
+    parser.add_argument('--path', action='append', help='GET path to load (repeatable)')
+    parser.add_argument('--apply-job', help='Also POST JSON applications to this job')
+    parser.add_argument('--concurrency', type=int, action='append', help='Concurrent clients (repeatable)')
+    parser.add_argument('--duration', type=float, default=10, help='Seconds per run')
+    parser.add_argument('--baseline', default=BASELINE_PATH, help='Baseline JSON path')
+    parser.add_argument('--save', action='store_true', help='Save results as the new baseline')
+    args = parser.parse_args(argv)
+
+    targets = [(name, url) for name, url in (('wsgi', args.wsgi), ('asgi', args.asgi))
+               if args.only in (None, name)]
+    cases = [{'method': 'GET', 'path': path} for path in args.path or DEFAULT_PATHS]
+    if args.apply_job:
+        cases.append({'method': 'POST', 'path': f'/api/jobs/{args.apply_job}/apply', 'body': _apply_body})
+    levels = args.concurrency or DEFAULT_CONCURRENCY
+
+    results = run_benchmarks(targets, cases, levels, args.duration)
+    print_summary(results)
+
+    if args.save:
+        report = {
+            'created_at': datetime.now().isoformat(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'duration_s': args.duration,
+            'results': results,
+        }
+        os.makedirs(os.path.dirname(args.baseline), exist_ok=True)
+        with open(args.baseline, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"\n💾 Results saved to {args.baseline}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
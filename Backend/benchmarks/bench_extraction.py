@@ -0,0 +1,215 @@
+"""
+Text extraction throughput benchmark.
+
+Generates PDF/DOCX fixtures locally (see benchmarks/fixtures.py) and times
+the PDF and DOCX readers in utils/text_extraction, reporting pages/sec,
+MB/sec and peak RSS per case. pages/sec counts the pages the reader
+actually parsed, which is fewer than the fixture has once the
+EXTRACTION_MAX_PAGES / EXTRACTION_MAX_CHARS budget stops it early. Each case runs in a fresh process so peak
+RSS is not polluted by earlier cases. Cache and worker pool are bypassed;
+only the parsers are measured.
+
+Usage (from the Backend directory):
+    python -m benchmarks.bench_extraction                 # run and print
+    python -m benchmarks.bench_extraction --save          # write baseline JSON
+    python -m benchmarks.bench_extraction --compare       # compare with baseline
+
+The baseline in benchmarks/baselines/extraction.json is committed; refresh
+it with --save (on the same machine) when a change is meant to move it.
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime
+
+from benchmarks.fixtures import CASES, make_fixture
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baselines', 'extraction.json')
+
+
+def _peak_rss_mb():
+    """Peak resident set size of this process in MB (None if unavailable)"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is KB on Linux, bytes on macOS
+    return round(peak / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+
+
+def _count_pdf_pages_read():
+    """Count PyPDF2 page text extractions; returns a one-item list holding the count"""
+    import PyPDF2
+
+    counter = [0]
+    extract_text = PyPDF2.PageObject.extract_text
+
+    def counting_extract_text(self, *args, **kwargs):
+        counter[0] += 1
+        return extract_text(self, *args, **kwargs)
+
+    PyPDF2.PageObject.extract_text = counting_extract_text
+    return counter
+
+
+def _docx_chars(data):
+    """Length of a DOCX's full text as _read_docx joins it, without the character budget"""
+    import io
+    from docx import Document
+
+    return len("\n".join(para.text for para in Document(io.BytesIO(data)).paragraphs))
+
+
+def _run_case(file_format, layout, pages, repeat, conn):
+    """Child process: build one fixture and time its reader"""
+    try:
+        from utils import text_extraction
+
+        data = make_fixture(file_format, layout, pages)
+        reader = text_extraction._read_pdf if file_format == 'pdf' else text_extraction._read_docx
+        page_reads = _count_pdf_pages_read() if file_format == 'pdf' else None
+        rss_before = _peak_rss_mb()
+
+        timings = []
+        chars = 0
+        for _ in range(repeat):
+            started = time.perf_counter()
+            text, _ = reader(data)
+            timings.append(time.perf_counter() - started)
+            chars = len(text)
+
+        if page_reads is not None:
+            pages_read = page_reads[0] / repeat
+        else:
+            # DOCX has no pages: scale the fixture's pages by the share of text read
+            full_chars = _docx_chars(data)
+            pages_read = pages * min(1, chars / full_chars) if full_chars else pages
+
+        seconds = statistics.median(timings)
+        size_mb = len(data) / (1024 * 1024)
+        conn.send({
+            'format': file_format,
+            'layout': layout,
+            'pages': pages,
+            'pages_read': round(pages_read, 2),
+            'size_mb': round(size_mb, 3),
+            'chars': chars,
+            'median_s': round(seconds, 5),
+            'pages_per_sec': round(pages_read / seconds, 2) if seconds else None,
+            'mb_per_sec': round(size_mb / seconds, 3) if seconds else None,
+            'rss_before_mb': rss_before,
+            'peak_rss_mb': _peak_rss_mb(),
+        })
+    except Exception as e:
+        conn.send({'format': file_format, 'layout': layout, 'pages': pages, 'error': f"{type(e).__name__}: {e}"})
+    finally:
+        conn.close()
+
+
+def run_benchmarks(repeat=5, formats=('pdf', 'docx')):
+    """Run every fixture case in its own process and return the results"""
+    ctx = multiprocessing.get_context('spawn')
+    results = []
+    for file_format, layout, pages in CASES:
+        if file_format not in formats:
+            continue
+        parent_conn, child_conn = ctx.Pipe(duplex=False)
+        process = ctx.Process(target=_run_case, args=(file_format, layout, pages, repeat, child_conn))
+        process.start()
+        child_conn.close()
+        result = parent_conn.recv()
+        process.join()
+        results.append(result)
+        _print_result(result)
+    return results
+
+
+def _case_key(result):
+    return f"{result['format']}:{result['layout']}:{result['pages']}"
+
+
+def _print_result(result):
+    name = f"{result['format']:<5} {result['layout']:<14} {result['pages']:>3}p"
+    if 'error' in result:
+        print(f"{name}  ERROR {result['error']}")
+        return
+    print(f"{name}  read {result['pages_read']:>5.1f}p  {result['size_mb']:>8.3f} MB  {result['median_s'] * 1000:>9.1f} ms  "
+          f"{result['pages_per_sec']:>9.1f} pages/s  {result['mb_per_sec']:>8.2f} MB/s  "
+          f"peak {result['peak_rss_mb']} MB")
+
+
+def compare(results, baseline, tolerance):
+    """Print throughput deltas against a baseline; return the regressed cases"""
+    previous = {_case_key(r): r for r in baseline.get('results', []) if 'error' not in r}
+    regressions = []
+    print(f"\nComparison with baseline from {baseline.get('created_at', 'unknown')}:")
+    for result in results:
+        old = previous.get(_case_key(result))
+        if 'error' in result or not old:
+            continue
+        delta = (result['pages_per_sec'] - old['pages_per_sec']) / old['pages_per_sec']
+        rss_delta = None
+        if result.get('peak_rss_mb') and old.get('peak_rss_mb'):
+            rss_delta = result['peak_rss_mb'] - old['peak_rss_mb']
+        marker = '  REGRESSION' if delta < -tolerance else ''
+        rss_note = f", peak RSS {rss_delta:+.1f} MB" if rss_delta is not None else ''
+        print(f"  {_case_key(result):<28} {delta * 100:+7.1f}% pages/s{rss_note}{marker}")
+        if marker:
+            regressions.append(_case_key(result))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark resume text extraction')
+    parser.add_argument('--repeat', type=int, default=5, help='Timed runs per case (median is reported)')
+    parser.add_argument('--format', choices=['pdf', 'docx'], action='append', help='Limit to one format')
+    parser.add_argument('--baseline', default=BASELINE_PATH, help='Baseline JSON path')
+    parser.add_argument('--save', action='store_true', help='Save results as the new baseline')
+    parser.add_argument('--compare', action='store_true', help='Compare results with the baseline')
+    parser.add_argument('--tolerance', type=float, default=0.2,
+                        help='Allowed pages/sec drop before a case counts as a regression (0.2 = 20%%)')
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(args.repeat, tuple(args.format or ('pdf', 'docx')))
+    report = {
+        'created_at': datetime.now().isoformat(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'repeat': args.repeat,
+        'results': results,
+    }
+
+    exit_code = 0
+    if args.compare:
+        if not os.path.exists(args.baseline):
+            print(f"No baseline at {args.baseline}; run with --save first")
+            exit_code = 1
+        else:
+            with open(args.baseline) as f:
+                regressions = compare(results, json.load(f), args.tolerance)
+            if regressions:
+                print(f"\n❌ {len(regressions)} case(s) regressed beyond {args.tolerance * 100:.0f}%")
+                exit_code = 1
+
+    if args.save:
+        os.makedirs(os.path.dirname(args.baseline), exist_ok=True)
+        with open(args.baseline, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"\n💾 Baseline saved to {args.baseline}")
+
+    return exit_code
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,230 @@
+"""
+Synthetic resume fixtures for extraction benchmarks.
+
+PDFs are written by a small built-in PDF writer (no extra dependencies);
+DOCX files are built with python-docx. Content is deterministic for a given
+seed so runs are comparable.
+"""
+
+import io
+import random
+import struct
+import zlib
+
+
+WORDS = (
+    'developed designed implemented led managed improved optimized built deployed '
+    'python java react flask mongodb docker kubernetes aws api microservices pipeline '
+    'team project customers latency throughput revenue analytics dashboard testing '
+    'automation cloud scalable data model training backend frontend migration '
+    'reduced increased delivered launched mentored collaborated architecture'
+).split()
+
+HEADINGS = ['SUMMARY', 'EXPERIENCE', 'PROJECTS', 'SKILLS', 'EDUCATION', 'CERTIFICATIONS']
+
+
+def resume_lines(rng, count, width=80):
+    """Generate resume-like lines with periodic section headings"""
+    lines = []
+    for i in range(count):
+        if i % 12 == 0:
+            lines.append(HEADINGS[(i // 12) % len(HEADINGS)])
+            continue
+        line = []
+        while sum(len(w) + 1 for w in line) < width - 12:
+            line.append(rng.choice(WORDS))
+        if rng.random() < 0.3:
+            line.append(f"{rng.randint(5, 95)}%")
+        lines.append(('- ' if rng.random() < 0.5 else '') + ' '.join(line))
+    return lines
+
+
+# ============== PDF ==============
+
+def _pdf_escape(text):
+    return text.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+
+
+def _text_block(lines, x, y, size=10, leading=13):
+    ops = [f"BT /F1 {size} Tf {leading} TL {x} {y} Td"]
+    for line in lines:
+        ops.append(f"({_pdf_escape(line)}) Tj T*")
+    ops.append("ET")
+    return "\n".join(ops)
+
+
+def _table_block(rng, x, y, rows=8, cols=4, cell_w=120, cell_h=18):
+    ops = ["0.5 w"]
+    for r in range(rows):
+        for c in range(cols):
+            cx, cy = x + c * cell_w, y - (r + 1) * cell_h
+            ops.append(f"{cx} {cy} {cell_w} {cell_h} re S")
+            word = rng.choice(WORDS) if r else f"Column {c + 1}"
+            ops.append(f"BT /F1 9 Tf {cx + 4} {cy + 5} Td ({_pdf_escape(word)}) Tj ET")
+    return "\n".join(ops)
+
+
+def _noise_image(rng, width, height):
+    """Random RGB pixels (incompressible, like a photo/scan)"""
+    return rng.randbytes(width * height * 3)
+
+
+def make_pdf(layout='single_column', pages=1, seed=0):
+    """
+    Build a PDF resume.
+    layout: single_column | two_column | tables | images | large
+    """
+    rng = random.Random(seed)
+    objects = {}
+
+    def add(body):
+        num = len(objects) + 1
+        objects[num] = body
+        return num
+
+    catalog = add(None)
+    pages_obj = add(None)
+    font = add(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+
+    page_nums = []
+    for _ in range(pages):
+        ops = []
+        xobjects = {}
+        if layout == 'two_column':
+            ops.append(_text_block(resume_lines(rng, 52, width=42), 54, 760))
+            ops.append(_text_block(resume_lines(rng, 52, width=42), 316, 760))
+        elif layout == 'tables':
+            ops.append(_text_block(resume_lines(rng, 20), 54, 760))
+            ops.append(_table_block(rng, 54, 480))
+        elif layout in ('images', 'large'):
+            size = (320, 240) if layout == 'images' else (900, 700)
+            img = _noise_image(rng, *size)
+            img_num = add(
+                f"<< /Type /XObject /Subtype /Image /Width {size[0]} /Height {size[1]} "
+                f"/ColorSpace /DeviceRGB /BitsPerComponent 8 /Length {len(img)} >>".encode(),
+            )
+            objects[img_num] = (objects[img_num], img)
+            xobjects['Im1'] = img_num
+            ops.append(_text_block(resume_lines(rng, 30), 54, 760))
+            ops.append("q 240 0 0 180 320 560 cm /Im1 Do Q")
+        else:
+            ops.append(_text_block(resume_lines(rng, 55), 54, 760))
+
+        content = zlib.compress("\n".join(ops).encode('latin-1'))
+        content_num = add((f"<< /Length {len(content)} /Filter /FlateDecode >>".encode(), content))
+        xobj = ''.join(f"/{name} {num} 0 R " for name, num in xobjects.items())
+        resources = f"<< /Font << /F1 {font} 0 R >>" + (f" /XObject << {xobj}>>" if xobj else '') + " >>"
+        page_nums.append(add(
+            f"<< /Type /Page /Parent {pages_obj} 0 R /MediaBox [0 0 612 792] "
+            f"/Resources {resources} /Contents {content_num} 0 R >>".encode()
+        ))
+
+    objects[catalog] = f"<< /Type /Catalog /Pages {pages_obj} 0 R >>".encode()
+    kids = ' '.join(f"{n} 0 R" for n in page_nums)
+    objects[pages_obj] = f"<< /Type /Pages /Kids [{kids}] /Count {len(page_nums)} >>".encode()
+
+    out = io.BytesIO()
+    out.write(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+    offsets = {}
+    for num in sorted(objects):
+        offsets[num] = out.tell()
+        body = objects[num]
+        out.write(f"{num} 0 obj\n".encode())
+        if isinstance(body, tuple):
+            out.write(body[0] + b"\nstream\n" + body[1] + b"\nendstream")
+        else:
+            out.write(body)
+        out.write(b"\nendobj\n")
+
+    xref = out.tell()
+    out.write(f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode())
+    for num in sorted(objects):
+        out.write(f"{offsets[num]:010d} 00000 n \n".encode())
+    out.write(f"trailer\n<< /Size {len(objects) + 1} /Root {catalog} 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode())
+    return out.getvalue()
+
+
+# ============== DOCX ==============
+
+def _png(rng, width, height):
+    """Encode random RGB pixels as a PNG"""
+    raw = b''.join(b'\x00' + _noise_image(rng, width, 1) for _ in range(height))
+
+    def chunk(tag, data):
+        return struct.pack('>I', len(data)) + tag + data + struct.pack('>I', zlib.crc32(tag + data) & 0xffffffff)
+
+    return (b'\x89PNG\r\n\x1a\n'
+            + chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, 2, 0, 0, 0))
+            + chunk(b'IDAT', zlib.compress(raw))
+            + chunk(b'IEND', b''))
+
+
+def make_docx(layout='single_column', pages=1, seed=0):
+    """
+    Build a DOCX resume; pages is approximate (about 45 lines per page).
+    layout: single_column | two_column | tables | images | large
+    """
+    from docx import Document
+    from docx.oxml.ns import qn
+    from docx.oxml import OxmlElement
+    from docx.shared import Inches
+
+    rng = random.Random(seed)
+    doc = Document()
+
+    if layout == 'two_column':
+        cols = OxmlElement('w:cols')
+        cols.set(qn('w:num'), '2')
+        doc.sections[0]._sectPr.append(cols)
+
+    for _ in range(pages):
+        if layout == 'tables':
+            for line in resume_lines(rng, 20):
+                doc.add_paragraph(line)
+            table = doc.add_table(rows=8, cols=4)
+            for r, row in enumerate(table.rows):
+                for c, cell in enumerate(row.cells):
+                    cell.text = rng.choice(WORDS) if r else f"Column {c + 1}"
+        elif layout in ('images', 'large'):
+            for line in resume_lines(rng, 25):
+                doc.add_paragraph(line)
+            size = (320, 240) if layout == 'images' else (900, 700)
+            doc.add_picture(io.BytesIO(_png(rng, *size)), width=Inches(3))
+        else:
+            for line in resume_lines(rng, 45, width=42 if layout == 'two_column' else 80):
+                if line in HEADINGS:
+                    doc.add_heading(line.title(), level=2)
+                else:
+                    doc.add_paragraph(line)
+        doc.add_page_break()
+
+    out = io.BytesIO()
+    doc.save(out)
+    return out.getvalue()
+
+
+# (format, layout, pages) combinations covered by the benchmark
+CASES = [
+    ('pdf', 'single_column', 1),
+    ('pdf', 'single_column', 5),
+    ('pdf', 'single_column', 20),
+    ('pdf', 'two_column', 2),
+    ('pdf', 'two_column', 10),
+    ('pdf', 'tables', 3),
+    ('pdf', 'images', 3),
+    ('pdf', 'large', 20),
+    ('docx', 'single_column', 1),
+    ('docx', 'single_column', 5),
+    ('docx', 'single_column', 20),
+    ('docx', 'two_column', 10),
+    ('docx', 'tables', 3),
+    ('docx', 'images', 3),
+    ('docx', 'large', 20),
+]
+
+
+def make_fixture(file_format, layout, pages, seed=0):
+    """Return the bytes of one fixture"""
+    if file_format == 'pdf':
+        return make_pdf(layout, pages, seed)
+    return make_docx(layout, pages, seed)
@@ -1,5 +1,5 @@
 from .settings import Config, MONGO_URI, DB_NAME, ALLOWED_EXTENSIONS
-from .database import db, client, users_collection, jobs_collection, applications_collection, sessions_collection, MONGO_CONNECTED
+from .database import db, client, users_collection, jobs_collection, applications_collection, sessions_collection, extraction_cache_collection, application_texts_collection, analytics_rollups_collection, get_client, get_db, is_connected
 
 __all__ = [
     'Config',
@@ -12,5 +12,10 @@ __all__ = [
     'jobs_collection',
     'applications_collection',
     'sessions_collection',
-    'MONGO_CONNECTED'
+    'extraction_cache_collection',
+    'application_texts_collection',
+    'analytics_rollups_collection',
+    'get_client',
+    'get_db',
+    'is_connected'
 ]
@@ -0,0 +1,74 @@
+"""
+asyncio MongoDB access for the ASGI deployment (see asgi.py).
+
+Uses motor when it is installed. Like config.database nothing connects at
+import; the AsyncIOMotorClient is created on first use inside the running
+event loop (motor clients are bound to the loop they are first used on)
+with the same pool settings as the synchronous client.
+"""
+
+import asyncio
+import os
+
+from .database import available_compressors
+from .settings import (
+    MONGO_URI,
+    DB_NAME,
+    MONGO_MAX_POOL_SIZE,
+    MONGO_MIN_POOL_SIZE,
+    MONGO_MAX_IDLE_TIME_MS,
+    MONGO_SERVER_SELECTION_TIMEOUT_MS,
+    MONGO_CONNECT_TIMEOUT_MS
+)
+
+try:
+    from motor.motor_asyncio import AsyncIOMotorClient
+    MOTOR_SUPPORT = True
+except ImportError:
+    MOTOR_SUPPORT = False
+    print("⚠️ motor not installed. Async MongoDB access unavailable.")
+
+_client = None
+_client_key = None
+
+
+def get_async_client():
+    """Return the AsyncIOMotorClient for this process and event loop"""
+    global _client, _client_key
+    if not MOTOR_SUPPORT:
+        raise RuntimeError('motor is not installed')
+    key = (os.getpid(), asyncio.get_running_loop())
+    if _client is None or _client_key != key:
+        options = {
+            'maxPoolSize': MONGO_MAX_POOL_SIZE,
+            'minPoolSize': MONGO_MIN_POOL_SIZE,
+            'maxIdleTimeMS': MONGO_MAX_IDLE_TIME_MS,
+            'serverSelectionTimeoutMS': MONGO_SERVER_SELECTION_TIMEOUT_MS,
+            'connectTimeoutMS': MONGO_CONNECT_TIMEOUT_MS
+        }
+        compressors = available_compressors()
+        if compressors:
+            options['compressors'] = ','.join(compressors)
+        _client = AsyncIOMotorClient(MONGO_URI, **options)
+        _client_key = key
+    return _client
+
+
+def get_async_db():
+    """Return the application database for the running event loop"""
+    return get_async_client()[DB_NAME]
+
+
+def async_collection(name):
+    """Motor collection by name"""
+    return get_async_db()[name]
+
+
+async def is_connected_async():
+    """Ping the server without blocking the event loop"""
+    try:
+        await get_async_client().admin.command('ping')
+        return True
+    except Exception as e:
+        print(f"❌ MongoDB connection failed: {e}")
+        return False
@@ -1,40 +1,114 @@
+"""
+Lazy, per-process MongoDB access.
+
+Nothing connects at import: the MongoClient is created on first use and
+re-created in a forked child (e.g. gunicorn workers forked after import),
+since pymongo clients must not be shared across fork. The module-level
+collection names stay importable as before; they are thin proxies that
+resolve to the current process's client on each access.
+"""
+
+import os
+import threading
+from importlib.util import find_spec
+
 from pymongo import MongoClient
-from .settings import MONGO_URI, DB_NAME
-
-# Initialize MongoDB connection
-client = None
-db = None
-users_collection = None
-jobs_collection = None
-applications_collection = None
-sessions_collection = None
-MONGO_CONNECTED = False
-
-try:
-    client = MongoClient(MONGO_URI)
-    db = client[DB_NAME]
-    
-    # Collections
-    users_collection = db['users']
-    jobs_collection = db['jobs']
-    applications_collection = db['applications']
-    sessions_collection = db['sessions']
-    
-    # Create indexes for better performance
-    users_collection.create_index('email', unique=True)
-    jobs_collection.create_index('status')
-    jobs_collection.create_index('department')
-    applications_collection.create_index('job_id')
-    applications_collection.create_index('email')
-    sessions_collection.create_index('token', unique=True)
-    sessions_collection.create_index('expires_at', expireAfterSeconds=0)
-    
-    # Test connection
-    client.admin.command('ping')
-    MONGO_CONNECTED = True
-    print(f"✅ Connected to MongoDB: {MONGO_URI}")
-    print(f"📁 Database: {DB_NAME}")
-except Exception as e:
-    MONGO_CONNECTED = False
-    print(f"❌ MongoDB connection failed: {e}")
-    print("⚠️  Make sure MongoDB is running on localhost:27017")
+from .settings import (
+    MONGO_URI,
+    DB_NAME,
+    MONGO_MAX_POOL_SIZE,
+    MONGO_MIN_POOL_SIZE,
+    MONGO_MAX_IDLE_TIME_MS,
+    MONGO_SERVER_SELECTION_TIMEOUT_MS,
+    MONGO_CONNECT_TIMEOUT_MS,
+    MONGO_COMPRESSORS
+)
+
+# Python package each wire compressor needs (zlib is in the stdlib)
+_COMPRESSOR_MODULES = {'zstd': 'zstandard', 'snappy': 'snappy', 'zlib': 'zlib'}
+
+_client = None
+_client_pid = None
+_lock = threading.Lock()
+
+
+def available_compressors():
+    """Configured compressors whose library is installed, in preference order"""
+    return [c for c in MONGO_COMPRESSORS
+            if c in _COMPRESSOR_MODULES and find_spec(_COMPRESSOR_MODULES[c]) is not None]
+
+
+def get_client():
+    """Return this process's MongoClient, creating it on first use or after fork"""
+    global _client, _client_pid
+    pid = os.getpid()
+    if _client is not None and _client_pid == pid:
+        return _client
+
+    with _lock:
+        if _client is None or _client_pid != pid:
+            # A client inherited across fork is dropped, not closed: its sockets belong to the parent
+            options = {
+                'maxPoolSize': MONGO_MAX_POOL_SIZE,
+                'minPoolSize': MONGO_MIN_POOL_SIZE,
+                'maxIdleTimeMS': MONGO_MAX_IDLE_TIME_MS,
+                'serverSelectionTimeoutMS': MONGO_SERVER_SELECTION_TIMEOUT_MS,
+                'connectTimeoutMS': MONGO_CONNECT_TIMEOUT_MS,
+                'connect': False
+            }
+            compressors = available_compressors()
+            if compressors:
+                options['compressors'] = ','.join(compressors)
+            _client = MongoClient(MONGO_URI, **options)
+            _client_pid = pid
+    return _client
+
+
+def get_db():
+    """Return the application database for this process"""
+    return get_client()[DB_NAME]
+
+
+def is_connected():
+    """Ping the server (bounded by the server selection timeout)"""
+    try:
+        get_client().admin.command('ping')
+        return True
+    except Exception as e:
+        print(f"❌ MongoDB connection failed: {e}")
+        return False
+
+
+class _LazyProxy:
+    """Forwards attribute and item access to an object resolved on every use"""
+
+    def __init__(self, resolve):
+        object.__setattr__(self, '_resolve', resolve)
+
+    def __getattr__(self, name):
+        return getattr(self._resolve(), name)
+
+    def __getitem__(self, key):
+        return self._resolve()[key]
+
+    def __repr__(self):
+        return f"<lazy {self._resolve()!r}>"
+
+
+def _collection(name):
+    return _LazyProxy(lambda: get_db()[name])
+
+
+client = _LazyProxy(get_client)
+db = _LazyProxy(get_db)
+
+# Collections
+users_collection = _collection('users')
+jobs_collection = _collection('jobs')
+applications_collection = _collection('applications')
+sessions_collection = _collection('sessions')
+extraction_cache_collection = _collection('extraction_cache')
+application_texts_collection = _collection('application_texts')
+analytics_rollups_collection = _collection('analytics_rollups')
+
+# Indexes are managed by `flask migrate-indexes` (see config/indexes.py)
@@ -0,0 +1,158 @@
+"""
+Declarative index specs and the query shapes they are meant to cover.
+
+Indexes are applied by `flask migrate-indexes` instead of at import time;
+`flask migrate-indexes --check` runs explain() on every route query shape
+and fails if any of them falls back to a collection scan.
+"""
+
+from bson import ObjectId
+from pymongo import ASCENDING, DESCENDING, IndexModel
+from pymongo.errors import OperationFailure
+
+
+# Case-insensitive email comparison (a == A, accents still distinct)
+EMAIL_COLLATION = {'locale': 'en', 'strength': 2}
+
+INDEXES = {
+    'users': [
+        IndexModel([('email', ASCENDING)], name='email_unique', unique=True),
+    ],
+    'sessions': [
+        IndexModel([('token', ASCENDING)], name='token_unique', unique=True),
+        IndexModel([('expires_at', ASCENDING)], name='expires_at_ttl', expireAfterSeconds=0),
+    ],
+    'jobs': [
+        # Sort keys end in _id so keyset pages are pure index range scans
+        IndexModel([('created_at', DESCENDING), ('_id', DESCENDING)], name='created_at_id'),
+        IndexModel([('status', ASCENDING), ('created_at', DESCENDING), ('_id', DESCENDING)],
+                   name='status_created_at_id'),
+        IndexModel([('department', ASCENDING)], name='department'),
+    ],
+    'applications': [
+        # One application per email per job; also serves the duplicate check
+        IndexModel([('job_id', ASCENDING), ('email', ASCENDING)], name='job_email_unique',
+                   unique=True, collation=EMAIL_COLLATION),
+        IndexModel([('job_id', ASCENDING), ('overall_score', DESCENDING), ('_id', DESCENDING)],
+                   name='job_score_id'),
+        IndexModel([('job_id', ASCENDING), ('status', ASCENDING), ('overall_score', DESCENDING),
+                    ('_id', DESCENDING)], name='job_status_score_id'),
+        IndexModel([('job_id', ASCENDING), ('submitted_at', DESCENDING), ('_id', DESCENDING)],
+                   name='job_submitted_at_id'),
+        IndexModel([('job_id', ASCENDING), ('student_name', ASCENDING), ('_id', ASCENDING)],
+                   name='job_student_name_id'),
+        IndexModel([('status', ASCENDING), ('overall_score', DESCENDING), ('_id', DESCENDING)],
+                   name='status_score_id'),
+        IndexModel([('overall_score', DESCENDING), ('_id', DESCENDING)], name='score_id'),
+        IndexModel([('submitted_at', DESCENDING), ('_id', DESCENDING)], name='submitted_at_id'),
+        IndexModel([('student_name', ASCENDING), ('_id', ASCENDING)], name='student_name_id'),
+        # Only applications waiting for background OCR (see utils/ocr_queue.py)
+        IndexModel([('ocr_pending', ASCENDING), ('resume_sha256', ASCENDING)], name='ocr_pending_sha',
+                   partialFilterExpression={'ocr_pending': True}),
+        # Only applications waiting for a retried text extraction
+        IndexModel([('extraction_pending', ASCENDING)], name='extraction_pending',
+                   partialFilterExpression={'extraction_pending': True}),
+    ],
+    'application_texts': [
+        IndexModel([('job_id', ASCENDING)], name='job_id'),
+    ],
+    'analytics_rollups': [
+        IndexModel([('type', ASCENDING)], name='type'),
+    ],
+}
+
+# Indexes created by earlier versions that the specs above supersede
+LEGACY_INDEXES = {
+    'users': ['email_1'],
+    'sessions': ['token_1', 'expires_at_1'],
+    'jobs': ['status_1', 'department_1', 'created_at', 'status_created_at'],
+    'applications': ['job_id_1', 'email_1', 'job_score', 'job_status', 'job_submitted_at',
+                     'job_student_name', 'status_score', 'score', 'submitted_at', 'student_name'],
+    'application_texts': ['job_id_1'],
+}
+
+_LAST_ID = ObjectId('000000000000000000000000')
+# Dual-read job reference (see utils/job_refs.py)
+_JOB_ID = {'$in': [_LAST_ID, str(_LAST_ID)]}
+
+# Keyset sort orders used by the list routes (see utils/pagination.py)
+_BY_CREATED = [('created_at', DESCENDING), ('_id', DESCENDING)]
+_BY_SCORE = [('overall_score', DESCENDING), ('_id', DESCENDING)]
+_BY_DATE = [('submitted_at', DESCENDING), ('_id', DESCENDING)]
+_BY_NAME = [('student_name', ASCENDING), ('_id', ASCENDING)]
+
+# (name, collection, filter, sort, collation) for every query a route issues
+QUERY_SHAPES = [
+    ('jobs: list', 'jobs', {}, _BY_CREATED, None),
+    ('jobs: list by status', 'jobs', {'status': 'active'}, _BY_CREATED, None),
+    ('applications: list by score', 'applications', {'job_id': _JOB_ID}, _BY_SCORE, None),
+    ('applications: list by date', 'applications', {'job_id': _JOB_ID}, _BY_DATE, None),
+    ('applications: list by name', 'applications', {'job_id': _JOB_ID}, _BY_NAME, None),
+    ('applications: list by status', 'applications', {'job_id': _JOB_ID, 'status': 'pending'}, _BY_SCORE, None),
+    ('applications: next page by score', 'applications',
+     {'$and': [{'job_id': _JOB_ID}, {'$or': [
+         {'overall_score': {'$lt': 50}},
+         {'overall_score': 50, '_id': {'$lt': _LAST_ID}},
+         {'overall_score': None}
+     ]}]}, _BY_SCORE, None),
+    ('applications: all by score', 'applications', {}, _BY_SCORE, None),
+    ('applications: all by date', 'applications', {}, _BY_DATE, None),
+    ('applications: all by name', 'applications', {}, _BY_NAME, None),
+    ('applications: all by status', 'applications', {'status': 'pending'}, _BY_SCORE, None),
+    ('applications: duplicate check', 'applications', {'job_id': _JOB_ID, 'email': 'a@example.com'},
+     None, EMAIL_COLLATION),
+    ('applications: pending OCR', 'applications', {'ocr_pending': True, 'resume_sha256': 'sha'}, None, None),
+    ('applications: pending extraction', 'applications', {'extraction_pending': True}, None, None),
+    ('analytics: top candidates', 'applications', {'overall_score': {'$exists': True}}, _BY_SCORE, None),
+    ('analytics: status count', 'applications', {'status': 'pending'}, None, None),
+    ('application_texts: by job', 'application_texts', {'job_id': _JOB_ID}, None, None),
+    ('sessions: by token', 'sessions', {'token': 'token'}, None, None),
+    ('users: by email', 'users', {'email': 'a@example.com'}, None, None),
+    ('analytics: department rollups', 'analytics_rollups', {'type': 'department'}, None, None),
+]
+
+
+def apply_indexes(db):
+    """Create all spec'd indexes and drop superseded ones; returns created index names"""
+    created = []
+    for collection_name, models in INDEXES.items():
+        collection = db[collection_name]
+        existing = collection.index_information()
+        for legacy in LEGACY_INDEXES.get(collection_name, []):
+            if legacy in existing:
+                collection.drop_index(legacy)
+                print(f"🗑️  Dropped {collection_name}.{legacy}")
+        try:
+            created += [f"{collection_name}.{name}" for name in collection.create_indexes(models)]
+        except OperationFailure as e:
+            # Typically duplicate data blocking a unique index
+            print(f"❌ Index creation failed on {collection_name}: {e}")
+            raise
+    return created
+
+
+def _plan_stages(plan):
+    """Yield every stage name in an explain() plan tree"""
+    if isinstance(plan, dict):
+        if 'stage' in plan:
+            yield plan['stage']
+        for value in plan.values():
+            yield from _plan_stages(value)
+    elif isinstance(plan, list):
+        for item in plan:
+            yield from _plan_stages(item)
+
+
+def check_query_shapes(db):
+    """explain() each query shape; returns [(name, stages)] for shapes that COLLSCAN"""
+    failures = []
+    for name, collection_name, query, sort, collation in QUERY_SHAPES:
+        cursor = db[collection_name].find(query)
+        if sort:
+            cursor = cursor.sort(sort)
+        if collation:
+            cursor = cursor.collation(collation)
+        stages = list(_plan_stages(cursor.explain()['queryPlanner']['winningPlan']))
+        if 'COLLSCAN' in stages:
+            failures.append((name, stages))
+    return failures
@@ -4,6 +4,18 @@ import os
 MONGO_URI = os.environ.get('MONGO_URI', 'mongodb://localhost:27017/')
 DB_NAME = os.environ.get('DB_NAME', 'hr_resume_portal')
 
+# MongoDB client pool (per process)
+MONGO_MAX_POOL_SIZE = int(os.environ.get('MONGO_MAX_POOL_SIZE', 50))
+MONGO_MIN_POOL_SIZE = int(os.environ.get('MONGO_MIN_POOL_SIZE', 0))
+MONGO_MAX_IDLE_TIME_MS = int(os.environ.get('MONGO_MAX_IDLE_TIME_MS', 60000))
+MONGO_SERVER_SELECTION_TIMEOUT_MS = int(os.environ.get('MONGO_SERVER_SELECTION_TIMEOUT_MS', 5000))
+MONGO_CONNECT_TIMEOUT_MS = int(os.environ.get('MONGO_CONNECT_TIMEOUT_MS', 5000))
+# Wire compressors in preference order; ones whose library is missing are skipped
+MONGO_COMPRESSORS = [c.strip() for c in os.environ.get('MONGO_COMPRESSORS', 'zstd,snappy,zlib').split(',') if c.strip()]
+
+# List endpoint pagination (?limit= is capped at this)
+PAGE_MAX_LIMIT = int(os.environ.get('PAGE_MAX_LIMIT', 500))
+
 # Allowed file extensions for uploads
 ALLOWED_EXTENSIONS = {'pdf', 'doc', 'docx'}
 
@@ -13,3 +25,60 @@ class Config:
     SECRET_KEY = os.environ.get('SECRET_KEY', 'your-secret-key-change-in-production')
     UPLOAD_FOLDER = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'uploads')
     MAX_CONTENT_LENGTH = 16 * 1024 * 1024  # 16MB max file size
+    BULK_IMPORT_MAX_CONTENT_LENGTH = 512 * 1024 * 1024  # 512MB max archive size for bulk import
+
+# Resume text extraction limits
+EXTRACTION_WORKERS = int(os.environ.get('EXTRACTION_WORKERS', 2))  # 0 runs extraction inline
+EXTRACTION_TIMEOUT = float(os.environ.get('EXTRACTION_TIMEOUT', 30))  # seconds per file
+EXTRACTION_MAX_PAGES = int(os.environ.get('EXTRACTION_MAX_PAGES', 20))
+EXTRACTION_MAX_CHARS = int(os.environ.get('EXTRACTION_MAX_CHARS', 100000))
+EXTRACTION_MAX_TASKS_PER_WORKER = int(os.environ.get('EXTRACTION_MAX_TASKS_PER_WORKER', 200))
+EXTRACTION_ACQUIRE_TIMEOUT = float(os.environ.get('EXTRACTION_ACQUIRE_TIMEOUT', 10))  # seconds to wait for a free worker
+# Workers must not be forked from the threaded web process (inherited locks, MongoClient sockets)
+EXTRACTION_START_METHOD = os.environ.get('EXTRACTION_START_METHOD', 'forkserver')
+EXTRACTION_RETRY_LIMIT = int(os.environ.get('EXTRACTION_RETRY_LIMIT', 3))  # background retries of a busy/timed-out extraction
+
+# Bulk resume import
+BULK_IMPORT_BATCH_SIZE = int(os.environ.get('BULK_IMPORT_BATCH_SIZE', 200))
+BULK_IMPORT_CONCURRENCY = int(os.environ.get('BULK_IMPORT_CONCURRENCY', max(1, EXTRACTION_WORKERS)))
+
+# OCR fallback for scanned (image-only) resumes
+OCR_ENABLED = os.environ.get('OCR_ENABLED', 'true').lower() in ('1', 'true', 'yes')
+OCR_MODEL = os.environ.get('OCR_MODEL', 'microsoft/trocr-large-handwritten')
+OCR_TIMEOUT = float(os.environ.get('OCR_TIMEOUT', 300))  # seconds per document
+OCR_MAX_PAGES = int(os.environ.get('OCR_MAX_PAGES', 5))
+OCR_MIN_TEXT_CHARS = int(os.environ.get('OCR_MIN_TEXT_CHARS', 50))  # shorter text layers fall back to OCR
+OCR_BATCH_SIZE = int(os.environ.get('OCR_BATCH_SIZE', 8))  # line crops per generate() call
+OCR_NUM_THREADS = int(os.environ.get('OCR_NUM_THREADS', 0))  # torch intra-op threads (0 = torch default)
+OCR_MAX_LENGTH = int(os.environ.get('OCR_MAX_LENGTH', 150))
+OCR_DPI = int(os.environ.get('OCR_DPI', 300))
+OCR_MIN_DPI = int(os.environ.get('OCR_MIN_DPI', 100))
+OCR_MAX_PAGE_PIXELS = int(os.environ.get('OCR_MAX_PAGE_PIXELS', 2550 * 3300))  # Letter at 300 DPI
+OCR_CACHE_SIZE = int(os.environ.get('OCR_CACHE_SIZE', 512))  # cached page results in the OCR service
+OCR_QUEUE_SIZE = int(os.environ.get('OCR_QUEUE_SIZE', 32))  # scanned resumes waiting for background OCR
+OCR_SWEEP_INTERVAL = float(os.environ.get('OCR_SWEEP_INTERVAL', 60))  # seconds idle before re-checking pending OCR
+
+# Process-local analytics response cache
+ANALYTICS_CACHE_TTL = float(os.environ.get('ANALYTICS_CACHE_TTL', 30))  # seconds; 0 disables caching
+ANALYTICS_CACHE_SIZE = int(os.environ.get('ANALYTICS_CACHE_SIZE', 256))
+
+# applications.job_id is stored as an ObjectId; keep matching legacy string
+# references until `flask migrate-job-ids` has run everywhere
+JOB_ID_LEGACY_READS = os.environ.get('JOB_ID_LEGACY_READS', 'true').lower() in ('1', 'true', 'yes')
+
+# Process-local read-through cache of job documents used for scoring
+JOB_CACHE_TTL = float(os.environ.get('JOB_CACHE_TTL', 30))  # seconds; bounds staleness across workers
+JOB_CACHE_SIZE = int(os.environ.get('JOB_CACHE_SIZE', 512))
+
+# Process-local cache of session token -> user (logout invalidates locally;
+# other workers notice within the TTL)
+SESSION_CACHE_TTL = float(os.environ.get('SESSION_CACHE_TTL', 60))
+SESSION_CACHE_SIZE = int(os.environ.get('SESSION_CACHE_SIZE', 1024))
+
+# ASGI deployment (asgi.py): threads for extraction, scoring and the
+# synchronous write path of async requests
+ASYNC_EXECUTOR_WORKERS = int(os.environ.get('ASYNC_EXECUTOR_WORKERS', 16))
+
+# Unbounded list responses are streamed from the cursor as chunked JSON
+JSON_STREAM_CHUNK_BYTES = int(os.environ.get('JSON_STREAM_CHUNK_BYTES', 64 * 1024))
+STREAM_CURSOR_BATCH_SIZE = int(os.environ.get('STREAM_CURSOR_BATCH_SIZE', 500))
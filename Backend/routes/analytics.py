@@ -1,74 +1,119 @@
 from flask import Blueprint, jsonify, request
-from bson import ObjectId
 
 from config.database import jobs_collection, applications_collection
-from utils.helpers import serialize_doc, get_authenticated_user
+from utils.helpers import get_authenticated_user
+from utils.rollups import get_overview_rollups
+from utils.job_refs import job_id_filter
+from utils.cache import analytics_cache, analytics_job_key, get_cached_job, ANALYTICS_OVERVIEW_KEY
 
 analytics_bp = Blueprint('analytics', __name__, url_prefix='/api')
 
 
-@analytics_bp.route('/analytics/overview', methods=['GET'])
-def get_analytics_overview():
-    """Get dashboard analytics overview"""
-    user = get_authenticated_user(request)
-    if not user:
-        return jsonify({'success': False, 'message': 'Unauthorized'}), 401
+def _overview_analytics():
+    """Dashboard overview payload"""
+    # Totals come from the incrementally maintained rollups (see utils/rollups.py)
+    totals, departments = get_overview_rollups()
+    total_jobs = totals.get('jobs', 0)
+    active_jobs = totals.get('active_jobs', 0)
+    status_counts = totals.get('status_counts', {})
+    dept_stats = {d['department']: d['applications'] for d in departments if d.get('applications')}
+    avg_score = round(totals['score_sum'] / totals['scored'], 1) if totals.get('scored') else 0
     
-    total_jobs = jobs_collection.count_documents({})
-    active_jobs = jobs_collection.count_documents({'status': 'active'})
-    total_applications = applications_collection.count_documents({})
-    shortlisted = applications_collection.count_documents({'status': 'shortlisted'})
-    pending = applications_collection.count_documents({'status': 'pending'})
-    interviewed = applications_collection.count_documents({'status': 'interviewed'})
-    rejected = applications_collection.count_documents({'status': 'rejected'})
+    # Top candidates
+    top_candidates = list(applications_collection.find(
+        {'overall_score': {'$exists': True}},
+        {'student_name': 1, 'job_id': 1, 'overall_score': 1, 'status': 1}
+    ).sort([('overall_score', -1), ('_id', -1)]).limit(5))
     
-    # Applications by department
+    return {
+        'total_jobs': total_jobs,
+        'active_jobs': active_jobs,
+        'closed_jobs': total_jobs - active_jobs,
+        'total_applications': totals.get('applications', 0),
+        'shortlisted': status_counts.get('shortlisted', 0),
+        'pending': status_counts.get('pending', 0),
+        'interviewed': status_counts.get('interviewed', 0),
+        'rejected': status_counts.get('rejected', 0),
+        'average_score': avg_score,
+        'applications_by_department': dept_stats,
+        'top_candidates': [{
+            'id': str(c['_id']),
+            'name': c['student_name'],
+            'job_id': str(c['job_id']),
+            'score': c['overall_score'],
+            'status': c['status']
+        } for c in top_candidates]
+    }
+
+
+def _job_analytics(job_id, job):
+    """Per-job analytics payload"""
+    # One pass over the job's applications: the leading $match/$sort use the
+    # {job_id, overall_score, _id} index, so the top-K branch reads only 10 rows
     pipeline = [
-        {'$lookup': {
-            'from': 'jobs',
-            'let': {'job_id': {'$toObjectId': '$job_id'}},
-            'pipeline': [{'$match': {'$expr': {'$eq': ['$_id', '$$job_id']}}}],
-            'as': 'job'
+        {'$match': {'job_id': job_id_filter(job_id)}},
+        {'$sort': {'overall_score': -1, '_id': -1}},
+        {'$project': {
+            'student_name': 1,
+            'status': 1,
+            'college': 1,
+            'score': {'$ifNull': ['$overall_score', 0]}
         }},
-        {'$unwind': {'path': '$job', 'preserveNullAndEmptyArrays': True}},
-        {'$group': {'_id': '$job.department', 'count': {'$sum': 1}}},
-        {'$match': {'_id': {'$ne': None}}}
+        {'$facet': {
+            'summary': [{'$group': {'_id': None, 'total': {'$sum': 1}, 'avg_score': {'$avg': '$score'}}}],
+            'statuses': [{'$group': {'_id': '$status', 'count': {'$sum': 1}}}],
+            'buckets': [{'$bucket': {
+                'groupBy': '$score',
+                'boundaries': [60, 70, 80, 90, float('inf')],
+                'default': 'Below 60',
+                'output': {'count': {'$sum': 1}}
+            }}],
+            'top': [{'$limit': 10}]
+        }}
     ]
-    dept_stats = {doc['_id']: doc['count'] for doc in applications_collection.aggregate(pipeline)}
+    result = next(applications_collection.aggregate(pipeline))
     
-    # Average score
-    avg_pipeline = [
-        {'$match': {'overall_score': {'$exists': True}}},
-        {'$group': {'_id': None, 'avg_score': {'$avg': '$overall_score'}}}
-    ]
-    avg_result = list(applications_collection.aggregate(avg_pipeline))
-    avg_score = round(avg_result[0]['avg_score'], 1) if avg_result else 0
+    summary = result['summary'][0] if result['summary'] else {'total': 0, 'avg_score': 0}
+    statuses = {doc['_id']: doc['count'] for doc in result['statuses']}
+    buckets = {doc['_id']: doc['count'] for doc in result['buckets']}
     
-    # Top candidates
-    top_candidates = list(applications_collection.find({'overall_score': {'$exists': True}}).sort('overall_score', -1).limit(5))
+    # Score distribution
+    score_ranges = {
+        '90-100': buckets.get(90, 0),
+        '80-89': buckets.get(80, 0),
+        '70-79': buckets.get(70, 0),
+        '60-69': buckets.get(60, 0),
+        'Below 60': buckets.get('Below 60', 0)
+    }
+    
+    return {
+        'job': job,
+        'total_applicants': summary['total'],
+        'shortlisted': statuses.get('shortlisted', 0),
+        'pending': statuses.get('pending', 0),
+        'interviewed': statuses.get('interviewed', 0),
+        'rejected': statuses.get('rejected', 0),
+        'average_score': round(summary['avg_score'] or 0, 1),
+        'score_distribution': score_ranges,
+        'top_candidates': [{
+            'id': str(a['_id']),
+            'name': a['student_name'],
+            'score': a['score'],
+            'status': a['status'],
+            'college': a.get('college', '')
+        } for a in result['top']]
+    }
+
+
+@analytics_bp.route('/analytics/overview', methods=['GET'])
+def get_analytics_overview():
+    """Get dashboard analytics overview"""
+    user = get_authenticated_user(request)
+    if not user:
+        return jsonify({'success': False, 'message': 'Unauthorized'}), 401
     
-    return jsonify({
-        'success': True,
-        'analytics': {
-            'total_jobs': total_jobs,
-            'active_jobs': active_jobs,
-            'closed_jobs': total_jobs - active_jobs,
-            'total_applications': total_applications,
-            'shortlisted': shortlisted,
-            'pending': pending,
-            'interviewed': interviewed,
-            'rejected': rejected,
-            'average_score': avg_score,
-            'applications_by_department': dept_stats,
-            'top_candidates': [{
-                'id': str(c['_id']),
-                'name': c['student_name'],
-                'job_id': c['job_id'],
-                'score': c['overall_score'],
-                'status': c['status']
-            } for c in top_candidates]
-        }
-    })
+    analytics = analytics_cache.get_or_compute(ANALYTICS_OVERVIEW_KEY, _overview_analytics)
+    return jsonify({'success': True, 'analytics': analytics})
 
 
 @analytics_bp.route('/analytics/job/<job_id>', methods=['GET'])
@@ -79,48 +124,14 @@ def get_job_analytics(job_id):
         return jsonify({'success': False, 'message': 'Unauthorized'}), 401
     
     try:
-        job = jobs_collection.find_one({'_id': ObjectId(job_id)})
+        job = get_cached_job(job_id)
     except:
         return jsonify({'success': False, 'message': 'Invalid job ID'}), 400
     
     if not job:
         return jsonify({'success': False, 'message': 'Job not found'}), 404
     
-    job_apps = list(applications_collection.find({'job_id': job_id}))
-    
-    # Score distribution
-    score_ranges = {
-        '90-100': len([a for a in job_apps if a.get('overall_score', 0) >= 90]),
-        '80-89': len([a for a in job_apps if 80 <= a.get('overall_score', 0) < 90]),
-        '70-79': len([a for a in job_apps if 70 <= a.get('overall_score', 0) < 80]),
-        '60-69': len([a for a in job_apps if 60 <= a.get('overall_score', 0) < 70]),
-        'Below 60': len([a for a in job_apps if a.get('overall_score', 0) < 60])
-    }
-    
-    avg_score = round(sum(a.get('overall_score', 0) for a in job_apps) / len(job_apps), 1) if job_apps else 0
-    
-    analytics = {
-        'job': serialize_doc(job),
-        'total_applicants': len(job_apps),
-        'shortlisted': len([a for a in job_apps if a['status'] == 'shortlisted']),
-        'pending': len([a for a in job_apps if a['status'] == 'pending']),
-        'interviewed': len([a for a in job_apps if a['status'] == 'interviewed']),
-        'rejected': len([a for a in job_apps if a['status'] == 'rejected']),
-        'average_score': avg_score,
-        'score_distribution': score_ranges,
-        'top_candidates': sorted(
-            [{
-                'id': str(a['_id']),
-                'name': a['student_name'],
-                'score': a.get('overall_score', 0),
-                'status': a['status'],
-                'college': a.get('college', '')
-            } for a in job_apps],
-            key=lambda x: x['score'],
-            reverse=True
-        )[:10]
-    }
-    
+    analytics = analytics_cache.get_or_compute(analytics_job_key(job_id), lambda: _job_analytics(job_id, job))
     return jsonify({'success': True, 'analytics': analytics})
 
 
@@ -1,30 +1,76 @@
-from flask import Blueprint, jsonify, request, send_file, current_app
+from flask import Blueprint, Response, jsonify, request, send_file, current_app
 from werkzeug.utils import secure_filename
 from datetime import datetime
 from bson import ObjectId
+from pymongo.errors import DuplicateKeyError
 import os
 import uuid
 import random
+import zipfile
 
-from config.database import jobs_collection, applications_collection
+from config.database import applications_collection
+from config.indexes import EMAIL_COLLATION
 from config.settings import ALLOWED_EXTENSIONS
 from utils.helpers import serialize_doc, get_authenticated_user, allowed_file
-from utils.text_extraction import extract_text_from_pdf, extract_text_from_docx
+from utils.text_extraction import extract_resume_text, extract_resume_bytes, save_upload
+from utils.ocr import awaits_ocr
+from utils.ocr_queue import schedule_extraction_retry
+from utils.extraction_pool import ExtractionError
 from utils.scoring import extract_skills_from_text, score_resume, get_ats_breakdown
+from utils.sections import segment_sections
+from utils.job_counters import APPLICATION_STATUSES, increment_applicants, move_applicant_status
+from utils.rollups import (
+    record_applications_added,
+    record_applications_removed,
+    record_status_change,
+    record_score_changes
+)
+from utils.job_refs import job_ref, job_id_filter
+from utils.cache import get_cached_job
+from utils.pagination import (
+    paginate,
+    paginate_with_counts,
+    sorted_find,
+    count_by,
+    parse_limit,
+    parse_flag,
+    InvalidCursor
+)
+from utils.json_encoding import json_stream_response
+from utils.export import export_rows, EXPORT_FORMATS, EXPORT_FIELDS
+from utils.bulk_import import import_resumes, iter_zip_entries, load_roster
+from utils.application_store import (
+    summary_projection,
+    insert_application,
+    update_application,
+    load_text_fields,
+    load_text_fields_many,
+    delete_application_texts,
+    EXCLUDE_TEXT_PROJECTION
+)
 
 applications_bp = Blueprint('applications', __name__, url_prefix='/api')
 
 
-@applications_bp.route('/applications', methods=['GET'])
-def get_applications():
-    """Get applications with optional filters"""
-    job_id = request.args.get('job_id')
-    status = request.args.get('status')
-    sort_by = request.args.get('sort_by', 'score')
+def _load_resume_text(application):
+    """Get (resume_text, sections) - either stored or re-extracted from the file"""
+    resume_text = application.get('resume_text', '')
+    sections = application.get('resume_sections')
+    
+    if not resume_text and application.get('resume_file'):
+        file_path = os.path.join(current_app.config['UPLOAD_FOLDER'], 'resumes', application['resume_file'])
+        resume_text, sections = extract_resume_text(file_path)
     
+    if sections is None:
+        sections = segment_sections(resume_text)
+    return resume_text, sections
+
+
+def applications_query(job_id, status, sort_by):
+    """Return (query, sort_field, sort_order) for the application list filters"""
     query = {}
     if job_id:
-        query['job_id'] = job_id
+        query['job_id'] = job_id_filter(job_id)
     if status and status != 'all':
         query['status'] = status
     
@@ -36,21 +82,81 @@ def get_applications():
     elif sort_by == 'name':
         sort_field = 'student_name'
         sort_order = 1
+    return query, sort_field, sort_order
+
+
+def application_stats(counts):
+    """List stats from {status: count}"""
+    return {
+        'total': sum(counts.values()),
+        'shortlisted': counts.get('shortlisted', 0),
+        'pending': counts.get('pending', 0),
+        'interviewed': counts.get('interviewed', 0),
+        'rejected': counts.get('rejected', 0)
+    }
+
+
+def counter_job_id(application):
+    """
+    ObjectId of an application's job for counter updates, or None (with a
+    warning) for a missing or malformed legacy reference
+    """
+    job_id = job_ref(application['job_id']) if application.get('job_id') else None
+    if isinstance(job_id, ObjectId):
+        return job_id
+    print(f"⚠️ Application {application.get('_id')} has an invalid job_id {job_id!r}; counters not updated")
+    return None
+
+
+@applications_bp.route('/applications', methods=['GET'])
+def get_applications():
+    """Get applications with optional filters (keyset paginated with ?limit=&cursor=)"""
+    job_id = request.args.get('job_id')
+    status = request.args.get('status')
+    sort_by = request.args.get('sort_by', 'score')
+    projection = summary_projection(request.args.get('fields'))
+    if not projection:
+        # An empty projection would return whole documents, text fields included
+        return jsonify({'success': False, 'message': 'No valid fields requested'}), 400
+    cursor = request.args.get('cursor')
+    try:
+        limit = parse_limit(request.args.get('limit'))
+    except ValueError:
+        return jsonify({'success': False, 'message': 'Invalid limit'}), 400
+    # Counts are computed for the first page unless asked otherwise
+    include_total = parse_flag(request.args.get('include_total'), default=not cursor)
     
-    applications = list(applications_collection.find(query).sort(sort_field, sort_order))
+    query, sort_field, sort_order = applications_query(job_id, status, sort_by)
+    
+    if limit is None:
+        # Unbounded listings can run to thousands of rows: stream them from the cursor
+        try:
+            rows = sorted_find(applications_collection, query, sort_field, sort_order, cursor, projection)
+        except InvalidCursor as e:
+            return jsonify({'success': False, 'message': str(e)}), 400
+        tail = {'next_cursor': None}
+        if include_total:
+            tail['stats'] = application_stats(count_by(applications_collection, query, 'status'))
+        return json_stream_response(rows, 'applications', {'success': True}, tail)
+    
+    try:
+        if include_total:
+            applications, next_cursor, counts = paginate_with_counts(
+                applications_collection, query, sort_field, sort_order, limit, cursor, projection)
+        else:
+            applications, next_cursor = paginate(applications_collection, query, sort_field, sort_order,
+                                                 limit, cursor, projection)
+    except InvalidCursor as e:
+        return jsonify({'success': False, 'message': str(e)}), 400
     apps_list = serialize_doc(applications)
     
+    response = {'success': True, 'applications': apps_list, 'next_cursor': next_cursor}
+    
     # Calculate stats
-    all_apps = list(applications_collection.find(query))
-    stats = {
-        'total': len(all_apps),
-        'shortlisted': len([a for a in all_apps if a.get('status') == 'shortlisted']),
-        'pending': len([a for a in all_apps if a.get('status') == 'pending']),
-        'interviewed': len([a for a in all_apps if a.get('status') == 'interviewed']),
-        'rejected': len([a for a in all_apps if a.get('status') == 'rejected'])
-    }
+    if include_total:
+        response['stats'] = application_stats(counts)
     
-    return jsonify({'success': True, 'applications': apps_list, 'stats': stats})
+    return jsonify(response)
 
 
 @applications_bp.route('/applications/<app_id>', methods=['GET'])
@@ -64,12 +170,13 @@ def get_application(app_id):
     if not application:
         return jsonify({'success': False, 'message': 'Application not found'}), 404
     
+    load_text_fields(application)
+    
     # Get job details
     job = None
     if application.get('job_id'):
         try:
-            job = jobs_collection.find_one({'_id': ObjectId(application['job_id'])})
-            job = serialize_doc(job)
+            job = get_cached_job(application['job_id'])
         except:
             pass
     
@@ -80,7 +187,7 @@ def get_application(app_id):
 def submit_application(job_id):
     """Submit a job application"""
     try:
-        job = jobs_collection.find_one({'_id': ObjectId(job_id)})
+        job = get_cached_job(job_id)
     except:
         return jsonify({'success': False, 'message': 'Invalid job ID'}), 400
     
@@ -92,65 +199,101 @@ def submit_application(job_id):
     
     # Handle form data
     if request.content_type and 'multipart/form-data' in request.content_type:
-        data = {
-            'student_name': request.form.get('student_name', '') or request.form.get('fullName', ''),
-            'email': request.form.get('email', ''),
-            'phone': request.form.get('phone', ''),
-            'college': request.form.get('college', ''),
-            'degree': request.form.get('degree', ''),
-            'graduation_year': request.form.get('graduation_year', '') or request.form.get('graduationYear', ''),
-            'experience': request.form.get('experience', ''),
-            'cover_letter': request.form.get('cover_letter', '') or request.form.get('coverLetter', ''),
-            'skills': [s.strip() for s in request.form.get('skills', '').split(',') if s.strip()] if request.form.get('skills') else []
-        }
-        resume_file = request.files.get('resume')
-        print(f"📥 Application received: {data.get('student_name')} - {data.get('email')}")
+        data, resume_file = application_form_data(request.form, request.files)
     else:
         data = request.get_json() or {}
         resume_file = None
         print(f"📥 JSON Application received: {data}")
     
+    error = validate_application(data)
+    if error:
+        return jsonify({'success': False, 'message': error}), 400
+    
+    # Check duplicate
+    existing = applications_collection.find_one(duplicate_query(job_id, data), collation=EMAIL_COLLATION)
+    if existing:
+        print(f"❌ Duplicate application: {data['email']} already applied")
+        return jsonify({'success': False, 'message': 'You have already applied for this job'}), 400
+    
+    application = build_application(job, data, resume_file, current_app.config['UPLOAD_FOLDER'])
+    try:
+        inserted_id = store_application(job, application)
+    except DuplicateKeyError:
+        # Lost a race with a concurrent submission for the same email
+        return jsonify({'success': False, 'message': 'You have already applied for this job'}), 400
+    
+    return jsonify(submitted_response(inserted_id, application)), 201
+
+
+def application_form_data(form, files):
+    """Return (data, resume_file) from a multipart application form"""
+    data = {
+        'student_name': form.get('student_name', '') or form.get('fullName', ''),
+        'email': form.get('email', ''),
+        'phone': form.get('phone', ''),
+        'college': form.get('college', ''),
+        'degree': form.get('degree', ''),
+        'graduation_year': form.get('graduation_year', '') or form.get('graduationYear', ''),
+        'experience': form.get('experience', ''),
+        'cover_letter': form.get('cover_letter', '') or form.get('coverLetter', ''),
+        'skills': [s.strip() for s in form.get('skills', '').split(',') if s.strip()] if form.get('skills') else []
+    }
+    print(f"📥 Application received: {data.get('student_name')} - {data.get('email')}")
+    return data, files.get('resume')
+
+
+def validate_application(data):
+    """Error message for invalid application data, or None"""
     # Validate - make college and degree optional
     if not data.get('student_name'):
         print("❌ Validation failed: Name is required")
-        return jsonify({'success': False, 'message': 'Name is required'}), 400
+        return 'Name is required'
     
     if not data.get('email'):
         print("❌ Validation failed: Email is required")
-        return jsonify({'success': False, 'message': 'Email is required'}), 400
+        return 'Email is required'
     
     if '@' not in data['email']:
         print("❌ Validation failed: Invalid email format")
-        return jsonify({'success': False, 'message': 'Invalid email format'}), 400
-    
-    # Check duplicate
-    existing = applications_collection.find_one({
-        'job_id': job_id,
-        'email': {'$regex': f'^{data["email"]}$', '$options': 'i'}
-    })
-    if existing:
-        print(f"❌ Duplicate application: {data['email']} already applied")
-        return jsonify({'success': False, 'message': 'You have already applied for this job'}), 400
-    
-    # Handle file upload
+        return 'Invalid email format'
+    return None
+
+
+def duplicate_query(job_id, data):
+    """
+    Query for an existing application by the same email. Emails are stored
+    lowercased, so this matches even without EMAIL_COLLATION (still pass it
+    so the unique index serves the query).
+    """
+    return {'job_id': job_id_filter(job_id), 'email': data['email'].lower().strip()}
+
+
+def build_application(job, data, resume_file, upload_folder):
+    """Save the resume, extract its text and score it; returns the application document"""
+    job_id = job['id']
     resume_filename = None
+    resume_sha256 = None
     extracted_skills = []
     resume_text = ""
+    resume_sections = []
+    ocr_pending = False
+    extraction_pending = False
     
     if resume_file and allowed_file(resume_file.filename):
         original_filename = secure_filename(resume_file.filename)
         filename = f"{data['student_name'].replace(' ', '_')}_{job_id}_{uuid.uuid4().hex[:8]}_{original_filename}"
-        file_path = os.path.join(current_app.config['UPLOAD_FOLDER'], 'resumes', filename)
-        resume_file.save(file_path)
+        file_path = os.path.join(upload_folder, 'resumes', filename)
+        resume_data, resume_sha256 = save_upload(resume_file, file_path)
         resume_filename = filename
         
         file_ext = original_filename.rsplit('.', 1)[1].lower()
-        if file_ext == 'pdf':
-            resume_text = extract_text_from_pdf(file_path)
-        elif file_ext in ['doc', 'docx']:
-            resume_text = extract_text_from_docx(file_path)
-        else:
-            resume_text = ""
+        try:
+            resume_text, resume_sections = extract_resume_bytes(resume_data, file_ext, resume_sha256,
+                                                                raise_errors=True)
+            ocr_pending = awaits_ocr(resume_text, file_ext)
+        except ExtractionError:
+            # Busy or timed-out pool: score without the resume now, re-extract in the background
+            extraction_pending = True
         
         if resume_text:
             extracted_skills = extract_skills_from_text(resume_text)
@@ -162,7 +305,7 @@ def submit_application(job_id):
         skills = random.sample(job.get('requirements', []), min(3, len(job.get('requirements', []))))
     
     application = {
-        'job_id': job_id,
+        'job_id': job_ref(job_id),
         'student_name': data['student_name'].strip(),
         'email': data['email'].lower().strip(),
         'phone': data.get('phone', '').strip(),
@@ -173,28 +316,85 @@ def submit_application(job_id):
         'cover_letter': data.get('cover_letter', '').strip(),
         'skills': skills,
         'resume_file': resume_filename,
+        'resume_sha256': resume_sha256,
         'resume_text': resume_text,  # Store extracted resume text for future rescoring
+        'resume_sections': resume_sections,  # Section offsets into resume_text
         'submitted_at': datetime.now(),
         'status': 'pending'
     }
+    if ocr_pending:
+        # Rescored by utils/ocr_queue.py once the scan has been OCRed
+        application['ocr_pending'] = True
+    if extraction_pending:
+        application['extraction_pending'] = True
+        schedule_extraction_retry()
     
     # Calculate ATS scores using the new comprehensive scoring system
-    scores = score_resume(application, serialize_doc(job), resume_text)
+    scores = score_resume(application, job, resume_text, resume_sections)
     application.update(scores)
-    
-    result = applications_collection.insert_one(application)
-    
-    return jsonify({
+    return application
+
+
+def store_application(job, application):
+    """Insert a scored application and count it; raises DuplicateKeyError"""
+    inserted_id = insert_application(application)
+    increment_applicants(job['id'], application['status'])
+    record_applications_added(job, [application])
+    return inserted_id
+
+
+def submitted_response(inserted_id, application):
+    """Response body for a successful submission"""
+    return {
         'success': True,
         'message': 'Application submitted successfully!',
-        'application_id': str(result.inserted_id),
+        'application_id': str(inserted_id),
         'scores': {
             'overall': application['overall_score'],
             'skill_match': application['skill_match_score'],
             'experience': application['experience_score'],
             'education': application['education_score']
         }
-    }), 201
+    }
+
+
+@applications_bp.route('/jobs/<job_id>/bulk-import', methods=['POST'])
+def bulk_import_applications(job_id):
+    """Bulk import resumes for a job from a ZIP archive and optional CSV roster"""
+    user = get_authenticated_user(request)
+    if not user:
+        return jsonify({'success': False, 'message': 'Unauthorized'}), 401
+    
+    try:
+        job = get_cached_job(job_id)
+    except:
+        return jsonify({'success': False, 'message': 'Invalid job ID'}), 400
+    
+    if not job:
+        return jsonify({'success': False, 'message': 'Job not found'}), 404
+    
+    # Archives are much larger than a single resume upload (per-request limit needs Flask >= 3.1)
+    request.max_content_length = current_app.config['BULK_IMPORT_MAX_CONTENT_LENGTH']
+    
+    archive = request.files.get('archive')
+    if not archive or not archive.filename.lower().endswith('.zip'):
+        return jsonify({'success': False, 'message': 'A ZIP archive of resumes is required'}), 400
+    
+    roster_file = request.files.get('roster')
+    roster = load_roster(roster_file.stream) if roster_file and roster_file.filename else {}
+    
+    try:
+        entries = iter_zip_entries(archive.stream, current_app.config['MAX_CONTENT_LENGTH'])
+        summary = import_resumes(job, entries, roster, current_app.config['UPLOAD_FOLDER'])
+    except zipfile.BadZipFile:
+        return jsonify({'success': False, 'message': 'Invalid ZIP archive'}), 400
+    
+    print(f"📦 Bulk import for job {job_id}: {summary['imported']}/{summary['total']} imported")
+    return jsonify({
+        'success': True,
+        'message': f"Imported {summary['imported']} of {summary['total']} resumes",
+        **summary
+    })
 
 
 @applications_bp.route('/applications/<app_id>/status', methods=['PUT'])
@@ -207,22 +407,30 @@ def update_application_status(app_id):
     data = request.get_json()
     new_status = data.get('status')
     
-    valid_statuses = ['pending', 'shortlisted', 'rejected', 'interviewed']
-    if new_status not in valid_statuses:
-        return jsonify({'success': False, 'message': f'Invalid status. Must be: {", ".join(valid_statuses)}'}), 400
+    if new_status not in APPLICATION_STATUSES:
+        return jsonify({'success': False, 'message': f'Invalid status. Must be: {", ".join(APPLICATION_STATUSES)}'}), 400
     
     try:
-        result = applications_collection.update_one(
+        # Returns the pre-update status so the job counters move exactly once
+        previous = applications_collection.find_one_and_update(
             {'_id': ObjectId(app_id)},
-            {'$set': {'status': new_status}}
+            {'$set': {'status': new_status}},
+            projection={'job_id': 1, 'status': 1}
         )
     except:
         return jsonify({'success': False, 'message': 'Invalid application ID'}), 400
     
-    if result.matched_count == 0:
+    if previous is None:
         return jsonify({'success': False, 'message': 'Application not found'}), 404
     
-    application = applications_collection.find_one({'_id': ObjectId(app_id)})
+    # The status is already written: a bad job reference only skips the counters
+    old_status = previous.get('status') or 'pending'
+    job_id = counter_job_id(previous)
+    if job_id:
+        move_applicant_status(job_id, old_status, new_status)
+        record_status_change(job_id, old_status, new_status)
+    
+    application = applications_collection.find_one({'_id': ObjectId(app_id)}, EXCLUDE_TEXT_PROJECTION)
     return jsonify({
         'success': True,
         'message': f'Application status updated to {new_status}',
@@ -246,34 +454,31 @@ def rescore_application(app_id):
         return jsonify({'success': False, 'message': 'Application not found'}), 404
     
     try:
-        job = jobs_collection.find_one({'_id': ObjectId(application['job_id'])})
+        job = get_cached_job(application['job_id'])
     except:
         return jsonify({'success': False, 'message': 'Associated job not found'}), 404
     
-    # Get resume text - either from stored text or re-extract from file
-    resume_text = application.get('resume_text', '')
+    if not job:
+        return jsonify({'success': False, 'message': 'Associated job not found'}), 404
     
-    if not resume_text and application.get('resume_file'):
-        file_path = os.path.join(current_app.config['UPLOAD_FOLDER'], 'resumes', application['resume_file'])
-        if os.path.exists(file_path):
-            file_ext = application['resume_file'].rsplit('.', 1)[1].lower()
-            if file_ext == 'pdf':
-                from utils.text_extraction import extract_text_from_pdf
-                resume_text = extract_text_from_pdf(file_path)
-            elif file_ext in ['doc', 'docx']:
-                from utils.text_extraction import extract_text_from_docx
-                resume_text = extract_text_from_docx(file_path)
+    load_text_fields(application)
     
-    scores = score_resume(serialize_doc(application), serialize_doc(job), resume_text)
+    # Get resume text - either from stored text or re-extract from file
+    resume_text, resume_sections = _load_resume_text(application)
+    
+    scores = score_resume(serialize_doc(application), job, resume_text, resume_sections)
     
     # Update application with new scores and resume text
     update_data = scores.copy()
     if resume_text:
         update_data['resume_text'] = resume_text
+        update_data['resume_sections'] = resume_sections
     
-    applications_collection.update_one({'_id': ObjectId(app_id)}, {'$set': update_data})
+    update_application(ObjectId(app_id), update_data)
+    record_score_changes(job,
+                         [(application.get('overall_score'), scores.get('overall_score'))])
     
-    updated_app = applications_collection.find_one({'_id': ObjectId(app_id)})
+    updated_app = load_text_fields(applications_collection.find_one({'_id': ObjectId(app_id)}))
     return jsonify({
         'success': True,
         'message': 'ATS scores recalculated successfully',
@@ -293,29 +498,20 @@ def get_ats_score_breakdown(app_id):
         return jsonify({'success': False, 'message': 'Application not found'}), 404
     
     try:
-        job = jobs_collection.find_one({'_id': ObjectId(application['job_id'])})
+        job = get_cached_job(application['job_id'])
     except:
         return jsonify({'success': False, 'message': 'Associated job not found'}), 404
     
     if not job:
         return jsonify({'success': False, 'message': 'Associated job not found'}), 404
     
-    # Get resume text
-    resume_text = application.get('resume_text', '')
+    load_text_fields(application)
     
-    if not resume_text and application.get('resume_file'):
-        file_path = os.path.join(current_app.config['UPLOAD_FOLDER'], 'resumes', application['resume_file'])
-        if os.path.exists(file_path):
-            file_ext = application['resume_file'].rsplit('.', 1)[1].lower()
-            if file_ext == 'pdf':
-                from utils.text_extraction import extract_text_from_pdf
-                resume_text = extract_text_from_pdf(file_path)
-            elif file_ext in ['doc', 'docx']:
-                from utils.text_extraction import extract_text_from_docx
-                resume_text = extract_text_from_docx(file_path)
+    # Get resume text
+    resume_text, resume_sections = _load_resume_text(application)
     
     # Get detailed breakdown
-    breakdown = get_ats_breakdown(serialize_doc(application), serialize_doc(job), resume_text)
+    breakdown = get_ats_breakdown(serialize_doc(application), job, resume_text, resume_sections)
     
     return jsonify({
         'success': True,
@@ -334,7 +530,7 @@ def rescore_all_applications(job_id):
         return jsonify({'success': False, 'message': 'Unauthorized'}), 401
     
     try:
-        job = jobs_collection.find_one({'_id': ObjectId(job_id)})
+        job = get_cached_job(job_id)
     except:
         return jsonify({'success': False, 'message': 'Invalid job ID'}), 400
     
@@ -342,37 +538,28 @@ def rescore_all_applications(job_id):
         return jsonify({'success': False, 'message': 'Job not found'}), 404
     
     # Get all applications for this job
-    applications = list(applications_collection.find({'job_id': job_id}))
+    applications = load_text_fields_many(list(applications_collection.find({'job_id': job_id_filter(job_id)})))
     
     rescored_count = 0
+    score_changes = []
     errors = []
     
     for application in applications:
         try:
             # Get resume text
-            resume_text = application.get('resume_text', '')
-            
-            if not resume_text and application.get('resume_file'):
-                file_path = os.path.join(current_app.config['UPLOAD_FOLDER'], 'resumes', application['resume_file'])
-                if os.path.exists(file_path):
-                    file_ext = application['resume_file'].rsplit('.', 1)[1].lower()
-                    if file_ext == 'pdf':
-                        resume_text = extract_text_from_pdf(file_path)
-                    elif file_ext in ['doc', 'docx']:
-                        resume_text = extract_text_from_docx(file_path)
+            resume_text, resume_sections = _load_resume_text(application)
             
             # Calculate new scores
-            scores = score_resume(serialize_doc(application), serialize_doc(job), resume_text)
+            scores = score_resume(serialize_doc(application), job, resume_text, resume_sections)
             
             # Update application
             update_data = scores.copy()
             if resume_text:
                 update_data['resume_text'] = resume_text
+                update_data['resume_sections'] = resume_sections
             
-            applications_collection.update_one(
-                {'_id': application['_id']},
-                {'$set': update_data}
-            )
+            update_application(application['_id'], update_data)
+            score_changes.append((application.get('overall_score'), scores.get('overall_score')))
             rescored_count += 1
             
         except Exception as e:
@@ -381,6 +568,8 @@ def rescore_all_applications(job_id):
                 'error': str(e)
             })
     
+    record_score_changes(job, score_changes)
+    
     return jsonify({
         'success': True,
         'message': f'Rescored {rescored_count} applications',
@@ -432,5 +621,46 @@ def delete_application(app_id):
         if os.path.exists(file_path):
             os.remove(file_path)
     
-    applications_collection.delete_one({'_id': ObjectId(app_id)})
+    result = applications_collection.delete_one({'_id': ObjectId(app_id)})
+    delete_application_texts(app_id=ObjectId(app_id))
+    # The delete is already committed: a bad job reference only skips the counters
+    job_id = counter_job_id(application) if result.deleted_count else None
+    if job_id:
+        status = application.get('status') or 'pending'
+        increment_applicants(job_id, status, -1)
+        record_applications_removed(job_id, [{**application, 'status': status}])
     return jsonify({'success': True, 'message': 'Application deleted successfully'})
+
+
+@applications_bp.route('/jobs/<job_id>/applications/export', methods=['GET'])
+def export_applications(job_id):
+    """Stream a job's applications as CSV or NDJSON (?format=, ?fields=, ?status=, ?sort_by=)"""
+    user = get_authenticated_user(request)
+    if not user:
+        return jsonify({'success': False, 'message': 'Unauthorized'}), 401
+    
+    export_format = request.args.get('format', 'csv').lower()
+    if export_format not in EXPORT_FORMATS:
+        return jsonify({'success': False, 'message': 'Format must be csv or ndjson'}), 400
+    
+    try:
+        job = get_cached_job(job_id)
+    except:
+        return jsonify({'success': False, 'message': 'Invalid job ID'}), 400
+    
+    if not job:
+        return jsonify({'success': False, 'message': 'Job not found'}), 404
+    
+    fields_param = request.args.get('fields')
+    fields = list(summary_projection(fields_param)) if fields_param else EXPORT_FIELDS
+    if not fields:
+        return jsonify({'success': False, 'message': 'No valid fields requested'}), 400
+    
+    query, sort_field, sort_order = applications_query(
+        job['id'], request.args.get('status'), request.args.get('sort_by', 'score'))
+    rows = sorted_find(applications_collection, query, sort_field, sort_order,
+                       projection={field: 1 for field in fields})
+    
+    filename = f"applications_{job['id']}.{export_format}"
+    return Response(export_rows(rows, fields, export_format), mimetype=EXPORT_FORMATS[export_format],
+                    headers={'Content-Disposition': f'attachment; filename="{filename}"'})
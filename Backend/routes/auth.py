@@ -3,7 +3,7 @@ from werkzeug.security import generate_password_hash, check_password_hash
 from datetime import datetime, timedelta
 
 from config.database import users_collection, sessions_collection
-from utils.helpers import serialize_doc, generate_session_token
+from utils.helpers import generate_session_token, get_request_token, get_session, end_session
 
 auth_bp = Blueprint('auth', __name__, url_prefix='/api/auth')
 
@@ -47,30 +47,25 @@ def login():
 @auth_bp.route('/logout', methods=['POST'])
 def logout():
     """HR Logout endpoint"""
-    token = request.headers.get('Authorization', '').replace('Bearer ', '')
+    token = get_request_token(request)
     if token:
-        sessions_collection.delete_one({'token': token})
+        end_session(token)
     return jsonify({'success': True, 'message': 'Logged out successfully'})
 
 
 @auth_bp.route('/verify', methods=['GET'])
 def verify_token():
     """Verify if session token is valid"""
-    token = request.headers.get('Authorization', '').replace('Bearer ', '')
-    session = sessions_collection.find_one({'token': token})
+    session = get_session(get_request_token(request))
     
     if not session:
-        return jsonify({'valid': False}), 401
+        return jsonify({'valid': False, 'message': 'Invalid or expired session'}), 401
     
-    if datetime.now() > session['expires_at']:
-        sessions_collection.delete_one({'token': token})
-        return jsonify({'valid': False, 'message': 'Session expired'}), 401
-    
-    user = users_collection.find_one({'email': session['email']})
+    user = session['user']
     return jsonify({
         'valid': True,
         'user': {
-            'id': str(user['_id']),
+            'id': user['id'],
             'email': user['email'],
             'name': user['name'],
             'role': user['role']
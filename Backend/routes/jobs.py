@@ -6,18 +6,24 @@ import os
 
 from config.database import jobs_collection, applications_collection
 from utils.helpers import serialize_doc, get_authenticated_user
+from utils.application_store import delete_application_texts
+from utils.job_counters import empty_counters
+from utils.rollups import (
+    record_job_added,
+    record_job_removed,
+    record_job_status_change,
+    record_job_department_change
+)
+from utils.cache import invalidate_analytics, invalidate_job
+from utils.job_refs import job_id_filter
+from utils.pagination import paginate, sorted_find, parse_limit, parse_flag, InvalidCursor
+from utils.json_encoding import json_stream_response
 
 jobs_bp = Blueprint('jobs', __name__, url_prefix='/api/jobs')
 
 
-@jobs_bp.route('', methods=['GET'])
-def get_jobs():
-    """Get all jobs with optional filters"""
-    status = request.args.get('status')
-    department = request.args.get('department')
-    search = request.args.get('search', '').lower()
-    
-    # Build query
+def jobs_query(status, department, search):
+    """Build the job list query from its filters"""
     query = {}
     if status and status != 'all':
         query['status'] = status
@@ -28,17 +34,65 @@ def get_jobs():
             {'title': {'$regex': search, '$options': 'i'}},
             {'description': {'$regex': search, '$options': 'i'}}
         ]
+    return query
+
+
+def job_summary(job):
+    """Serialized job with its applicant count"""
+    job_data = serialize_doc(job)
+    job_data['applicants'] = job.get('applicant_count', 0)
+    return job_data
+
+
+def jobs_tail(include_total, total=None):
+    """
+    Trailing fields of a streamed (unbounded) job listing. Without a known
+    total (no cursor) the streamed row count is the total.
+    """
+    if not include_total:
+        return {'next_cursor': None}
+    if total is not None:
+        return {'next_cursor': None, 'total': total}
+    return lambda count: {'next_cursor': None, 'total': count}
+
+
+@jobs_bp.route('', methods=['GET'])
+def get_jobs():
+    """Get all jobs with optional filters"""
+    status = request.args.get('status')
+    department = request.args.get('department')
+    search = request.args.get('search', '').lower()
+    cursor = request.args.get('cursor')
+    try:
+        limit = parse_limit(request.args.get('limit'))
+    except ValueError:
+        return jsonify({'success': False, 'message': 'Invalid limit'}), 400
+    include_total = parse_flag(request.args.get('include_total'), default=not cursor)
+    
+    query = jobs_query(status, department, search)
     
-    jobs = list(jobs_collection.find(query).sort('created_at', -1))
-    jobs_list = []
+    if limit is None:
+        # Stream unbounded listings straight from the cursor
+        try:
+            rows = sorted_find(jobs_collection, query, 'created_at', -1, cursor)
+        except InvalidCursor as e:
+            return jsonify({'success': False, 'message': str(e)}), 400
+        total = jobs_collection.count_documents(query) if include_total and cursor else None
+        return json_stream_response(rows, 'jobs', {'success': True}, jobs_tail(include_total, total),
+                                    transform=job_summary)
     
-    for job in jobs:
-        job_data = serialize_doc(job)
-        # Add applicant count
-        job_data['applicants'] = applications_collection.count_documents({'job_id': str(job['_id'])})
-        jobs_list.append(job_data)
+    try:
+        jobs, next_cursor = paginate(jobs_collection, query, 'created_at', -1, limit, cursor)
+    except InvalidCursor as e:
+        return jsonify({'success': False, 'message': str(e)}), 400
+    jobs_list = [job_summary(job) for job in jobs]
     
-    return jsonify({'success': True, 'jobs': jobs_list, 'total': len(jobs_list)})
+    response = {'success': True, 'jobs': jobs_list, 'next_cursor': next_cursor}
+    if include_total:
+        # A single complete page already knows its size
+        complete = not cursor and next_cursor is None
+        response['total'] = len(jobs_list) if complete else jobs_collection.count_documents(query)
+    return jsonify(response)
 
 
 @jobs_bp.route('/<job_id>', methods=['GET'])
@@ -52,10 +106,7 @@ def get_job(job_id):
     if not job:
         return jsonify({'success': False, 'message': 'Job not found'}), 404
     
-    job_data = serialize_doc(job)
-    job_data['applicants'] = applications_collection.count_documents({'job_id': job_id})
-    
-    return jsonify({'success': True, 'job': job_data})
+    return jsonify({'success': True, 'job': job_summary(job)})
 
 
 @jobs_bp.route('', methods=['POST'])
@@ -95,7 +146,8 @@ def create_job():
         'created_at': datetime.now(),
         'deadline': data.get('deadline', (datetime.now() + timedelta(days=30)).strftime('%Y-%m-%d')),
         'status': data.get('status', 'active'),
-        'created_by': user['id']
+        'created_by': user['id'],
+        **empty_counters()
     }
     
     # Handle JD file upload if provided
@@ -109,6 +161,7 @@ def create_job():
     
     result = jobs_collection.insert_one(job)
     job['_id'] = result.inserted_id
+    record_job_added(job)
     
     return jsonify({'success': True, 'message': 'Job created successfully', 'job': serialize_doc(job)}), 201
 
@@ -145,6 +198,12 @@ def update_job(job_id):
     
     if update_data:
         jobs_collection.update_one({'_id': ObjectId(job_id)}, {'$set': update_data})
+        if 'status' in update_data:
+            record_job_status_change(job.get('status'), update_data['status'])
+        if 'department' in update_data:
+            record_job_department_change(job_id, job.get('department'), update_data['department'])
+        invalidate_analytics(job_id)
+        invalidate_job(job_id)
     
     updated_job = jobs_collection.find_one({'_id': ObjectId(job_id)})
     return jsonify({'success': True, 'message': 'Job updated successfully', 'job': serialize_doc(updated_job)})
@@ -158,15 +217,18 @@ def delete_job(job_id):
         return jsonify({'success': False, 'message': 'Unauthorized'}), 401
     
     try:
-        result = jobs_collection.delete_one({'_id': ObjectId(job_id)})
+        job = jobs_collection.find_one_and_delete({'_id': ObjectId(job_id)}, projection={'status': 1})
     except:
         return jsonify({'success': False, 'message': 'Invalid job ID'}), 400
     
-    if result.deleted_count == 0:
+    if job is None:
         return jsonify({'success': False, 'message': 'Job not found'}), 404
     
     # Delete related applications
-    applications_collection.delete_many({'job_id': job_id})
+    applications_collection.delete_many({'job_id': job_id_filter(job_id)})
+    delete_application_texts(job_id=job_id)
+    record_job_removed(job)
+    invalidate_job(job_id)
     
     return jsonify({'success': True, 'message': 'Job deleted successfully'})
 
@@ -179,12 +241,16 @@ def close_job(job_id):
         return jsonify({'success': False, 'message': 'Unauthorized'}), 401
     
     try:
-        result = jobs_collection.update_one({'_id': ObjectId(job_id)}, {'$set': {'status': 'closed'}})
+        previous = jobs_collection.find_one_and_update(
+            {'_id': ObjectId(job_id)}, {'$set': {'status': 'closed'}}, projection={'status': 1})
     except:
         return jsonify({'success': False, 'message': 'Invalid job ID'}), 400
     
-    if result.matched_count == 0:
+    if previous is None:
         return jsonify({'success': False, 'message': 'Job not found'}), 404
+    record_job_status_change(previous.get('status'), 'closed')
+    invalidate_analytics(job_id)
+    invalidate_job(job_id)
     
     job = jobs_collection.find_one({'_id': ObjectId(job_id)})
     return jsonify({'success': True, 'message': 'Job closed successfully', 'job': serialize_doc(job)})
@@ -0,0 +1,88 @@
+import io
+
+import mongomock
+import pytest
+from bson import ObjectId
+from flask import Flask
+from werkzeug.datastructures import FileStorage
+
+import routes.applications as routes
+from utils.extraction_pool import ExtractionBusy
+
+
+@pytest.fixture
+def db(monkeypatch):
+    db = mongomock.MongoClient().db
+    monkeypatch.setattr(routes, 'applications_collection', db.applications)
+    monkeypatch.setattr(routes, 'get_authenticated_user', lambda request: {'id': 'user'})
+    monkeypatch.setattr(routes, 'delete_application_texts', lambda **kwargs: None)
+    db.counter_calls = []
+    monkeypatch.setattr(routes, 'increment_applicants', lambda *args: db.counter_calls.append(args))
+    monkeypatch.setattr(routes, 'record_applications_removed', lambda *args: db.counter_calls.append(args))
+    return db
+
+
+@pytest.fixture
+def client(db, tmp_path):
+    app = Flask(__name__)
+    app.config['UPLOAD_FOLDER'] = str(tmp_path)
+    app.register_blueprint(routes.applications_bp, url_prefix='/api')
+    return app.test_client()
+
+
+def test_delete_with_malformed_job_id_skips_counters(db, client):
+    app_id = db.applications.insert_one({'job_id': 'legacy-ref', 'status': 'pending'}).inserted_id
+    response = client.delete(f'/api/applications/{app_id}')
+    assert response.status_code == 200
+    assert db.applications.count_documents({}) == 0
+    assert db.counter_calls == []
+
+
+def test_delete_without_status_counts_as_pending(db, client):
+    job_id = ObjectId()
+    app_id = db.applications.insert_one({'job_id': str(job_id)}).inserted_id
+    assert client.delete(f'/api/applications/{app_id}').status_code == 200
+    (inc_job, status, amount), (rollup_job, removed) = db.counter_calls
+    assert (inc_job, status, amount) == (job_id, 'pending', -1)
+    assert rollup_job == job_id and removed[0]['status'] == 'pending'
+
+
+@pytest.mark.parametrize('fields', ['_id', 'bogus!', 'resume_text,cover_letter', ' , '])
+def test_list_rejects_fields_with_nothing_valid(db, client, fields):
+    db.applications.insert_one({'job_id': ObjectId(), 'student_name': 'Ann', 'resume_text': 'long text'})
+    response = client.get('/api/applications', query_string={'fields': fields, 'limit': 10})
+    assert response.status_code == 400
+
+
+def test_list_projects_requested_fields(db, client):
+    db.applications.insert_one({'job_id': ObjectId(), 'student_name': 'Ann', 'overall_score': 50,
+                                'resume_text': 'long text'})
+    response = client.get('/api/applications', query_string={'fields': 'student_name,bogus!', 'limit': 10,
+                                                             'include_total': 0})
+    assert response.status_code == 200
+    assert [set(app) for app in response.get_json()['applications']] == [{'id', 'student_name', 'overall_score'}]
+
+
+def test_busy_extraction_flags_the_application_for_retry(monkeypatch, tmp_path):
+    def busy(*args, **kwargs):
+        raise ExtractionBusy('no worker became free')
+
+    scheduled = []
+    monkeypatch.setattr(routes, 'extract_resume_bytes', busy)
+    monkeypatch.setattr(routes, 'schedule_extraction_retry', lambda: scheduled.append(True))
+    (tmp_path / 'resumes').mkdir()
+    job = {'id': str(ObjectId()), 'title': 'Developer', 'requirements': ['Python']}
+    data = {'student_name': 'Jane Doe', 'email': 'Jane@Example.com'}
+    resume = FileStorage(io.BytesIO(b'%PDF-1.4'), filename='jane.pdf')
+
+    application = routes.build_application(job, data, resume, str(tmp_path))
+    assert application['extraction_pending'] is True
+    assert application['resume_text'] == ''
+    assert scheduled == [True]
+
+
+def test_duplicate_check_ignores_email_case(db):
+    job_id = ObjectId()
+    db.applications.insert_one({'job_id': job_id, 'email': 'jane@example.com'})
+    query = routes.duplicate_query(str(job_id), {'email': '  Jane@Example.COM '})
+    assert db.applications.find_one(query) is not None
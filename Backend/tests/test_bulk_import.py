@@ -0,0 +1,69 @@
+import io
+import zipfile
+
+import mongomock
+import pytest
+
+import utils.bulk_import as bulk_import
+from utils.bulk_import import EntryError, iter_zip_entries, import_resumes
+
+
+def _zip(files):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as archive:
+        for name, data in files.items():
+            archive.writestr(name, data)
+    return buffer.getvalue()
+
+
+def _corrupt(data, marker):
+    """Flip a byte inside the compressed data that follows marker's local header"""
+    data = bytearray(data)
+    index = data.index(marker.encode()) + len(marker) + 2
+    data[index] ^= 0xFF
+    return io.BytesIO(bytes(data))
+
+
+def test_entries_over_the_limit_are_skipped():
+    archive = io.BytesIO(_zip({'small.pdf': b'x' * 10, 'big.pdf': b'0' * 5000}))
+    entries = dict(iter_zip_entries(archive, max_size=100))
+    assert entries['small.pdf'] == b'x' * 10
+    assert isinstance(entries['big.pdf'], EntryError) and entries['big.pdf'].status == 'skipped'
+
+
+def test_reads_stop_at_the_limit():
+    assert bulk_import._read_limited(io.BytesIO(b'0' * 5000), 100) is None
+    assert bulk_import._read_limited(io.BytesIO(b'0' * 100), 100) == b'0' * 100
+
+
+def test_corrupt_entry_fails_alone():
+    archive = _corrupt(_zip({'bad.pdf': b'resume text ' * 50, 'good.pdf': b'ok'}), 'bad.pdf')
+    entries = dict(iter_zip_entries(archive, max_size=10000))
+    assert isinstance(entries['bad.pdf'], EntryError) and entries['bad.pdf'].status == 'failed'
+    assert entries['good.pdf'] == b'ok'
+
+
+def test_import_flushes_pending_entries_when_reading_stops(monkeypatch, tmp_path):
+    inserted = []
+
+    def insert_applications(applications):
+        for application in applications:
+            application['_id'] = len(inserted)
+            inserted.append(application)
+        return {}
+
+    monkeypatch.setattr(bulk_import, 'applications_collection', mongomock.MongoClient().db.applications)
+    monkeypatch.setattr(bulk_import, 'insert_applications', insert_applications)
+    monkeypatch.setattr(bulk_import, 'increment_applicants', lambda *args: None)
+    monkeypatch.setattr(bulk_import, 'record_applications_added', lambda *args: None)
+    monkeypatch.setattr(bulk_import, '_process_entry', lambda filename, *args: (
+        {'email': f'{filename}@example.com', 'resume_file': filename}, None))
+
+    def entries():
+        yield 'a.pdf', b'a'
+        yield 'b.pdf', b'b'
+        raise zipfile.BadZipFile('truncated archive')
+
+    with pytest.raises(zipfile.BadZipFile):
+        import_resumes({'id': 'job'}, entries(), upload_folder=str(tmp_path))
+    assert [app['email'] for app in inserted] == ['a.pdf@example.com', 'b.pdf@example.com']
@@ -0,0 +1,43 @@
+import csv
+import io
+from datetime import datetime
+
+import pytest
+from bson import ObjectId
+
+from utils.export import _csv_value, export_rows
+
+
+@pytest.mark.parametrize('value', ['=SUM(A1:A2)', '+1', '-1+2', '@cmd', '\t=1', '\r=1'])
+def test_formula_prefixes_are_escaped(value):
+    assert _csv_value(value) == "'" + value
+
+
+def test_lists_are_joined_then_escaped():
+    assert _csv_value(['Python', 'SQL']) == 'Python; SQL'
+    assert _csv_value(['=cmd', 'SQL']) == "'=cmd; SQL"
+
+
+@pytest.mark.parametrize('value,expected', [
+    (None, ''),
+    ('Jane Doe', 'Jane Doe'),
+    ('jane@example.com', 'jane@example.com'),
+    (82.5, 82.5),
+    (-3, -3),
+    (datetime(2024, 5, 1, 9, 30), '2024-05-01T09:30:00'),
+    (ObjectId('0123456789abcdef01234567'), '0123456789abcdef01234567')
+])
+def test_other_values(value, expected):
+    assert _csv_value(value) == expected
+
+
+def test_csv_export_round_trips():
+    rows = [
+        {'_id': ObjectId(), 'student_name': '=HYPERLINK("x")', 'skills': ['Python'], 'overall_score': 70},
+        {'_id': ObjectId(), 'student_name': 'Ann, "A"', 'skills': [], 'overall_score': None}
+    ]
+    body = b''.join(export_rows(iter(rows), ['student_name', 'skills', 'overall_score'], chunk_bytes=1))
+    parsed = list(csv.reader(io.StringIO(body.decode('utf-8'))))
+    assert parsed[0] == ['id', 'student_name', 'skills', 'overall_score']
+    assert parsed[1] == [str(rows[0]['_id']), '\'=HYPERLINK("x")', 'Python', '70']
+    assert parsed[2] == [str(rows[1]['_id']), 'Ann, "A"', '', '']
@@ -0,0 +1,76 @@
+import mongomock
+import pytest
+from bson import ObjectId
+from pymongo.errors import BulkWriteError, DuplicateKeyError
+
+import utils.job_refs as job_refs
+from utils.job_refs import job_ref, job_id_filter, _migrate_collection
+
+JOB_ID = ObjectId('0123456789abcdef01234567')
+
+
+class BulkCollection:
+    """mongomock collection whose bulk_write applies UpdateOne ops one at a time"""
+
+    def __init__(self, collection):
+        self.collection = collection
+
+    def __getattr__(self, name):
+        return getattr(self.collection, name)
+
+    def bulk_write(self, ops, ordered=True):
+        modified = 0
+        errors = []
+        for index, op in enumerate(ops):
+            try:
+                modified += self.collection.update_one(op._filter, op._doc).modified_count
+            except DuplicateKeyError as e:
+                errors.append({'index': index, 'code': 11000, 'errmsg': str(e)})
+        if errors:
+            raise BulkWriteError({'nModified': modified, 'writeErrors': errors})
+        return type('Result', (), {'modified_count': modified})()
+
+
+@pytest.fixture
+def applications():
+    collection = mongomock.MongoClient().db.applications
+    collection.create_index([('job_id', 1), ('email', 1)], unique=True)
+    return BulkCollection(collection)
+
+
+def test_job_ref_converts_valid_ids_only():
+    assert job_ref(str(JOB_ID)) == JOB_ID
+    assert job_ref(JOB_ID) is JOB_ID
+    assert job_ref('legacy-id') == 'legacy-id'
+
+
+def test_job_id_filter_matches_both_forms(monkeypatch):
+    monkeypatch.setattr(job_refs, 'JOB_ID_LEGACY_READS', True)
+    assert job_id_filter(str(JOB_ID)) == {'$in': [JOB_ID, str(JOB_ID)]}
+    assert job_id_filter('legacy-id') == 'legacy-id'
+
+
+def test_job_id_filter_without_legacy_reads(monkeypatch):
+    monkeypatch.setattr(job_refs, 'JOB_ID_LEGACY_READS', False)
+    assert job_id_filter(str(JOB_ID)) == JOB_ID
+
+
+def test_migrate_converts_string_ids_in_batches(applications):
+    applications.insert_many([{'job_id': str(JOB_ID), 'email': f'{i}@example.com'} for i in range(7)])
+    applications.insert_one({'job_id': JOB_ID, 'email': 'done@example.com'})
+
+    assert _migrate_collection(applications, batch_size=3) == (7, 0)
+    assert applications.count_documents({'job_id': JOB_ID}) == 8
+    assert _migrate_collection(applications, batch_size=3) == (0, 0)
+
+
+def test_migrate_counts_invalid_and_duplicate_refs_as_failed(applications):
+    applications.insert_many([
+        {'job_id': str(JOB_ID), 'email': 'a@example.com'},
+        {'job_id': JOB_ID, 'email': 'b@example.com'},
+        {'job_id': str(JOB_ID), 'email': 'b@example.com'},
+        {'job_id': 'not-an-id', 'email': 'c@example.com'}
+    ])
+
+    assert _migrate_collection(applications, batch_size=10) == (1, 2)
+    assert applications.count_documents({'job_id': {'$type': 'string'}}) == 2
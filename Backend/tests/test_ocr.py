@@ -0,0 +1,48 @@
+import random
+
+import pytest
+
+from utils.ocr import is_garbage_text
+
+
+def _is_garbage_text_reference(text):
+    """The original quadratic filter, kept to check the linear one against"""
+    if len(text) > 20:
+        for i in range(len(text) - 4):
+            pattern = text[i:i+4]
+            if text.count(pattern) > 3:
+                return True
+    num_count = sum(c.isdigit() for c in text)
+    if len(text) > 10 and num_count / len(text) > 0.6:
+        return True
+    if text.count('0') > 10:
+        return True
+    return False
+
+
+@pytest.mark.parametrize('text', [
+    'Experience........2019',
+    'Education...........2015 - 2019',
+    'Skills ---- Python ---- SQL',
+    '------------------------',
+    '----------------',
+    'aaaaaaaaaaaaaaaaaaaaaaaaa',
+    'abababababababababababab',
+    'Python Python Python Python developer',
+    'Senior Software Engineer at Example Corp',
+    'the the the the the the',
+    '12345678901234567890 phone',
+])
+def test_matches_the_original_filter(text):
+    assert is_garbage_text(text) == _is_garbage_text_reference(text)
+
+
+def test_dot_leaders_are_kept():
+    assert not is_garbage_text('Experience........2019')
+
+
+def test_matches_the_original_filter_on_random_text():
+    rng = random.Random(35)
+    for _ in range(2000):
+        text = ''.join(rng.choice('ab.-0 ') for _ in range(rng.randint(0, 40)))
+        assert is_garbage_text(text) == _is_garbage_text_reference(text), text
@@ -0,0 +1,70 @@
+import mongomock
+import pytest
+from bson import ObjectId
+
+import utils.application_store as application_store
+import utils.ocr_queue as ocr_queue
+import utils.text_extraction as text_extraction
+from utils.extraction_pool import ExtractionBusy
+
+RESUME = 'Jane Doe\nExperience\nPython developer for 5 years building Flask and MongoDB services\n'
+
+
+@pytest.fixture
+def db(monkeypatch):
+    db = mongomock.MongoClient().db
+    for module in (ocr_queue, application_store):
+        monkeypatch.setattr(module, 'applications_collection', db.applications)
+    monkeypatch.setattr(application_store, 'application_texts_collection', db.application_texts)
+    monkeypatch.setattr(ocr_queue, 'extraction_cache_collection', db.extraction_cache)
+    job = {'id': str(ObjectId()), 'title': 'Developer', 'description': 'Python developer',
+           'requirements': ['Python', 'MongoDB'], 'department': 'Engineering'}
+    monkeypatch.setattr(ocr_queue, 'get_cached_job', lambda job_id: job)
+    db.score_changes = []
+    monkeypatch.setattr(ocr_queue, 'record_score_changes', lambda job, changes: db.score_changes.extend(changes))
+    return db
+
+
+def _pending_application(db, **fields):
+    return db.applications.insert_one({
+        'job_id': ObjectId(), 'resume_file': 'jane.pdf', 'skills': [], 'status': 'pending',
+        'overall_score': 10, 'extraction_pending': True, **fields
+    }).inserted_id
+
+
+def test_retry_rescores_once_text_is_extracted(db, monkeypatch):
+    monkeypatch.setattr(text_extraction, 'extract_resume_text', lambda path, raise_errors: (RESUME, []))
+    app_id = _pending_application(db)
+
+    assert ocr_queue.retry_pending_extractions('/uploads') == 1
+    application = db.applications.find_one({'_id': app_id})
+    assert application['extraction_pending'] is False
+    assert 'extraction_attempts' not in application and 'extraction_claimed_at' not in application
+    assert application['overall_score'] != 10
+    assert db.application_texts.find_one({'_id': app_id})['resume_text'] == RESUME
+    assert db.score_changes == [(10, application['overall_score'])]
+
+
+def test_failed_retry_stays_pending_until_the_limit(db, monkeypatch):
+    def busy(path, raise_errors):
+        raise ExtractionBusy('no worker became free')
+
+    monkeypatch.setattr(text_extraction, 'extract_resume_text', busy)
+    monkeypatch.setattr(ocr_queue, 'EXTRACTION_RETRY_LIMIT', 2)
+    app_id = _pending_application(db)
+
+    assert ocr_queue.retry_pending_extractions('/uploads') == 0
+    application = db.applications.find_one({'_id': app_id})
+    assert application['extraction_pending'] is True and application['extraction_attempts'] == 1
+    assert 'extraction_claimed_at' not in application
+
+    assert ocr_queue.retry_pending_extractions('/uploads') == 1
+    application = db.applications.find_one({'_id': app_id})
+    assert application['extraction_pending'] is False and application['overall_score'] == 10
+    assert db.score_changes == []
+
+
+def test_claimed_retry_is_left_to_its_owner(db):
+    app_id = _pending_application(db)
+    assert ocr_queue._claim_extraction(app_id) is not None
+    assert ocr_queue._claim_extraction(app_id) is None
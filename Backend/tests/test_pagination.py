@@ -0,0 +1,120 @@
+from datetime import datetime, timedelta
+
+import mongomock
+import pytest
+
+from utils.pagination import (
+    paginate, paginate_with_counts, facet_pipeline, encode_cursor, decode_cursor, keyset_filter, InvalidCursor
+)
+
+
+@pytest.fixture
+def applications():
+    collection = mongomock.MongoClient().db.applications
+    start = datetime(2024, 1, 1)
+    collection.insert_many([
+        {
+            'student_name': f'Student {i:02d}',
+            'email': f's{i}@example.com',
+            'overall_score': None if i % 5 == 0 else 50 + i % 7,
+            'submitted_at': start + timedelta(hours=i),
+            'status': 'reviewed' if i % 3 == 0 else 'pending'
+        }
+        for i in range(23)
+    ])
+    return collection
+
+
+def _all_pages(collection, sort_field, sort_order, limit, projection=None):
+    pages = []
+    cursor = None
+    while True:
+        docs, cursor = paginate(collection, {}, sort_field, sort_order, limit, cursor, projection)
+        pages.append(docs)
+        if cursor is None:
+            return pages
+
+
+@pytest.mark.parametrize('sort_field,sort_order', [
+    ('overall_score', -1),
+    ('overall_score', 1),
+    ('submitted_at', -1),
+    ('student_name', 1)
+])
+def test_pages_cover_every_row_once(applications, sort_field, sort_order):
+    pages = _all_pages(applications, sort_field, sort_order, 5)
+    ids = [doc['_id'] for page in pages for doc in page]
+    assert len(pages) == 5
+    assert len(ids) == len(set(ids)) == 23
+
+
+def test_pages_with_fields_that_omit_the_sort_field(applications):
+    projection = {'student_name': 1, 'email': 1}
+    pages = _all_pages(applications, 'overall_score', -1, 4, projection)
+    ids = [doc['_id'] for page in pages for doc in page]
+    expected = [doc['_id'] for doc in applications.find().sort([('overall_score', -1), ('_id', -1)])]
+    assert len(pages) == 6
+    assert ids == expected
+
+
+def test_facet_pages_and_counts_with_projection(applications):
+    projection = {'student_name': 1}
+    expected = [doc['_id'] for doc in applications.find().sort([('overall_score', -1), ('_id', -1)])]
+    ids = []
+    cursor = None
+    while True:
+        docs, cursor, counts = paginate_with_counts(applications, {}, 'overall_score', -1, 10, cursor, projection)
+        assert counts == {'pending': 15, 'reviewed': 8}
+        assert all(set(doc) == {'_id', 'student_name', 'overall_score'} for doc in docs)
+        ids += [doc['_id'] for doc in docs]
+        if cursor is None:
+            break
+    assert ids == expected
+
+
+def test_facet_stream_is_projected_before_facet():
+    pipeline = facet_pipeline('applications', {}, 'overall_score', -1, 10, projection={'email': 1})
+    assert pipeline[2] == {'$project': {'overall_score': 1, 'status': 1}}
+    assert pipeline[3]['$facet']['page'][-1] == {'$project': {'email': 1, 'overall_score': 1}}
+
+
+def test_cursor_round_trip():
+    doc = {'_id': 'abc', 'overall_score': 81.5}
+    assert decode_cursor(encode_cursor('overall_score', doc), 'overall_score') == (81.5, 'abc')
+
+
+def test_cursor_for_another_sort_is_rejected():
+    cursor = encode_cursor('overall_score', {'_id': 'abc', 'overall_score': 1})
+    with pytest.raises(InvalidCursor):
+        decode_cursor(cursor, 'submitted_at')
+
+
+def test_malformed_cursor_is_rejected():
+    with pytest.raises(InvalidCursor):
+        decode_cursor('not-a-cursor', 'overall_score')
+
+
+def test_keyset_filter_descending_keeps_nulls_last():
+    assert keyset_filter('overall_score', -1, 70, 'id') == {'$or': [
+        {'overall_score': {'$lt': 70}},
+        {'overall_score': 70, '_id': {'$lt': 'id'}},
+        {'overall_score': None}
+    ]}
+
+
+def test_keyset_filter_descending_after_null():
+    assert keyset_filter('overall_score', -1, None, 'id') == {'overall_score': None, '_id': {'$lt': 'id'}}
+
+
+def test_keyset_filter_ascending_after_null_includes_all_values():
+    assert keyset_filter('overall_score', 1, None, 'id') == {'$or': [
+        {'overall_score': None, '_id': {'$gt': 'id'}},
+        {'overall_score': {'$ne': None}}
+    ]}
+
+
+def test_keyset_filter_ascending():
+    assert keyset_filter('overall_score', 1, 70, 'id') == {'$or': [
+        {'overall_score': {'$gt': 70}},
+        {'overall_score': 70, '_id': {'$gt': 'id'}}
+    ]}
@@ -0,0 +1,37 @@
+import mongomock
+import pytest
+from bson import ObjectId
+
+import utils.rollups as rollups
+
+
+@pytest.fixture
+def db(monkeypatch):
+    db = mongomock.MongoClient().db
+    monkeypatch.setattr(rollups, 'analytics_rollups_collection', db.analytics_rollups)
+    monkeypatch.setattr(rollups, 'jobs_collection', db.jobs)
+    return db
+
+
+def test_department_comes_from_the_job_rollup(db):
+    job_id = ObjectId()
+    db.jobs.insert_one({'_id': job_id, 'department': 'Sales'})
+    db.analytics_rollups.insert_one({'_id': f'job:{job_id}', 'department': 'Engineering'})
+    stale = {'_id': job_id, 'department': 'Marketing'}
+    assert rollups._resolve_job(stale) == (str(job_id), 'Engineering')
+
+
+def test_department_falls_back_to_the_live_job(db):
+    job_id = ObjectId()
+    db.jobs.insert_one({'_id': job_id, 'department': 'Sales'})
+    assert rollups._resolve_job(str(job_id)) == (str(job_id), 'Sales')
+
+
+def test_malformed_job_reference_has_no_department(db):
+    assert rollups._resolve_job('legacy-ref') == ('legacy-ref', None)
+
+
+def test_application_totals_count_missing_status_as_pending():
+    inc = rollups._application_totals([{'overall_score': 70}, {'status': 'rejected'}], sign=-1)
+    assert inc == {'applications': -2, 'score_sum': -70, 'scored': -1,
+                   'status_counts.pending': -1, 'status_counts.rejected': -1}
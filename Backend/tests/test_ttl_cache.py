@@ -0,0 +1,99 @@
+import asyncio
+import threading
+import time
+
+from utils.ttl_cache import TTLCache
+
+
+def test_concurrent_misses_compute_once():
+    cache = TTLCache(ttl=60)
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def compute():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return 'value'
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get_or_compute('k', compute)))
+               for _ in range(8)]
+    threads[0].start()
+    started.wait(5)
+    for thread in threads[1:]:
+        thread.start()
+    deadline = time.monotonic() + 5
+    while cache.metrics()['coalesced'] < 7 and time.monotonic() < deadline:
+        time.sleep(0.001)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert calls == [1]
+    assert results == ['value'] * 8
+    assert cache.get('k') == 'value'
+
+
+def test_errors_reach_every_waiter_and_are_not_cached():
+    cache = TTLCache(ttl=60)
+
+    def fail():
+        raise ValueError('boom')
+
+    for _ in range(2):
+        try:
+            cache.get_or_compute('k', fail)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError('expected ValueError')
+    assert cache.get('k', 'missing') == 'missing'
+
+
+def test_invalidation_mid_computation_is_not_stored():
+    cache = TTLCache(ttl=60)
+
+    def compute():
+        cache.invalidate('k')
+        return 'stale'
+
+    assert cache.get_or_compute('k', compute) == 'stale'
+    assert cache.get('k', 'missing') == 'missing'
+    assert cache.get_or_compute('k', lambda: 'fresh') == 'fresh'
+    assert cache.get('k') == 'fresh'
+
+
+def test_invalidate_and_clear_drop_entries():
+    cache = TTLCache(ttl=60)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    cache.invalidate('a')
+    assert cache.get('a') is None and cache.get('b') == 2
+    cache.clear()
+    assert cache.get('b') is None
+
+
+def test_none_is_not_stored_without_cache_none():
+    cache = TTLCache(ttl=60, cache_none=False)
+    assert cache.get_or_compute('k', lambda: None) is None
+    assert cache.get_or_compute('k', lambda: 'later') == 'later'
+
+
+def test_async_invalidation_mid_computation_is_not_stored():
+    cache = TTLCache(ttl=60)
+
+    async def compute():
+        await asyncio.sleep(0)
+        cache.invalidate('k')
+        return 'stale'
+
+    async def fresh():
+        return 'fresh'
+
+    assert asyncio.run(cache.get_or_compute_async('k', compute)) == 'stale'
+    assert cache.get('k', 'missing') == 'missing'
+    assert asyncio.run(cache.get_or_compute_async('k', fresh)) == 'fresh'
+    assert asyncio.run(cache.get_or_compute_async('k', compute)) == 'fresh'
+    assert cache._awaiting == {}
@@ -7,9 +7,18 @@ from .helpers import (
 from .text_extraction import (
     extract_text_from_pdf,
     extract_text_from_docx,
+    extract_resume_text,
+    extract_resume_bytes,
+    save_upload,
     PDF_SUPPORT,
     DOCX_SUPPORT
 )
+from .sections import segment_sections, get_section_text
+from .extraction_pool import get_extraction_metrics
+from .ocr import OCR_SUPPORT, get_ocr_metrics
+from .ttl_cache import TTLCache
+from .cache import get_cache_metrics
+from .json_encoding import FastJSONProvider, stream_json, ORJSON_SUPPORT
 from .scoring import (
     extract_skills_from_text,
     score_resume,
@@ -23,8 +32,21 @@ __all__ = [
     'get_authenticated_user',
     'extract_text_from_pdf',
     'extract_text_from_docx',
+    'extract_resume_text',
+    'extract_resume_bytes',
+    'save_upload',
     'PDF_SUPPORT',
     'DOCX_SUPPORT',
+    'get_extraction_metrics',
+    'OCR_SUPPORT',
+    'get_ocr_metrics',
+    'TTLCache',
+    'get_cache_metrics',
+    'FastJSONProvider',
+    'stream_json',
+    'ORJSON_SUPPORT',
+    'segment_sections',
+    'get_section_text',
     'extract_skills_from_text',
     'score_resume',
     'get_ats_breakdown'
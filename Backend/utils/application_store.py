@@ -0,0 +1,166 @@
+"""
+Application storage split into a lean summary document and a companion
+text document.
+
+Bulky fields (resume text, section offsets, cover letter, AI analysis) live
+in the application_texts collection keyed by the application _id, so list
+queries never read or ship them. Detail, breakdown and rescore paths load
+them with load_text_fields(). Documents written before the split still
+carry the fields inline; reads merge both so either layout works.
+"""
+
+import re
+
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
+
+from config.database import applications_collection, application_texts_collection
+from utils.job_refs import job_id_filter
+
+
+# Fields stored in the companion application_texts collection
+TEXT_FIELDS = ['resume_text', 'resume_sections', 'cover_letter', 'ai_analysis']
+
+# Fields returned by list endpoints unless ?fields= asks for others
+SUMMARY_FIELDS = [
+    'job_id', 'student_name', 'email', 'phone', 'college', 'degree', 'graduation_year',
+    'experience', 'skills', 'resume_file', 'submitted_at', 'status',
+    'overall_score', 'keyword_match_score', 'skill_match_score', 'experience_score',
+    'education_score', 'formatting_score', 'action_verbs_score', 'quantifiable_score',
+    'matched_keywords', 'missing_keywords', 'matched_skills', 'missing_skills',
+    'years_of_experience', 'years_required'
+]
+
+# Projection that keeps everything except the bulky text fields
+EXCLUDE_TEXT_PROJECTION = {field: 0 for field in TEXT_FIELDS}
+
+_FIELD_NAME = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*$')
+
+
+def summary_projection(fields_param=None):
+    """
+    Build a list projection from an optional comma-separated ?fields= value.
+    Bulky text fields are never included in list responses.
+    """
+    fields = SUMMARY_FIELDS
+    if fields_param:
+        requested = [f.strip() for f in fields_param.split(',')]
+        fields = [f for f in requested if _FIELD_NAME.match(f) and f not in TEXT_FIELDS and f != '_id']
+    return {field: 1 for field in fields}
+
+
+def split_text_fields(doc):
+    """Split a document (or $set payload) into (main_fields, text_fields)"""
+    main = {k: v for k, v in doc.items() if k not in TEXT_FIELDS}
+    text = {k: v for k, v in doc.items() if k in TEXT_FIELDS}
+    return main, text
+
+
+def insert_application(application):
+    """Insert an application and its companion text document; returns the new _id"""
+    main, text = split_text_fields(application)
+    result = applications_collection.insert_one(main)
+    application['_id'] = result.inserted_id
+    application_texts_collection.insert_one({'_id': result.inserted_id, 'job_id': main.get('job_id'), **text})
+    return result.inserted_id
+
+
+def insert_applications(applications):
+    """
+    insert_many counterpart of insert_application (unordered).
+    Companion text documents are written only for applications that were
+    inserted. Returns {index: write_error} for the ones that were not.
+    """
+    split = [split_text_fields(app) for app in applications]
+    write_errors = {}
+    try:
+        applications_collection.insert_many([main for main, _ in split], ordered=False)
+    except BulkWriteError as e:
+        write_errors = {err['index']: err for err in e.details.get('writeErrors', [])}
+    
+    # insert_many assigns _id on each document in place
+    texts = []
+    for index, (app, (main, text)) in enumerate(zip(applications, split)):
+        if index in write_errors:
+            continue
+        app['_id'] = main['_id']
+        texts.append({'_id': main['_id'], 'job_id': main.get('job_id'), **text})
+    if texts:
+        application_texts_collection.insert_many(texts, ordered=False)
+    return write_errors
+
+
+def update_application(app_id, update_data):
+    """$set fields on an application, routing text fields to the companion document"""
+    main, text = split_text_fields(update_data)
+    if main:
+        applications_collection.update_one({'_id': app_id}, {'$set': main})
+    if text:
+        application_texts_collection.update_one({'_id': app_id}, {'$set': text}, upsert=True)
+        # Drop inline copies left over from before the split
+        applications_collection.update_one({'_id': app_id}, {'$unset': {f: '' for f in text}})
+
+
+def load_text_fields(application):
+    """Merge the companion text fields into an application document (in place)"""
+    if application is None:
+        return None
+    text = application_texts_collection.find_one({'_id': application['_id']}, {'job_id': 0})
+    return merge_text_fields(application, text)
+
+
+def merge_text_fields(application, text):
+    """Merge an already loaded companion text document (or None) into application"""
+    if text:
+        text.pop('_id', None)
+        application.update({k: v for k, v in text.items() if v is not None})
+    return application
+
+
+def load_text_fields_many(applications):
+    """Batch version of load_text_fields using a single $in query"""
+    if not applications:
+        return applications
+    texts = {
+        doc.pop('_id'): doc
+        for doc in application_texts_collection.find(
+            {'_id': {'$in': [app['_id'] for app in applications]}}, {'job_id': 0})
+    }
+    for app in applications:
+        app.update({k: v for k, v in texts.get(app['_id'], {}).items() if v is not None})
+    return applications
+
+
+def delete_application_texts(app_id=None, job_id=None):
+    """Delete companion text documents for one application or a whole job"""
+    if app_id is not None:
+        application_texts_collection.delete_one({'_id': app_id})
+    if job_id is not None:
+        application_texts_collection.delete_many({'job_id': job_id_filter(job_id)})
+
+
+def migrate_application_texts(batch_size=500):
+    """Move inline text fields of legacy applications into the companion collection"""
+    legacy_query = {'$or': [{field: {'$exists': True}} for field in TEXT_FIELDS]}
+    projection = {'job_id': 1, **{field: 1 for field in TEXT_FIELDS}}
+    moved = 0
+    
+    while True:
+        batch = list(applications_collection.find(legacy_query, projection).limit(batch_size))
+        if not batch:
+            break
+        text_ops = []
+        for doc in batch:
+            text = {field: doc[field] for field in TEXT_FIELDS if field in doc}
+            text_ops.append(UpdateOne(
+                {'_id': doc['_id']},
+                {'$set': {'job_id': doc.get('job_id'), **text}},
+                upsert=True
+            ))
+        application_texts_collection.bulk_write(text_ops, ordered=False)
+        applications_collection.update_many(
+            {'_id': {'$in': [doc['_id'] for doc in batch]}},
+            {'$unset': {field: '' for field in TEXT_FIELDS}}
+        )
+        moved += len(batch)
+    return moved
@@ -0,0 +1,304 @@
+"""
+Bulk resume import from a ZIP archive or a directory.
+
+Entries are streamed one at a time (the archive is never unpacked into
+memory as a whole, and no entry is read past the per-file upload limit),
+extracted and scored in parallel through the isolated
+worker pool, de-duplicated against existing applications in bulk and
+inserted with insert_many in batches.
+"""
+
+import csv
+import hashlib
+import io
+import os
+import random
+import re
+import uuid
+import zipfile
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from werkzeug.utils import secure_filename
+
+from config.database import applications_collection
+from utils.application_store import insert_applications
+from utils.job_counters import increment_applicants
+from utils.job_refs import job_ref, job_id_filter
+from utils.rollups import record_applications_added
+from config.settings import Config, BULK_IMPORT_BATCH_SIZE, BULK_IMPORT_CONCURRENCY
+from utils.helpers import allowed_file
+from utils.text_extraction import extract_resume_bytes
+from utils.ocr import awaits_ocr
+from utils.ocr_queue import schedule_extraction_retry
+from utils.extraction_pool import run_isolated, ExtractionError
+from utils.scoring import extract_skills_from_text, score_resume
+
+
+EMAIL_PATTERN = re.compile(r'[\w\.\+-]+@[\w-]+\.[\w\.-]+')
+
+ROSTER_COLUMNS = {
+    'file': ['file', 'filename', 'file_name', 'resume', 'resume_file'],
+    'student_name': ['student_name', 'name', 'full_name', 'fullname'],
+    'email': ['email', 'email_address'],
+    'phone': ['phone', 'mobile', 'phone_number'],
+    'college': ['college', 'university', 'institution'],
+    'degree': ['degree'],
+    'graduation_year': ['graduation_year', 'graduationyear', 'year'],
+}
+
+
+class EntryError(Exception):
+    """Yielded in place of an entry's bytes when the entry cannot be imported"""
+
+    def __init__(self, message, status='failed'):
+        super().__init__(message)
+        self.status = status
+
+
+def _too_large(max_size):
+    return EntryError(f'File exceeds the {max_size // (1024 * 1024)}MB upload limit', 'skipped')
+
+
+def _read_limited(stream, max_size):
+    """Read at most max_size bytes; None if the stream holds more"""
+    data = stream.read(max_size + 1)
+    return None if len(data) > max_size else data
+
+
+def iter_zip_entries(source, max_size=Config.MAX_CONTENT_LENGTH):
+    """
+    Yield (filename, bytes) for each resume in a ZIP archive, one at a time.
+    Entries over max_size or that fail to decompress yield an EntryError
+    instead of bytes; an archive that cannot be opened raises BadZipFile.
+    """
+    with zipfile.ZipFile(source) as archive:
+        for info in archive.infolist():
+            name = os.path.basename(info.filename)
+            if info.is_dir() or not name or info.filename.startswith('__MACOSX/'):
+                continue
+            if info.file_size > max_size:
+                yield name, _too_large(max_size)
+                continue
+            try:
+                # Bounded even if the header understates the size
+                with archive.open(info) as member:
+                    data = _read_limited(member, max_size)
+            except (zipfile.BadZipFile, zlib.error, EOFError) as e:
+                yield name, EntryError(f'Unreadable archive entry: {e}')
+                continue
+            yield name, data if data is not None else _too_large(max_size)
+
+
+def iter_directory_entries(path, max_size=Config.MAX_CONTENT_LENGTH):
+    """Yield (filename, bytes) for each file under a directory; oversized files yield an EntryError"""
+    for root, _, files in os.walk(path):
+        for name in sorted(files):
+            with open(os.path.join(root, name), 'rb') as file:
+                data = _read_limited(file, max_size)
+            yield name, data if data is not None else _too_large(max_size)
+
+
+def load_roster(stream):
+    """
+    Read a CSV roster mapping resume filenames to candidate details.
+    Returns {lowercased filename: {field: value}}.
+    """
+    text = stream.read()
+    if isinstance(text, bytes):
+        text = text.decode('utf-8-sig')
+    reader = csv.DictReader(io.StringIO(text))
+    
+    roster = {}
+    for row in reader:
+        normalized = {(k or '').strip().lower().replace(' ', '_'): (v or '').strip() for k, v in row.items()}
+        record = {}
+        for field, aliases in ROSTER_COLUMNS.items():
+            for alias in aliases:
+                if normalized.get(alias):
+                    record[field] = normalized[alias]
+                    break
+        if record.get('file'):
+            roster[os.path.basename(record['file']).lower()] = record
+    return roster
+
+
+def _name_from_filename(filename):
+    """Best-effort candidate name from a resume filename"""
+    stem = filename.rsplit('.', 1)[0]
+    stem = re.sub(r'(?i)\b(resume|cv)\b', ' ', stem)
+    return re.sub(r'[\s_\-]+', ' ', stem).strip().title()
+
+
+def _remove_resume(upload_folder, stored_filename):
+    """Delete the saved resume of an entry that was not imported"""
+    path = os.path.join(upload_folder, 'resumes', stored_filename)
+    if os.path.exists(path):
+        os.remove(path)
+
+
+def _score_entry(application, job, resume_text, resume_sections):
+    """Worker-side scoring; kept module-level so it can run in the pool"""
+    return score_resume(application, job, resume_text, resume_sections)
+
+
+def _process_entry(filename, data, job, job_id, roster, upload_folder):
+    """Save, extract and score one archive entry. Returns (application, error)"""
+    record = roster.get(filename.lower(), {})
+    student_name = record.get('student_name') or _name_from_filename(filename)
+    
+    resume_sha256 = hashlib.sha256(data).hexdigest()
+    file_ext = filename.rsplit('.', 1)[1].lower()
+    try:
+        resume_text, resume_sections = extract_resume_bytes(data, file_ext, resume_sha256, raise_errors=True)
+        extraction_pending = False
+    except ExtractionError:
+        # Busy or timed-out pool: import now, re-extract and rescore in the background
+        resume_text, resume_sections = "", []
+        extraction_pending = True
+    
+    email = record.get('email', '')
+    if not email:
+        match = EMAIL_PATTERN.search(resume_text)
+        email = match.group(0) if match else ''
+    if '@' not in email:
+        if extraction_pending:
+            return None, 'Text extraction unavailable (worker pool busy); add the email to the roster or retry'
+        return None, 'No email in roster or resume'
+    
+    original_filename = secure_filename(filename)
+    stored_filename = f"{student_name.replace(' ', '_')}_{job_id}_{uuid.uuid4().hex[:8]}_{original_filename}"
+    with open(os.path.join(upload_folder, 'resumes', stored_filename), 'wb') as out:
+        out.write(data)
+    
+    skills = extract_skills_from_text(resume_text) if resume_text else []
+    if not skills:
+        skills = random.sample(job.get('requirements', []), min(3, len(job.get('requirements', []))))
+    
+    application = {
+        'job_id': job_ref(job_id),
+        'student_name': student_name.strip(),
+        'email': email.lower().strip(),
+        'phone': record.get('phone', '').strip(),
+        'college': record.get('college', '').strip(),
+        'degree': record.get('degree', '').strip(),
+        'graduation_year': record.get('graduation_year', '').strip(),
+        'experience': '',
+        'cover_letter': '',
+        'skills': skills,
+        'resume_file': stored_filename,
+        'resume_sha256': resume_sha256,
+        'resume_text': resume_text,
+        'resume_sections': resume_sections,
+        'submitted_at': datetime.now(),
+        'status': 'pending'
+    }
+    if extraction_pending:
+        application['extraction_pending'] = True
+        schedule_extraction_retry()
+    elif awaits_ocr(resume_text, file_ext):
+        application['ocr_pending'] = True
+    
+    try:
+        scores = run_isolated(_score_entry, application, job, resume_text, resume_sections)
+    except ExtractionError as e:
+        # Scoring inline would tie up this thread on the input that just hung a worker
+        _remove_resume(upload_folder, stored_filename)
+        return None, f'Scoring failed: {e}'
+    application.update(scores)
+    return application, None
+
+
+def import_resumes(job, entries, roster=None, upload_folder='uploads'):
+    """
+    Import resumes for a job from an iterable of (filename, bytes).
+    job is the serialized job document. Returns a summary with per-file outcomes.
+    """
+    job_id = job['id']
+    roster = roster or {}
+    
+    # Existing duplicate rule: one application per email per job (case-insensitive)
+    seen_emails = {e.lower() for e in applications_collection.distinct('email', {'job_id': job_id_filter(job_id)}) if e}
+    
+    results = []
+    pending = []
+    
+    def flush():
+        if not pending:
+            return
+        write_errors = insert_applications([app for _, app in pending])
+        
+        for index, (result, application) in enumerate(pending):
+            err = write_errors.get(index)
+            if err is None:
+                result['status'] = 'imported'
+                result['application_id'] = str(application['_id'])
+            elif err.get('code') == 11000:
+                result.update({'status': 'duplicate', 'message': f"{application['email']} already applied"})
+                _remove_resume(upload_folder, application['resume_file'])
+            else:
+                result.update({'status': 'failed', 'message': err.get('errmsg', 'Insert failed')})
+                _remove_resume(upload_folder, application['resume_file'])
+        increment_applicants(job_id, 'pending', len(pending) - len(write_errors))
+        record_applications_added(job, [app for index, (_, app) in enumerate(pending) if index not in write_errors])
+        pending.clear()
+    
+    def collect(filename, future):
+        result = {'file': filename}
+        results.append(result)
+        try:
+            application, error = future.result()
+        except Exception as e:
+            application, error = None, str(e)
+        
+        if error:
+            result.update({'status': 'failed', 'message': error})
+            print(f"❌ Bulk import {filename}: {error}")
+            return
+        
+        if application['email'] in seen_emails:
+            result.update({'status': 'duplicate', 'message': f"{application['email']} already applied"})
+            _remove_resume(upload_folder, application['resume_file'])
+            return
+        
+        seen_emails.add(application['email'])
+        result.update({'email': application['email'], 'score': application.get('overall_score')})
+        pending.append((result, application))
+        if len(pending) >= BULK_IMPORT_BATCH_SIZE:
+            flush()
+    
+    # Keep a bounded window of in-flight entries so memory stays flat
+    window = max(1, BULK_IMPORT_CONCURRENCY) * 2
+    in_flight = []
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, BULK_IMPORT_CONCURRENCY)) as executor:
+            for filename, data in entries:
+                if isinstance(data, EntryError):
+                    results.append({'file': filename, 'status': data.status, 'message': str(data)})
+                    continue
+                if not allowed_file(filename):
+                    results.append({'file': filename, 'status': 'skipped', 'message': 'Unsupported file type'})
+                    continue
+                
+                record = roster.get(filename.lower(), {})
+                if record.get('email', '').lower() in seen_emails:
+                    results.append({'file': filename, 'status': 'duplicate',
+                                    'message': f"{record['email'].lower()} already applied"})
+                    continue
+                
+                in_flight.append((filename, executor.submit(
+                    _process_entry, filename, data, job, job_id, roster, upload_folder)))
+                if len(in_flight) >= window:
+                    collect(*in_flight.pop(0))
+    finally:
+        # Entries already saved are inserted (or cleaned up) even if reading stops early
+        while in_flight:
+            collect(*in_flight.pop(0))
+        flush()
+    
+    summary = {'total': len(results)}
+    for status in ['imported', 'duplicate', 'skipped', 'failed']:
+        summary[status] = sum(1 for r in results if r['status'] == status)
+    summary['results'] = results
+    return summary
@@ -0,0 +1,79 @@
+"""
+Process-local TTL caches for analytics responses and job documents.
+
+Each gunicorn worker keeps its own cache, so entries are short-lived and
+writes invalidate them explicitly; the TTL bounds how long another worker
+can serve a stale value.
+"""
+
+from bson import ObjectId
+
+from config.database import jobs_collection
+from config.settings import ANALYTICS_CACHE_TTL, ANALYTICS_CACHE_SIZE, JOB_CACHE_TTL, JOB_CACHE_SIZE
+from utils.helpers import serialize_doc, session_cache
+from utils.ttl_cache import TTLCache
+
+
+# Shared cache of analytics responses
+analytics_cache = TTLCache(ANALYTICS_CACHE_SIZE, ANALYTICS_CACHE_TTL)
+
+ANALYTICS_OVERVIEW_KEY = ('overview',)
+
+
+def analytics_job_key(job_id):
+    return ('job', str(job_id))
+
+
+def invalidate_analytics(job_id=None):
+    """Drop cached analytics affected by a write to job_id (or to jobs in general)"""
+    keys = [ANALYTICS_OVERVIEW_KEY]
+    if job_id is not None:
+        keys.append(analytics_job_key(job_id))
+    analytics_cache.invalidate(*keys)
+
+
+# Serialized job documents for the apply/scoring paths
+job_cache = TTLCache(JOB_CACHE_SIZE, JOB_CACHE_TTL)
+
+# Counters change on every application, so they are not part of the cached copy
+_JOB_CACHE_PROJECTION = {'applicant_count': 0, 'status_counts': 0}
+
+
+def get_cached_job(job_id):
+    """
+    Serialized job document (without applicant counters) or None if it does
+    not exist. Raises bson.errors.InvalidId for malformed ids. The returned
+    dict is shared between requests and must not be modified.
+    """
+    oid = ObjectId(job_id)
+    return job_cache.get_or_compute(
+        str(oid), lambda: serialize_doc(jobs_collection.find_one({'_id': oid}, _JOB_CACHE_PROJECTION)))
+
+
+async def get_cached_job_async(job_id, collection):
+    """
+    get_cached_job() for the ASGI deployment, reading misses through the
+    given motor jobs collection. Shares the cache with the sync path but does
+    not coalesce concurrent misses (waiting on a flight would block the loop).
+    A read overtaken by invalidate_job() is returned but not cached.
+    """
+    oid = ObjectId(job_id)
+
+    async def load():
+        return serialize_doc(await collection.find_one({'_id': oid}, _JOB_CACHE_PROJECTION))
+
+    return await job_cache.get_or_compute_async(str(oid), load)
+
+
+def invalidate_job(job_id):
+    """Drop a job after it was updated or deleted"""
+    job_cache.invalidate(str(job_id))
+
+
+def get_cache_metrics():
+    """Metrics for all process-local caches"""
+    return {
+        'analytics': analytics_cache.metrics(),
+        'jobs': job_cache.metrics(),
+        'sessions': session_cache.metrics()
+    }
@@ -0,0 +1,108 @@
+"""
+Streaming application exports (CSV / NDJSON).
+
+export_rows() turns a batched Mongo cursor into encoded byte chunks one
+row at a time, so an export of any size runs in constant memory. The
+first row is flushed immediately and later rows every
+JSON_STREAM_CHUNK_BYTES.
+"""
+
+import csv
+import io
+from datetime import date, datetime
+
+from bson import ObjectId
+
+from config.settings import JSON_STREAM_CHUNK_BYTES
+from utils.json_encoding import dumps, public_doc
+
+
+EXPORT_FORMATS = {
+    'csv': 'text/csv',
+    'ndjson': 'application/x-ndjson'
+}
+
+# Columns exported unless ?fields= asks for others ('id' is always first)
+EXPORT_FIELDS = [
+    'student_name', 'email', 'phone', 'college', 'degree', 'graduation_year', 'experience',
+    'skills', 'status', 'overall_score', 'skill_match_score', 'experience_score',
+    'education_score', 'keyword_match_score', 'years_of_experience', 'submitted_at', 'resume_file'
+]
+
+# Leading characters spreadsheets evaluate as formulas
+_FORMULA_PREFIXES = ('=', '+', '-', '@', '\t', '\r')
+
+
+def _csv_value(value):
+    """Flatten a field value into a spreadsheet-safe CSV cell"""
+    if value is None:
+        return ''
+    if isinstance(value, (list, tuple)):
+        value = '; '.join(str(v) for v in value)
+    elif isinstance(value, (datetime, date)):
+        return value.isoformat()
+    elif isinstance(value, ObjectId):
+        return str(value)
+    elif not isinstance(value, str):
+        return value
+    if value.startswith(_FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+class _ExportWriter:
+    """Encodes rows of the given columns into byte chunks"""
+
+    def __init__(self, fields, export_format, chunk_bytes):
+        self.columns = ['id'] + [f for f in fields if f != 'id']
+        self.export_format = export_format
+        self.chunk_bytes = chunk_bytes
+        self.count = 0
+        self.text = io.StringIO()
+        self.buffer = bytearray()
+        if export_format == 'csv':
+            self.csv = csv.writer(self.text)
+            self.csv.writerow(self.columns)
+            self._drain_text()
+
+    def _drain_text(self):
+        self.buffer += self.text.getvalue().encode('utf-8')
+        self.text.seek(0)
+        self.text.truncate()
+
+    def add(self, doc):
+        """Append a row; returns a chunk when one is due"""
+        row = public_doc(doc)
+        if self.export_format == 'csv':
+            self.csv.writerow([_csv_value(row.get(column)) for column in self.columns])
+            self._drain_text()
+        else:
+            self.buffer += dumps({column: row.get(column) for column in self.columns}) + b'\n'
+        self.count += 1
+        if self.count == 1 or len(self.buffer) >= self.chunk_bytes:
+            return self.flush()
+        return None
+
+    def flush(self):
+        chunk = bytes(self.buffer)
+        self.buffer.clear()
+        return chunk
+
+
+def export_rows(rows, fields, export_format='csv', chunk_bytes=JSON_STREAM_CHUNK_BYTES):
+    """Generate the export of rows as byte chunks; closes the cursor when done"""
+    writer = _ExportWriter(fields, export_format, chunk_bytes)
+    try:
+        header = writer.flush()
+        if header:
+            yield header
+        for doc in rows:
+            chunk = writer.add(doc)
+            if chunk:
+                yield chunk
+        chunk = writer.flush()
+        if chunk:
+            yield chunk
+    finally:
+        if hasattr(rows, 'close'):
+            rows.close()
@@ -0,0 +1,227 @@
+"""
+Isolated process pools for resume text extraction.
+
+PyPDF2 can spend minutes on malformed or huge files, so parsing runs in a
+small set of persistent worker processes instead of the Flask worker. Each
+task has a timeout; a worker that overruns or crashes is killed and replaced
+without affecting other in-flight extractions. Workers are started with
+forkserver (or spawn), never forked from the threaded web process, and
+callers wait at most EXTRACTION_ACQUIRE_TIMEOUT for a free worker.
+"""
+
+import multiprocessing
+import queue
+import threading
+import time
+
+from config.settings import (
+    EXTRACTION_WORKERS,
+    EXTRACTION_TIMEOUT,
+    EXTRACTION_MAX_TASKS_PER_WORKER,
+    EXTRACTION_ACQUIRE_TIMEOUT,
+    EXTRACTION_START_METHOD
+)
+
+
+class ExtractionError(Exception):
+    """Raised when a file could not be extracted in the worker pool"""
+
+
+class ExtractionTimeout(ExtractionError):
+    """Raised when a worker exceeds the per-file timeout"""
+
+
+class ExtractionBusy(ExtractionError):
+    """Raised when no worker became free within the acquire timeout"""
+
+
+def _start_context(method=EXTRACTION_START_METHOD):
+    """multiprocessing context for workers; falls back to spawn where method is unavailable"""
+    if method not in multiprocessing.get_all_start_methods():
+        method = 'spawn'
+    return multiprocessing.get_context(method)
+
+
+def _worker_main(conn):
+    """Worker loop: receive (fn, args), send back (ok, result)"""
+    while True:
+        try:
+            fn, args = conn.recv()
+        except (EOFError, OSError):
+            break
+        try:
+            conn.send((True, fn(*args)))
+        except Exception as e:
+            conn.send((False, f"{type(e).__name__}: {e}"))
+
+
+class _Worker:
+    """A single persistent worker process connected by a pipe"""
+
+    def __init__(self, ctx):
+        self.conn, child_conn = ctx.Pipe()
+        self.process = ctx.Process(target=_worker_main, args=(child_conn,), daemon=True)
+        self.process.start()
+        child_conn.close()
+        self.tasks = 0
+
+    def run(self, fn, args, timeout):
+        self.tasks += 1
+        self.conn.send((fn, args))
+        if not self.conn.poll(timeout):
+            raise ExtractionTimeout(f"Extraction exceeded {timeout}s")
+        ok, result = self.conn.recv()
+        if not ok:
+            raise ExtractionError(result)
+        return result
+
+    def kill(self):
+        try:
+            self.conn.close()
+        except OSError:
+            pass
+        if self.process.is_alive():
+            self.process.kill()
+        self.process.join(timeout=1)
+
+
+class WorkerPool:
+    """
+    Fixed-size pool of persistent worker processes.
+    Each slot starts its worker lazily on first use. A worker that times out
+    or crashes is killed and its slot restarts a fresh one on next use;
+    workers are also recycled after max_tasks tasks (0 keeps them forever,
+    e.g. to hold a loaded model). run() waits at most acquire_timeout
+    seconds for a free slot before raising ExtractionBusy.
+    """
+
+    def __init__(self, size, timeout, max_tasks=0, acquire_timeout=EXTRACTION_ACQUIRE_TIMEOUT):
+        self.size = size
+        self.timeout = timeout
+        self.max_tasks = max_tasks
+        self.acquire_timeout = acquire_timeout
+        self._ctx = _start_context()
+        # Slots hold a live _Worker or None (start one on next use)
+        self._idle = queue.Queue()
+        self._lock = threading.Lock()
+        self._started = False
+        self._metrics_lock = threading.Lock()
+        self._metrics = {
+            'tasks': 0,
+            'succeeded': 0,
+            'failed': 0,
+            'timeouts': 0,
+            'busy': 0,
+            'worker_restarts': 0,
+            'total_ms': 0.0,
+            'max_ms': 0.0
+        }
+
+    def _record(self, outcome, started):
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        with self._metrics_lock:
+            self._metrics['tasks'] += 1
+            self._metrics[outcome] += 1
+            self._metrics['total_ms'] += elapsed_ms
+            self._metrics['max_ms'] = max(self._metrics['max_ms'], elapsed_ms)
+
+    def metrics(self):
+        """Snapshot of task timings and failure counts"""
+        with self._metrics_lock:
+            metrics = dict(self._metrics)
+        metrics['avg_ms'] = round(metrics['total_ms'] / metrics['tasks'], 2) if metrics['tasks'] else 0
+        metrics['total_ms'] = round(metrics['total_ms'], 2)
+        metrics['max_ms'] = round(metrics['max_ms'], 2)
+        metrics['workers'] = self.size
+        return metrics
+
+    def _ensure_started(self):
+        if self._started:
+            return
+        with self._lock:
+            if not self._started:
+                for _ in range(self.size):
+                    self._idle.put(None)
+                self._started = True
+
+    def _acquire(self, started):
+        """Take a slot and make sure it holds a live worker"""
+        try:
+            worker = self._idle.get(timeout=self.acquire_timeout)
+        except queue.Empty:
+            self._record('busy', started)
+            raise ExtractionBusy(f"No extraction worker free within {self.acquire_timeout}s")
+        if worker is None:
+            try:
+                worker = _Worker(self._ctx)
+            except Exception as e:
+                self._idle.put(None)
+                self._record('failed', started)
+                raise ExtractionError(f"Could not start extraction worker: {e}") from e
+        return worker
+
+    def _retire(self, worker):
+        """Kill a worker; its slot starts a replacement on next use. Never raises, so the slot is not lost."""
+        try:
+            worker.kill()
+        except Exception as e:
+            print(f"Error stopping extraction worker: {e}")
+        with self._metrics_lock:
+            self._metrics['worker_restarts'] += 1
+        return None
+
+    def run(self, fn, *args, timeout=None):
+        """
+        Run fn(*args) in a worker process and return its result.
+        fn must be a picklable module-level function. Raises ExtractionTimeout
+        or ExtractionError; the offending worker is recycled either way.
+        """
+        timeout = self.timeout if timeout is None else timeout
+        started = time.perf_counter()
+
+        if self.size <= 0:
+            try:
+                result = fn(*args)
+            except Exception as e:
+                self._record('failed', started)
+                raise ExtractionError(f"{type(e).__name__}: {e}") from e
+            self._record('succeeded', started)
+            return result
+
+        self._ensure_started()
+        worker = self._acquire(started)
+        try:
+            result = worker.run(fn, args, timeout)
+        except ExtractionTimeout:
+            worker = self._retire(worker)
+            self._record('timeouts', started)
+            raise
+        except ExtractionError:
+            self._record('failed', started)
+            raise
+        except (EOFError, OSError) as e:
+            # Worker died mid-task (segfault, OOM kill, ...)
+            worker = self._retire(worker)
+            self._record('failed', started)
+            raise ExtractionError(f"Extraction worker crashed: {e}") from e
+        finally:
+            if worker is not None and self.max_tasks and worker.tasks >= self.max_tasks:
+                worker = self._retire(worker)
+            self._idle.put(worker)
+
+        self._record('succeeded', started)
+        return result
+
+
+# Default pool used for PDF/DOCX parsing and scoring
+extraction_pool = WorkerPool(EXTRACTION_WORKERS, EXTRACTION_TIMEOUT, EXTRACTION_MAX_TASKS_PER_WORKER)
+
+
+def run_isolated(fn, *args, timeout=None):
+    """Run fn(*args) in the default extraction pool"""
+    return extraction_pool.run(fn, *args, timeout=timeout)
+
+
+def get_extraction_metrics():
+    """Snapshot of extraction timings and failure counts"""
+    return extraction_pool.metrics()
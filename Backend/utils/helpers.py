@@ -2,8 +2,12 @@ from datetime import datetime
 from bson import ObjectId
 import uuid
 
-from config.settings import ALLOWED_EXTENSIONS
+from config.settings import ALLOWED_EXTENSIONS, SESSION_CACHE_TTL, SESSION_CACHE_SIZE
 from config.database import sessions_collection, users_collection
+from utils.ttl_cache import TTLCache
+
+# token -> {'user', 'expires_at'}; unknown tokens are not cached
+session_cache = TTLCache(SESSION_CACHE_SIZE, SESSION_CACHE_TTL, cache_none=False)
 
 
 def serialize_doc(doc):
@@ -37,19 +41,45 @@ def generate_session_token():
     return str(uuid.uuid4())
 
 
-def get_authenticated_user(request):
-    """Get authenticated user from request header"""
-    token = request.headers.get('Authorization', '').replace('Bearer ', '')
-    if not token:
-        return None
-    
-    session = sessions_collection.find_one({'token': token})
+def get_request_token(request):
+    """Bearer token from the Authorization header"""
+    return request.headers.get('Authorization', '').replace('Bearer ', '')
+
+
+def _load_session(token):
+    """Session expiry and user (without password hash) for a token, or None"""
+    session = sessions_collection.find_one({'token': token}, {'email': 1, 'expires_at': 1})
     if not session:
         return None
+    user = users_collection.find_one({'email': session['email']}, {'password': 0})
+    if not user:
+        return None
+    return {'user': serialize_doc(user), 'expires_at': session['expires_at']}
+
+
+def get_session(token):
+    """
+    Live session for a token as {'user', 'expires_at'}, or None.
+    Served from the process-local session cache in the common case.
+    """
+    if not token:
+        return None
     
-    if datetime.now() > session['expires_at']:
+    session = session_cache.get_or_compute(token, lambda: _load_session(token))
+    if session and datetime.now() > session['expires_at']:
         sessions_collection.delete_one({'token': token})
+        session_cache.invalidate(token)
         return None
-    
-    user = users_collection.find_one({'email': session['email']})
-    return serialize_doc(user)
+    return session
+
+
+def end_session(token):
+    """Delete a session and drop it from the cache"""
+    sessions_collection.delete_one({'token': token})
+    session_cache.invalidate(token)
+
+
+def get_authenticated_user(request):
+    """Get authenticated user from request header"""
+    session = get_session(get_request_token(request))
+    return session['user'] if session else None
@@ -0,0 +1,76 @@
+"""
+Applicant counters denormalized onto job documents.
+
+Each job carries applicant_count and status_counts.<status>, maintained
+with atomic $inc on submit, status change and delete so job listings never
+count applications per job. reconcile_job_counters() recomputes them from
+the applications collection to repair any drift.
+"""
+
+from bson import ObjectId
+
+from config.database import jobs_collection, applications_collection
+from utils.job_refs import job_id_filter
+
+
+APPLICATION_STATUSES = ['pending', 'shortlisted', 'interviewed', 'rejected']
+
+
+def empty_counters():
+    """Counter fields for a job with no applications"""
+    return {
+        'applicant_count': 0,
+        'status_counts': {status: 0 for status in APPLICATION_STATUSES}
+    }
+
+
+def _job_filter(job_id):
+    return {'_id': job_id if isinstance(job_id, ObjectId) else ObjectId(job_id)}
+
+
+def increment_applicants(job_id, status='pending', amount=1):
+    """Add (or with a negative amount, remove) applicants in status to a job"""
+    if not amount:
+        return
+    jobs_collection.update_one(_job_filter(job_id), {
+        '$inc': {'applicant_count': amount, f'status_counts.{status}': amount}
+    })
+
+
+def move_applicant_status(job_id, old_status, new_status):
+    """Move one applicant between status counters"""
+    if old_status == new_status:
+        return
+    jobs_collection.update_one(_job_filter(job_id), {
+        '$inc': {f'status_counts.{old_status}': -1, f'status_counts.{new_status}': 1}
+    })
+
+
+def reconcile_job_counters(job_id=None):
+    """
+    Recompute counters from applications for one job or all jobs.
+    Returns the number of jobs whose counters changed.
+    """
+    match = {'job_id': job_id_filter(job_id)} if job_id else {}
+    pipeline = [
+        {'$match': match},
+        {'$group': {'_id': {'job_id': '$job_id', 'status': '$status'}, 'count': {'$sum': 1}}}
+    ]
+    actual = {}
+    for doc in applications_collection.aggregate(pipeline):
+        # Legacy string and ObjectId references of the same job add up
+        counters = actual.setdefault(str(doc['_id']['job_id']), empty_counters())
+        counters['applicant_count'] += doc['count']
+        status = doc['_id'].get('status')
+        if status in counters['status_counts']:
+            counters['status_counts'][status] += doc['count']
+
+    query = _job_filter(job_id) if job_id else {}
+    changed = 0
+    for job in jobs_collection.find(query, {'applicant_count': 1, 'status_counts': 1}):
+        expected = actual.get(str(job['_id']), empty_counters())
+        current = {'applicant_count': job.get('applicant_count'), 'status_counts': job.get('status_counts')}
+        if current != expected:
+            jobs_collection.update_one({'_id': job['_id']}, {'$set': expected})
+            changed += 1
+    return changed
@@ -0,0 +1,68 @@
+"""
+References from applications to jobs.
+
+applications.job_id (and application_texts.job_id) are stored as ObjectId
+so they compare directly with jobs._id. Older documents hold the id as a
+string; until migrate_job_ids() has converted them, reads match both forms
+with an $in, which the {job_id, ...} indexes still serve as point ranges.
+"""
+
+from bson import ObjectId
+from bson.errors import InvalidId
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
+
+from config.database import applications_collection, application_texts_collection
+from config.settings import JOB_ID_LEGACY_READS
+
+
+def job_ref(job_id):
+    """The stored form of a job reference (ObjectId when the id is valid)"""
+    if isinstance(job_id, ObjectId):
+        return job_id
+    try:
+        return ObjectId(job_id)
+    except (InvalidId, TypeError):
+        return job_id
+
+
+def job_id_filter(job_id):
+    """Query value matching applications of job_id in either stored form"""
+    ref = job_ref(job_id)
+    if JOB_ID_LEGACY_READS and isinstance(ref, ObjectId):
+        return {'$in': [ref, str(ref)]}
+    return ref
+
+
+def _migrate_collection(collection, batch_size):
+    """Convert string job_id values to ObjectId; returns (converted, failed)"""
+    converted = failed = 0
+    last_id = None
+    while True:
+        query = {'job_id': {'$type': 'string'}}
+        if last_id is not None:
+            query['_id'] = {'$gt': last_id}
+        batch = list(collection.find(query, {'job_id': 1}).sort('_id', 1).limit(batch_size))
+        if not batch:
+            break
+        last_id = batch[-1]['_id']
+        ops = [UpdateOne({'_id': doc['_id']}, {'$set': {'job_id': job_ref(doc['job_id'])}})
+               for doc in batch if isinstance(job_ref(doc['job_id']), ObjectId)]
+        failed += len(batch) - len(ops)
+        if not ops:
+            continue
+        try:
+            converted += collection.bulk_write(ops, ordered=False).modified_count
+        except BulkWriteError as e:
+            # e.g. the same email already applied under the ObjectId form
+            converted += e.details.get('nModified', 0)
+            failed += len(e.details.get('writeErrors', []))
+    return converted, failed
+
+
+def migrate_job_ids(batch_size=500):
+    """Convert legacy string job_id references; returns {collection: (converted, failed)}"""
+    return {
+        'applications': _migrate_collection(applications_collection, batch_size),
+        'application_texts': _migrate_collection(application_texts_collection, batch_size)
+    }
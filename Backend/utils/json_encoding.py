@@ -0,0 +1,157 @@
+"""
+JSON encoding for API responses.
+
+dumps() uses orjson when it is installed (the stdlib json module otherwise)
+and encodes the BSON types found in documents (ObjectId, datetime,
+Decimal128) natively, the same way serialize_doc() converts them.
+FastJSONProvider plugs it into jsonify().
+
+stream_json() writes {..., key: [rows], ...} in chunks straight from a
+Mongo cursor, so large listings are never materialized as a list, a
+serialized copy and a response body at once; peak memory stays flat with
+the number of rows.
+"""
+
+import inspect
+import json
+from datetime import date, datetime
+
+from bson import ObjectId
+from bson.decimal128 import Decimal128
+from flask import Response
+from flask.json.provider import DefaultJSONProvider
+
+from config.settings import JSON_STREAM_CHUNK_BYTES
+
+try:
+    import orjson
+    ORJSON_SUPPORT = True
+except ImportError:
+    ORJSON_SUPPORT = False
+    print("⚠️ orjson not installed. Using the standard json encoder.")
+
+
+def _default(obj):
+    """Encode BSON values the encoder does not know natively"""
+    if isinstance(obj, ObjectId):
+        return str(obj)
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if isinstance(obj, Decimal128):
+        return str(obj.to_decimal())
+    raise TypeError(f'Object of type {type(obj).__name__} is not JSON serializable')
+
+
+def dumps(obj, sort_keys=False):
+    """Encode obj as compact UTF-8 JSON bytes"""
+    if ORJSON_SUPPORT:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_SORT_KEYS if sort_keys else 0)
+        return orjson.dumps(obj, default=_default, option=option)
+    return json.dumps(obj, default=_default, sort_keys=sort_keys, ensure_ascii=False,
+                      separators=(',', ':')).encode('utf-8')
+
+
+def loads(data):
+    return orjson.loads(data) if ORJSON_SUPPORT else json.loads(data)
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """jsonify()/request.get_json() through dumps()/loads(); responses are built from bytes"""
+
+    sort_keys = False
+
+    def dumps(self, obj, **kwargs):
+        return dumps(obj, kwargs.get('sort_keys', self.sort_keys)).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        return loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(dumps(obj, self.sort_keys), mimetype=self.mimetype)
+
+
+def public_doc(doc):
+    """
+    serialize_doc() for streamed rows: only _id is renamed to id, other
+    ObjectId/datetime values are left to the encoder instead of being
+    converted in Python.
+    """
+    if '_id' not in doc:
+        return doc
+    return {('id' if key == '_id' else key): (str(value) if key == '_id' else value)
+            for key, value in doc.items()}
+
+
+class _ArrayWriter:
+    """Incrementally encodes {**head, key: [rows], **tail} into byte chunks"""
+
+    def __init__(self, key, head, transform, chunk_bytes):
+        self.transform = transform
+        self.chunk_bytes = chunk_bytes
+        self.count = 0
+        self.buffer = bytearray(dumps(head or {})[:-1])
+        if head:
+            self.buffer += b','
+        self.buffer += dumps(key) + b':['
+
+    def add(self, row):
+        """Append a row; returns a chunk once enough bytes are buffered"""
+        if self.count:
+            self.buffer += b','
+        self.buffer += dumps(self.transform(row))
+        self.count += 1
+        if len(self.buffer) >= self.chunk_bytes:
+            chunk = bytes(self.buffer)
+            self.buffer.clear()
+            return chunk
+        return None
+
+    def close(self, tail):
+        """The final chunk; tail may be a dict or a callable taking the row count"""
+        if callable(tail):
+            tail = tail(self.count)
+        self.buffer += b']'
+        self.buffer += b',' + dumps(tail)[1:] if tail else b'}'
+        return bytes(self.buffer)
+
+
+def stream_json(rows, key, head=None, tail=None, transform=public_doc, chunk_bytes=JSON_STREAM_CHUNK_BYTES):
+    """
+    Generate {**head, key: [transform(row) for row in rows], **tail} as JSON
+    chunks. The cursor is closed when the generator finishes or the client
+    goes away. An error mid-stream truncates the body, as with any streamed
+    response, so callers validate their input before starting.
+    """
+    writer = _ArrayWriter(key, head, transform, chunk_bytes)
+    try:
+        for row in rows:
+            chunk = writer.add(row)
+            if chunk:
+                yield chunk
+        yield writer.close(tail)
+    finally:
+        if hasattr(rows, 'close'):
+            rows.close()
+
+
+async def stream_json_async(rows, key, head=None, tail=None, transform=public_doc,
+                            chunk_bytes=JSON_STREAM_CHUNK_BYTES):
+    """stream_json() over an async iterable such as a motor cursor"""
+    writer = _ArrayWriter(key, head, transform, chunk_bytes)
+    try:
+        async for row in rows:
+            chunk = writer.add(row)
+            if chunk:
+                yield chunk
+        yield writer.close(tail)
+    finally:
+        if hasattr(rows, 'close'):
+            closed = rows.close()
+            if inspect.isawaitable(closed):
+                await closed
+
+
+def json_stream_response(rows, key, head=None, tail=None, transform=public_doc):
+    """Chunked application/json Flask response built by stream_json()"""
+    return Response(stream_json(rows, key, head, tail, transform), mimetype='application/json')
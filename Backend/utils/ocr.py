@@ -0,0 +1,353 @@
+"""
+OCR fallback for scanned (image-only) resumes using TrOCR.
+
+torch, transformers and pdf2image are heavy, so nothing here is
+imported at API startup. The model is loaded on first use inside a
+dedicated worker process; the main API only pays that cost when a
+scanned resume actually shows up.
+"""
+
+import importlib.util
+import os
+import re
+import tempfile
+
+from config.settings import (
+    OCR_ENABLED,
+    OCR_MODEL,
+    OCR_TIMEOUT,
+    OCR_MAX_PAGES,
+    OCR_MIN_TEXT_CHARS,
+    OCR_BATCH_SIZE,
+    OCR_NUM_THREADS,
+    OCR_MAX_LENGTH,
+    OCR_DPI,
+    OCR_MIN_DPI,
+    OCR_MAX_PAGE_PIXELS
+)
+from utils.extraction_pool import WorkerPool, ExtractionError
+
+OCR_SUPPORT = all(
+    importlib.util.find_spec(module) is not None
+    for module in ('torch', 'transformers', 'pdf2image', 'numpy', 'PIL')
+)
+if not OCR_SUPPORT:
+    print("OCR dependencies not installed. Scanned-resume OCR disabled.")
+
+# Line segmentation tuning (pixels at render DPI)
+INK_THRESHOLD = 200  # grey levels below this count as ink
+LINE_GAP = 2  # blank rows tolerated inside a single text line
+COLUMN_GAP = 50  # blank columns that split a band into separate columns
+
+_processor = None
+_model = None
+
+
+def load_model():
+    """Load the TrOCR processor and model once per process"""
+    global _processor, _model
+    if _model is None:
+        import torch
+        from transformers import TrOCRProcessor, VisionEncoderDecoderModel
+        
+        if OCR_NUM_THREADS > 0:
+            torch.set_num_threads(OCR_NUM_THREADS)
+        
+        print(f"Loading TrOCR model {OCR_MODEL}... This may take a moment.")
+        _processor = TrOCRProcessor.from_pretrained(OCR_MODEL)
+        _model = VisionEncoderDecoderModel.from_pretrained(OCR_MODEL)
+        _model.eval()
+        print("Model loaded successfully!")
+    return _processor, _model
+
+
+def recognize_batch(images):
+    """
+    Run TrOCR on a list of line images in batches of OCR_BATCH_SIZE.
+    The processor resizes every crop to the model input size so a batch
+    stacks into one tensor; generate() pads the shorter outputs and a single
+    batch_decode turns them back into text. Returns one string per image.
+    """
+    import torch
+    
+    processor, model = load_model()
+    texts = []
+    for start in range(0, len(images), OCR_BATCH_SIZE):
+        batch = images[start:start + OCR_BATCH_SIZE]
+        try:
+            with torch.inference_mode():
+                pixel_values = processor(images=batch, return_tensors="pt").pixel_values
+                generated_ids = model.generate(pixel_values, max_length=OCR_MAX_LENGTH)
+            texts.extend(processor.batch_decode(generated_ids, skip_special_tokens=True))
+        except Exception as e:
+            print(f"Error processing batch: {e}")
+            if len(batch) == 1:
+                texts.append("")
+            else:
+                # Retry one by one so a single bad crop doesn't drop the whole batch
+                for image in batch:
+                    texts.extend(recognize_batch([image]))
+    return texts
+
+
+def _ink_runs(mask, max_gap=0):
+    """
+    Return [(start, end)] runs of True in a 1-D boolean array,
+    merging runs separated by gaps of at most max_gap.
+    """
+    import numpy as np
+    
+    padded = np.concatenate(([False], mask, [False])).astype(np.int8)
+    edges = np.diff(padded)
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+    
+    runs = []
+    for start, end in zip(starts.tolist(), ends.tolist()):
+        if runs and start - runs[-1][1] <= max_gap:
+            runs[-1] = (runs[-1][0], end)
+        else:
+            runs.append((start, end))
+    return runs
+
+
+def _ink_mask(img):
+    """Boolean array marking dark (ink) pixels"""
+    import numpy as np
+    
+    return np.asarray(img.convert('L')) < INK_THRESHOLD
+
+
+def detect_text_lines(img):
+    """
+    Detect text lines using projection profiles.
+    Rows with ink form horizontal bands; blank rows between them are skipped.
+    Within a band, wide blank column gaps split side-by-side columns.
+    Returns bounding boxes (x, y, w, h) sorted top to bottom.
+    """
+    width, height = img.size
+    ink = _ink_mask(img)
+    
+    # Rows need a few ink pixels to count, which ignores specks and scan noise
+    row_ink = ink.sum(axis=1)
+    rows = row_ink > max(2, width // 500)
+    
+    boxes = []
+    padding = 5
+    for top, bottom in _ink_runs(rows, max_gap=LINE_GAP):
+        h = bottom - top
+        # Filter out very small bands (noise) and very large ones
+        if h <= 10 or h >= height * 0.5:
+            continue
+        cols = ink[top:bottom].any(axis=0)
+        for left, right in _ink_runs(cols, max_gap=COLUMN_GAP):
+            w = right - left
+            if w <= 50:
+                continue
+            x = max(0, left - padding)
+            y = max(0, top - padding)
+            boxes.append((x, y, min(width - x, w + 2 * padding), min(height - y, h + 2 * padding)))
+    
+    boxes.sort(key=lambda b: (b[1], b[0]))
+    return boxes
+
+
+def extract_text_from_image(img):
+    """
+    Extract text from an image by detecting and processing individual text lines.
+    """
+    # Convert to RGB if necessary
+    if img.mode != 'RGB':
+        img = img.convert('RGB')
+    
+    # Detect text line regions
+    text_boxes = detect_text_lines(img)
+    
+    # If no lines detected, try processing the whole image in strips
+    if not text_boxes:
+        return extract_text_strips(img)
+    
+    # Crop every text line, then recognize them together in batches
+    line_images = [img.crop((x, y, x + w, y + h)) for (x, y, w, h) in text_boxes]
+    
+    extracted_lines = []
+    for text in recognize_batch(line_images):
+        # Only add meaningful text (filter out noise)
+        if text.strip() and len(text.strip()) > 1 and not is_garbage_text(text):
+            extracted_lines.append(text.strip())
+    
+    return "\n".join(extracted_lines)
+
+
+def extract_text_strips(img):
+    """
+    Fallback: Extract text by processing horizontal strips.
+    """
+    import numpy as np
+    
+    width, height = img.size
+    line_height = 60
+    strips = []
+    
+    # Only strips that start on an inked row are sent to the model
+    row_has_ink = _ink_mask(img).sum(axis=1) > max(2, width // 500)
+    inked_rows = np.flatnonzero(row_has_ink)
+    
+    y = 0
+    while True:
+        # Jump over blank regions straight to the next inked row
+        remaining = inked_rows[inked_rows >= y]
+        if remaining.size == 0:
+            break
+        y = int(remaining[0])
+        bottom = min(y + line_height, height)
+        strips.append(img.crop((0, max(0, y - 5), width, bottom)))
+        y += line_height - 10
+    
+    extracted_lines = []
+    for text in recognize_batch(strips):
+        if text.strip() and len(text.strip()) > 1 and not is_garbage_text(text):
+            extracted_lines.append(text.strip())
+    
+    return "\n".join(extracted_lines)
+
+
+def is_garbage_text(text):
+    """
+    Filter out garbage/hallucinated text.
+    """
+    # Check for repetitive patterns: any 4-character sequence occurring more
+    # than 3 times without overlap (as str.count counts), in one pass
+    if len(text) > 20:
+        counts = {}
+        last_start = {}
+        for i in range(len(text) - 3):
+            gram = text[i:i + 4]
+            if i >= last_start.get(gram, -4) + 4:
+                last_start[gram] = i
+                counts[gram] = counts.get(gram, 0) + 1
+                if counts[gram] > 3:
+                    return True
+    
+    # Check for too many numbers/special chars ratio
+    num_count = sum(c.isdigit() for c in text)
+    if len(text) > 10 and num_count / len(text) > 0.6:
+        return True
+    
+    # Check for too many zeros
+    if text.count('0') > 10:
+        return True
+        
+    return False
+
+
+def get_page_sizes(pdf_path, page_count):
+    """Return {page_number: (width_pts, height_pts)} from pdfinfo"""
+    from pdf2image import pdfinfo_from_path
+    
+    sizes = {}
+    try:
+        info = pdfinfo_from_path(pdf_path, first_page=1, last_page=page_count)
+    except Exception:
+        return sizes
+    for key, value in info.items():
+        page_match = re.match(r'Page\s+(\d+) size', key)
+        size_match = re.match(r'([\d.]+) x ([\d.]+) pts', str(value).strip())
+        if page_match and size_match:
+            sizes[int(page_match.group(1))] = (float(size_match.group(1)), float(size_match.group(2)))
+    return sizes
+
+
+def page_dpi(page_size):
+    """Pick a DPI that keeps the rendered page under OCR_MAX_PAGE_PIXELS"""
+    if not page_size:
+        return OCR_DPI
+    width_in, height_in = page_size[0] / 72, page_size[1] / 72
+    pixels = width_in * height_in * OCR_DPI * OCR_DPI
+    if pixels <= OCR_MAX_PAGE_PIXELS:
+        return OCR_DPI
+    return max(OCR_MIN_DPI, int(OCR_DPI * (OCR_MAX_PAGE_PIXELS / pixels) ** 0.5))
+
+
+def plan_pages(pdf_path, max_pages=None):
+    """Return [(page_number, dpi)] for the pages to OCR"""
+    from pdf2image import pdfinfo_from_path
+    
+    page_count = int(pdfinfo_from_path(pdf_path)['Pages'])
+    if max_pages:
+        page_count = min(page_count, max_pages)
+    sizes = get_page_sizes(pdf_path, page_count)
+    return [(page, page_dpi(sizes.get(page))) for page in range(1, page_count + 1)]
+
+
+def render_page(pdf_path, page, dpi):
+    """Render a single PDF page to a PIL image"""
+    from pdf2image import convert_from_path
+    
+    return convert_from_path(pdf_path, dpi=dpi, first_page=page, last_page=page)[0]
+
+
+def ocr_document(source, max_pages=OCR_MAX_PAGES):
+    """
+    OCR a PDF (path or bytes) one page at a time and return the joined text.
+    Runs inside the OCR worker process.
+    """
+    temp_path = None
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as temp:
+            temp.write(source)
+            temp_path = temp.name
+    
+    try:
+        pdf_path = temp_path or source
+        texts = []
+        for page, dpi in plan_pages(pdf_path, max_pages):
+            img = render_page(pdf_path, page, dpi)
+            texts.append(extract_text_from_image(img))
+            img.close()
+        return "\n".join(text for text in texts if text)
+    finally:
+        if temp_path:
+            os.remove(temp_path)
+
+
+def needs_ocr(text):
+    """True when a PDF text layer is empty or mostly unreadable characters"""
+    stripped = text.strip() if text else ''
+    if len(stripped) < OCR_MIN_TEXT_CHARS:
+        return True
+    readable = sum(1 for c in stripped if c.isalnum() or c.isspace() or c in '.,;:-()@+/&%#\'"')
+    return readable / len(stripped) < 0.7
+
+
+def ocr_available():
+    """True when OCR is enabled and its dependencies are installed"""
+    return OCR_ENABLED and OCR_SUPPORT
+
+
+def awaits_ocr(text, file_ext):
+    """True when an extracted PDF text layer will be replaced by background OCR"""
+    return file_ext == 'pdf' and ocr_available() and needs_ocr(text)
+
+
+# One dedicated process keeps the model loaded between documents. Only the
+# background OCR queue calls it, so waiting for it never holds a request.
+_ocr_pool = WorkerPool(1, OCR_TIMEOUT, acquire_timeout=OCR_TIMEOUT)
+
+
+def ocr_resume(source):
+    """OCR a scanned PDF in the dedicated OCR worker; returns "" when unavailable or on failure"""
+    if not ocr_available():
+        return ""
+    try:
+        return _ocr_pool.run(ocr_document, source)
+    except ExtractionError as e:
+        print(f"Error running OCR: {e}")
+        return ""
+
+
+def get_ocr_metrics():
+    """Snapshot of OCR timings and failure counts"""
+    metrics = _ocr_pool.metrics()
+    metrics['enabled'] = ocr_available()
+    return metrics
@@ -0,0 +1,256 @@
+"""
+Out-of-band OCR for scanned resumes.
+
+OCR of a scanned PDF can take minutes, so it never runs inside a request.
+When a PDF's text layer is unusable, text extraction caches what it has
+with ocr_pending=True and calls enqueue_ocr(). Applications scored from
+that text are stored with ocr_pending=True. A background thread feeds the
+queue to the single OCR worker. When OCR finishes, the cached text is
+replaced and every pending application with the same resume_sha256 is
+rescored.
+
+The queue is process-local and bounded. Resumes that do not fit, or that
+were queued in a process that has since exited, are picked up by the
+idle-time sweep or by `flask process-ocr-pending`. A claim on the
+extraction cache document stops two processes from OCRing the same file.
+
+The same thread retries text extraction for applications stored with
+extraction_pending=True, whose extraction found the worker pool busy or
+timed out, and rescores them once text is available.
+"""
+
+import os
+import queue
+import threading
+from datetime import datetime, timedelta
+
+from config.database import extraction_cache_collection, applications_collection
+from pymongo import ReturnDocument
+
+from config.settings import (
+    Config,
+    OCR_QUEUE_SIZE,
+    OCR_SWEEP_INTERVAL,
+    OCR_TIMEOUT,
+    EXTRACTION_TIMEOUT,
+    EXTRACTION_RETRY_LIMIT
+)
+from utils.extraction_pool import ExtractionError
+from utils.ocr import ocr_available, ocr_resume, awaits_ocr
+from utils.sections import segment_sections
+from utils.helpers import serialize_doc
+from utils.scoring import score_resume
+from utils.application_store import load_text_fields, update_application
+from utils.rollups import record_score_changes
+from utils.cache import get_cached_job
+
+_queue = queue.Queue(maxsize=OCR_QUEUE_SIZE)
+_queued = set()
+_lock = threading.Lock()
+_thread = None
+_thread_pid = None
+
+
+def enqueue_ocr(sha256, source):
+    """
+    Schedule background OCR of a PDF (path or bytes) whose extraction is
+    cached under sha256. Returns False when OCR is unavailable or the
+    queue is full; the sweep retries those later.
+    """
+    if not ocr_available():
+        return False
+    with _lock:
+        if sha256 in _queued:
+            return True
+        try:
+            _queue.put_nowait((sha256, source))
+        except queue.Full:
+            print(f"⚠️ OCR queue full; {sha256[:12]} left for the next sweep")
+            return False
+        _queued.add(sha256)
+    _ensure_thread()
+    return True
+
+
+def schedule_extraction_retry():
+    """Make sure this process sweeps applications flagged extraction_pending"""
+    _ensure_thread()
+
+
+def _ensure_thread():
+    """Start the background OCR thread in this process (again after fork)"""
+    global _thread, _thread_pid
+    with _lock:
+        if _thread is not None and _thread_pid == os.getpid() and _thread.is_alive():
+            return
+        _thread = threading.Thread(target=_run, name='ocr-queue', daemon=True)
+        _thread_pid = os.getpid()
+        _thread.start()
+
+
+def _run():
+    while True:
+        try:
+            sha256, source = _queue.get(timeout=OCR_SWEEP_INTERVAL)
+        except queue.Empty:
+            try:
+                retry_pending_extractions()
+                sweep_ocr_pending()
+            except Exception as e:
+                print(f"❌ OCR sweep failed: {e}")
+            continue
+        try:
+            process_ocr(sha256, source)
+        except Exception as e:
+            print(f"❌ Background OCR of {sha256[:12]} failed: {e}")
+        finally:
+            with _lock:
+                _queued.discard(sha256)
+
+
+def _claim(sha256):
+    """Take ownership of a pending OCR; False if it is done or held by another process"""
+    now = datetime.now()
+    return extraction_cache_collection.find_one_and_update(
+        {'_id': sha256, 'ocr_pending': True, '$or': [
+            {'ocr_claimed_at': {'$exists': False}},
+            {'ocr_claimed_at': {'$lt': now - timedelta(seconds=OCR_TIMEOUT * 2)}}
+        ]},
+        {'$set': {'ocr_claimed_at': now}}
+    ) is not None
+
+
+def process_ocr(sha256, source):
+    """OCR one cached PDF and rescore the applications waiting for it; False if not claimed"""
+    if not _claim(sha256):
+        return False
+    complete_ocr(sha256, ocr_resume(source))
+    return True
+
+
+def complete_ocr(sha256, ocr_text):
+    """Store the OCR result (an empty result keeps the text layer) and rescore"""
+    update = {'ocr_pending': False}
+    if ocr_text.strip():
+        update.update({'text': ocr_text, 'sections': segment_sections(ocr_text), 'ocr': True})
+    extraction_cache_collection.update_one({'_id': sha256}, {'$set': update, '$unset': {'ocr_claimed_at': ''}})
+    return rescore_ocr_pending(sha256)
+
+
+def rescore_ocr_pending(sha256):
+    """Rescore applications of sha256 still waiting for OCR; returns the number rescored"""
+    cached = extraction_cache_collection.find_one({'_id': sha256}) or {}
+    if cached.get('ocr_pending'):
+        return 0
+    text = cached.get('text', '')
+    sections = cached.get('sections')
+    if sections is None:
+        sections = segment_sections(text)
+
+    rescored = 0
+    for application in applications_collection.find({'ocr_pending': True, 'resume_sha256': sha256}):
+        rescored += _rescore(application, text if cached.get('ocr') else None, sections, {'ocr_pending': False})
+    return rescored
+
+
+def _rescore(application, text, sections, update_data):
+    """
+    Save update_data on an application, rescored from text unless text is
+    None (or the job is gone). Returns 1 if it was rescored, else 0.
+    """
+    job = None
+    if text is not None:
+        try:
+            job = get_cached_job(application['job_id'])
+        except Exception:
+            job = None
+    if not job:
+        update_application(application['_id'], update_data)
+        return 0
+    load_text_fields(application)
+    scores = score_resume(serialize_doc(application), job, text, sections)
+    update_application(application['_id'], {**update_data, **scores, 'resume_text': text, 'resume_sections': sections})
+    record_score_changes(job, [(application.get('overall_score'), scores.get('overall_score'))])
+    return 1
+
+
+def _claim_extraction(app_id):
+    """Take a pending re-extraction and count the attempt; None if another process holds it"""
+    now = datetime.now()
+    return applications_collection.find_one_and_update(
+        {'_id': app_id, 'extraction_pending': True, '$or': [
+            {'extraction_claimed_at': {'$exists': False}},
+            {'extraction_claimed_at': {'$lt': now - timedelta(seconds=EXTRACTION_TIMEOUT * 2)}}
+        ]},
+        {'$set': {'extraction_claimed_at': now}, '$inc': {'extraction_attempts': 1}},
+        projection={'resume_text': 0, 'resume_sections': 0},
+        return_document=ReturnDocument.AFTER
+    )
+
+
+def retry_pending_extractions(upload_folder=Config.UPLOAD_FOLDER, limit=100):
+    """
+    Re-extract and rescore applications whose extraction found the worker
+    pool busy or timed out. After EXTRACTION_RETRY_LIMIT failed attempts an
+    application keeps its current score. Returns the number finished.
+    """
+    # text_extraction imports this module for enqueue_ocr()
+    from utils.text_extraction import extract_resume_text
+
+    finished = 0
+    for pending in list(applications_collection.find({'extraction_pending': True}, {'_id': 1}).limit(limit)):
+        application = _claim_extraction(pending['_id'])
+        if application is None:
+            continue
+        resume_file = application.get('resume_file') or ''
+        try:
+            text, sections = extract_resume_text(os.path.join(upload_folder, 'resumes', resume_file),
+                                                 raise_errors=True)
+        except ExtractionError as e:
+            if application['extraction_attempts'] < EXTRACTION_RETRY_LIMIT:
+                applications_collection.update_one({'_id': application['_id']},
+                                                   {'$unset': {'extraction_claimed_at': ''}})
+                continue
+            print(f"⚠️ Giving up on extracting {resume_file}: {e}")
+            text, sections = None, None
+
+        update_data = {'extraction_pending': False}
+        if text is not None and awaits_ocr(text, resume_file.rsplit('.', 1)[-1].lower()):
+            # Extraction queued the scan for OCR, which rescores it again when done
+            update_data['ocr_pending'] = True
+        _rescore(application, text or None, sections, update_data)
+        applications_collection.update_one({'_id': application['_id']},
+                                           {'$unset': {'extraction_claimed_at': '', 'extraction_attempts': ''}})
+        finished += 1
+    return finished
+
+
+def sweep_ocr_pending(upload_folder=Config.UPLOAD_FOLDER, limit=100, run_inline=False):
+    """
+    Finish pending applications whose OCR already completed and requeue
+    the rest from their stored resume files. With run_inline the OCR runs
+    in the caller instead (used by the CLI). Returns the number of files
+    finished in this call (queued ones finish later).
+    """
+    files = {}
+    for application in applications_collection.find({'ocr_pending': True},
+                                                    {'resume_sha256': 1, 'resume_file': 1}).limit(limit):
+        if application.get('resume_sha256'):
+            files.setdefault(application['resume_sha256'], application.get('resume_file'))
+
+    finished = 0
+    for sha256, resume_file in files.items():
+        cached = extraction_cache_collection.find_one({'_id': sha256}, {'ocr_pending': 1})
+        path = os.path.join(upload_folder, 'resumes', resume_file or '')
+        if not cached or not cached.get('ocr_pending'):
+            rescore_ocr_pending(sha256)
+        elif not resume_file or not os.path.exists(path):
+            # Nothing left to OCR: finish with the text layer
+            complete_ocr(sha256, '')
+        elif not run_inline:
+            enqueue_ocr(sha256, path)
+            continue
+        elif not process_ocr(sha256, path):
+            continue
+        finished += 1
+    return finished
@@ -0,0 +1,212 @@
+"""
+Keyset (cursor) pagination.
+
+Pages are ordered by (sort_field, _id) and the next page starts strictly
+after the last row of the previous one, so every page is a bounded index
+range scan no matter how deep it is. Cursors are opaque base64 tokens that
+carry the last row's sort value and _id.
+"""
+
+import base64
+
+from bson import json_util
+
+from config.settings import PAGE_MAX_LIMIT, STREAM_CURSOR_BATCH_SIZE
+
+
+class InvalidCursor(ValueError):
+    """Raised for malformed cursors or cursors issued for a different sort"""
+
+
+def encode_cursor(sort_field, doc):
+    """Opaque cursor pointing just after doc"""
+    payload = json_util.dumps({'s': sort_field, 'v': doc.get(sort_field), 'id': doc['_id']})
+    return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor, sort_field):
+    """Return (value, _id) from a cursor, checking it belongs to sort_field"""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        payload = json_util.loads(base64.urlsafe_b64decode(padded.encode('ascii')).decode('utf-8'))
+        value, last_id = payload['v'], payload['id']
+        field = payload['s']
+    except (ValueError, KeyError, TypeError):
+        raise InvalidCursor('Invalid cursor')
+    if field != sort_field:
+        raise InvalidCursor('Cursor does not match the requested sort')
+    return value, last_id
+
+
+def keyset_filter(sort_field, sort_order, value, last_id):
+    """
+    Filter for rows after (value, last_id) in (sort_field, _id) order.
+    Missing/null values sort lowest in MongoDB: last in descending order,
+    first in ascending order.
+    """
+    after = '$gt' if sort_order == 1 else '$lt'
+    if value is None:
+        same_value = {sort_field: None, '_id': {after: last_id}}
+        if sort_order == 1:
+            # Nulls come first ascending; every non-null row is still ahead
+            return {'$or': [same_value, {sort_field: {'$ne': None}}]}
+        return same_value
+
+    clauses = [
+        {sort_field: {after: value}},
+        {sort_field: value, '_id': {after: last_id}}
+    ]
+    if sort_order == -1:
+        clauses.append({sort_field: None})
+    return {'$or': clauses}
+
+
+def parse_limit(limit_param):
+    """Parse ?limit=; None means unbounded (legacy behaviour)"""
+    if limit_param in (None, ''):
+        return None
+    limit = int(limit_param)
+    if limit < 1:
+        raise ValueError('limit must be positive')
+    return min(limit, PAGE_MAX_LIMIT)
+
+
+def parse_flag(value, default=False):
+    """Parse a boolean query string flag"""
+    if value in (None, ''):
+        return default
+    return value.lower() in ('1', 'true', 'yes')
+
+
+def cursor_query(query, sort_field, sort_order, cursor):
+    """AND the keyset condition for cursor into query"""
+    if not cursor:
+        return query
+    value, last_id = decode_cursor(cursor, sort_field)
+    after = keyset_filter(sort_field, sort_order, value, last_id)
+    return {'$and': [query, after]} if query else after
+
+
+def trim_page(docs, sort_field, limit):
+    """Cut a limit + 1 read down to the page and its next cursor"""
+    if limit is None or len(docs) <= limit:
+        return docs, None
+    docs = docs[:limit]
+    return docs, encode_cursor(sort_field, docs[-1])
+
+
+def sorted_find(collection, query, sort_field, sort_order, cursor=None, projection=None):
+    """
+    Unexecuted find over query in (sort_field, _id) order, starting after
+    cursor. Works with pymongo and motor collections; used directly to
+    stream unbounded listings in STREAM_CURSOR_BATCH_SIZE batches.
+    """
+    if projection:
+        # The sort field stays on each row so the next cursor can be built
+        projection = {**projection, sort_field: 1}
+    find = collection.find(cursor_query(query, sort_field, sort_order, cursor), projection)
+    return find.sort([(sort_field, sort_order), ('_id', sort_order)]).batch_size(STREAM_CURSOR_BATCH_SIZE)
+
+
+def paginate(collection, query, sort_field, sort_order, limit=None, cursor=None, projection=None):
+    """
+    Fetch one page of query ordered by (sort_field, _id).
+    Returns (docs, next_cursor); next_cursor is None on the last page.
+    """
+    find = sorted_find(collection, query, sort_field, sort_order, cursor, projection)
+    if limit is None:
+        return list(find), None
+    # Read one extra row to know whether another page exists
+    return trim_page(list(find.limit(limit + 1)), sort_field, limit)
+
+
+def count_by(collection, query, field):
+    """{value: count} of field over query in one $group"""
+    pipeline = [{'$match': query}, {'$group': {'_id': f'${field}', 'count': {'$sum': 1}}}]
+    return {doc['_id']: doc['count'] for doc in collection.aggregate(pipeline)}
+
+
+def paginate_with_counts(collection, query, sort_field, sort_order, limit=None, cursor=None,
+                         projection=None, count_field='status'):
+    """
+    One $facet aggregation returning a page of query plus per-count_field
+    counts over the whole query. Returns (docs, next_cursor, counts).
+
+    $facet feeds every document matching query through both branches, so
+    the whole match is read on each call (the counts need all of it) and
+    the cost grows with the match, not the page size. To keep that stream
+    small it is cut down to _id, sort_field and count_field first; the page
+    branch then re-reads its limit + 1 full documents by _id and applies
+    projection to those alone. The combined result is a single document
+    bounded by the 16MB BSON limit, so unbounded (limit=None) listings fall
+    back to a find plus a separate $group.
+    """
+    if limit is None:
+        docs, next_cursor = paginate(collection, query, sort_field, sort_order, None, cursor, projection)
+        return docs, next_cursor, count_by(collection, query, count_field)
+
+    pipeline = facet_pipeline(collection.name, query, sort_field, sort_order, limit, cursor, projection, count_field)
+    return facet_result(next(collection.aggregate(pipeline), None), sort_field, limit)
+
+
+async def paginate_async(collection, query, sort_field, sort_order, limit=None, cursor=None, projection=None):
+    """paginate() for a motor collection"""
+    find = sorted_find(collection, query, sort_field, sort_order, cursor, projection)
+    if limit is None:
+        return await find.to_list(None), None
+    return trim_page(await find.limit(limit + 1).to_list(limit + 1), sort_field, limit)
+
+
+async def count_by_async(collection, query, field):
+    """count_by() for a motor collection"""
+    pipeline = [{'$match': query}, {'$group': {'_id': f'${field}', 'count': {'$sum': 1}}}]
+    return {doc['_id']: doc['count'] async for doc in collection.aggregate(pipeline)}
+
+
+async def paginate_with_counts_async(collection, query, sort_field, sort_order, limit=None, cursor=None,
+                                     projection=None, count_field='status'):
+    """paginate_with_counts() for a motor collection"""
+    if limit is None:
+        docs, next_cursor = await paginate_async(collection, query, sort_field, sort_order, None, cursor, projection)
+        return docs, next_cursor, await count_by_async(collection, query, count_field)
+
+    pipeline = facet_pipeline(collection.name, query, sort_field, sort_order, limit, cursor, projection, count_field)
+    result = await collection.aggregate(pipeline).to_list(1)
+    return facet_result(result[0] if result else None, sort_field, limit)
+
+
+def facet_pipeline(collection_name, query, sort_field, sort_order, limit, cursor=None, projection=None,
+                   count_field='status'):
+    """The page + counts $facet pipeline used by paginate_with_counts()"""
+    sort = {sort_field: sort_order, '_id': sort_order}
+    page = []
+    if cursor:
+        page.append({'$match': cursor_query({}, sort_field, sort_order, cursor)})
+    page += [
+        {'$limit': limit + 1},
+        # Only the page rows are read in full
+        {'$lookup': {'from': collection_name, 'localField': '_id', 'foreignField': '_id', 'as': 'doc'}},
+        {'$unwind': '$doc'},
+        {'$replaceRoot': {'newRoot': '$doc'}}
+    ]
+    if projection:
+        # The sort field stays on each row so the next cursor can be built
+        page.append({'$project': {**projection, sort_field: 1}})
+
+    return [
+        {'$match': query},
+        {'$sort': sort},
+        {'$project': {sort_field: 1, count_field: 1}},
+        {'$facet': {
+            'page': page,
+            'counts': [{'$group': {'_id': f'${count_field}', 'count': {'$sum': 1}}}]
+        }}
+    ]
+
+
+def facet_result(result, sort_field, limit):
+    """Turn the $facet document (or None) into (docs, next_cursor, counts)"""
+    result = result or {'page': [], 'counts': []}
+    counts = {doc['_id']: doc['count'] for doc in result['counts']}
+    docs, next_cursor = trim_page(result['page'], sort_field, limit)
+    return docs, next_cursor, counts
@@ -0,0 +1,248 @@
+"""
+Incrementally maintained analytics rollups.
+
+The analytics_rollups collection holds one small document per scope:
+
+    global               jobs, active_jobs and application totals
+    department:<name>    application totals for a department
+    job:<job_id>         application totals for a job
+
+Application totals are applications, status_counts.<status>, score_sum and
+scored (applications with an overall_score), so averages are
+score_sum / scored. Route handlers call the record_* helpers after each
+write; each is a read of the job rollup plus one or two $inc round-trips.
+A job's department is written to its rollup only by the job create and
+update paths, and application writes read it back from there, so a stale
+cached job can never file totals under an old department.
+rebuild_rollups() recomputes everything from scratch.
+"""
+
+from bson import ObjectId
+from pymongo import UpdateOne
+
+from config.database import jobs_collection, applications_collection, analytics_rollups_collection
+from utils.job_counters import APPLICATION_STATUSES
+from utils.job_refs import job_ref
+from utils.cache import analytics_cache, invalidate_analytics
+
+
+GLOBAL_ROLLUP = 'global'
+
+
+def _job_key(job_id):
+    return f'job:{job_id}'
+
+
+def _department_key(department):
+    return f'department:{department}'
+
+
+def _resolve_job(job):
+    """
+    Accept a job document or a job id; return (job_id, department). The
+    department comes from the job rollup (or the live job before it has
+    one), never from the document passed in.
+    """
+    job_id = str(job.get('_id', job.get('id'))) if isinstance(job, dict) else str(job)
+    rollup = analytics_rollups_collection.find_one({'_id': _job_key(job_id)}, {'department': 1})
+    if rollup and 'department' in rollup:
+        return job_id, rollup['department']
+    oid = job_ref(job_id)
+    if not isinstance(oid, ObjectId):
+        # A malformed legacy reference has no live job to read a department from
+        return job_id, None
+    doc = jobs_collection.find_one({'_id': oid}, {'department': 1}) or {}
+    return job_id, doc.get('department')
+
+
+def _application_totals(applications, sign=1):
+    """$inc fields for adding (sign=1) or removing (sign=-1) applications"""
+    inc = {'applications': 0, 'score_sum': 0, 'scored': 0}
+    for application in applications:
+        inc['applications'] += sign
+        # Applications without a status count as pending, as in the job counters
+        status = application.get('status') or 'pending'
+        inc[f'status_counts.{status}'] = inc.get(f'status_counts.{status}', 0) + sign
+        if application.get('overall_score') is not None:
+            inc['score_sum'] += sign * application['overall_score']
+            inc['scored'] += sign
+    return inc
+
+
+def _apply(job_id, department, inc):
+    """$inc the global, department and job rollups in one round-trip"""
+    inc = {field: amount for field, amount in inc.items() if amount}
+    if not inc:
+        return
+    invalidate_analytics(job_id)
+    ops = [UpdateOne({'_id': GLOBAL_ROLLUP}, {'$inc': inc}, upsert=True)]
+    if department:
+        ops.append(UpdateOne(
+            {'_id': _department_key(department)},
+            {'$inc': inc, '$setOnInsert': {'type': 'department', 'department': department}},
+            upsert=True
+        ))
+    ops.append(UpdateOne(
+        {'_id': _job_key(job_id)},
+        {'$inc': inc, '$setOnInsert': {'type': 'job', 'job_id': job_id, 'department': department}},
+        upsert=True
+    ))
+    analytics_rollups_collection.bulk_write(ops, ordered=False)
+
+
+def record_applications_added(job, applications):
+    """Count newly inserted applications"""
+    job_id, department = _resolve_job(job)
+    _apply(job_id, department, _application_totals(applications))
+
+
+def record_applications_removed(job, applications):
+    """Uncount deleted applications"""
+    job_id, department = _resolve_job(job)
+    _apply(job_id, department, _application_totals(applications, sign=-1))
+
+
+def record_status_change(job, old_status, new_status):
+    """Move one application between status counters"""
+    if old_status == new_status:
+        return
+    job_id, department = _resolve_job(job)
+    _apply(job_id, department, {f'status_counts.{old_status}': -1, f'status_counts.{new_status}': 1})
+
+
+def record_score_changes(job, changes):
+    """Account for rescores given [(old_score, new_score)]; None means unscored"""
+    inc = {'score_sum': 0, 'scored': 0}
+    for old_score, new_score in changes:
+        inc['score_sum'] += (new_score or 0) - (old_score or 0)
+        inc['scored'] += (new_score is not None) - (old_score is not None)
+    job_id, department = _resolve_job(job)
+    _apply(job_id, department, inc)
+
+
+def record_job_added(job, sign=1):
+    """Count (or with sign=-1, uncount) a job in the global rollup; adding also creates its job rollup"""
+    inc = {'jobs': sign}
+    if job.get('status') == 'active':
+        inc['active_jobs'] = sign
+    analytics_rollups_collection.update_one({'_id': GLOBAL_ROLLUP}, {'$inc': inc}, upsert=True)
+    if sign > 0:
+        job_id = str(job['_id'])
+        analytics_rollups_collection.update_one(
+            {'_id': _job_key(job_id)},
+            {'$setOnInsert': {'type': 'job', 'job_id': job_id, 'department': job.get('department')}},
+            upsert=True
+        )
+    invalidate_analytics(job.get('_id'))
+
+
+def record_job_status_change(old_status, new_status):
+    """Keep active_jobs in step with a job's status change"""
+    if (old_status == 'active') == (new_status == 'active'):
+        return
+    amount = 1 if new_status == 'active' else -1
+    analytics_rollups_collection.update_one({'_id': GLOBAL_ROLLUP}, {'$inc': {'active_jobs': amount}}, upsert=True)
+    invalidate_analytics()
+
+
+def _job_totals_inc(job_rollup, sign):
+    """$inc fields that add or remove a whole job's application totals"""
+    inc = {field: sign * job_rollup.get(field, 0) for field in ('applications', 'score_sum', 'scored')}
+    for status, count in job_rollup.get('status_counts', {}).items():
+        inc[f'status_counts.{status}'] = sign * count
+    return {field: amount for field, amount in inc.items() if amount}
+
+
+def record_job_removed(job):
+    """Uncount a deleted job together with all of its applications"""
+    job_id = str(job['_id'])
+    record_job_added(job, sign=-1)
+    job_rollup = analytics_rollups_collection.find_one_and_delete({'_id': _job_key(job_id)})
+    if not job_rollup:
+        return
+    inc = _job_totals_inc(job_rollup, -1)
+    if not inc:
+        return
+    ops = [UpdateOne({'_id': GLOBAL_ROLLUP}, {'$inc': inc})]
+    if job_rollup.get('department'):
+        ops.append(UpdateOne({'_id': _department_key(job_rollup['department'])}, {'$inc': inc}))
+    analytics_rollups_collection.bulk_write(ops, ordered=False)
+
+
+def record_job_department_change(job_id, old_department, new_department):
+    """Move a job's application totals from one department rollup to another"""
+    if old_department == new_department:
+        return
+    invalidate_analytics(job_id)
+    job_rollup = analytics_rollups_collection.find_one_and_update(
+        {'_id': _job_key(job_id)},
+        {'$set': {'department': new_department}, '$setOnInsert': {'type': 'job', 'job_id': str(job_id)}},
+        upsert=True
+    )
+    if not job_rollup or not _job_totals_inc(job_rollup, 1):
+        return
+    ops = []
+    if old_department:
+        ops.append(UpdateOne({'_id': _department_key(old_department)}, {'$inc': _job_totals_inc(job_rollup, -1)}))
+    if new_department:
+        ops.append(UpdateOne(
+            {'_id': _department_key(new_department)},
+            {'$inc': _job_totals_inc(job_rollup, 1),
+             '$setOnInsert': {'type': 'department', 'department': new_department}},
+            upsert=True
+        ))
+    if ops:
+        analytics_rollups_collection.bulk_write(ops, ordered=False)
+
+
+def get_overview_rollups():
+    """Return (global_rollup, [department_rollups]) for the dashboard"""
+    rollups = list(analytics_rollups_collection.find({'$or': [{'_id': GLOBAL_ROLLUP}, {'type': 'department'}]}))
+    global_rollup = next((r for r in rollups if r['_id'] == GLOBAL_ROLLUP), {})
+    return global_rollup, [r for r in rollups if r.get('type') == 'department']
+
+
+def rebuild_rollups():
+    """Recompute every rollup from jobs and applications; returns the number written"""
+    jobs = {str(job['_id']): job for job in jobs_collection.find({}, {'department': 1, 'status': 1})}
+
+    def empty(**meta):
+        return {**meta, 'applications': 0, 'score_sum': 0, 'scored': 0,
+                'status_counts': {status: 0 for status in APPLICATION_STATUSES}}
+
+    rollups = {GLOBAL_ROLLUP: {
+        **empty(),
+        'jobs': len(jobs),
+        'active_jobs': sum(1 for job in jobs.values() if job.get('status') == 'active')
+    }}
+    for job_id, job in jobs.items():
+        rollups[_job_key(job_id)] = empty(type='job', job_id=job_id, department=job.get('department'))
+
+    pipeline = [{'$group': {
+        '_id': {'job_id': '$job_id', 'status': '$status'},
+        'count': {'$sum': 1},
+        'score_sum': {'$sum': {'$ifNull': ['$overall_score', 0]}},
+        'scored': {'$sum': {'$cond': [{'$ne': [{'$ifNull': ['$overall_score', None]}, None]}, 1, 0]}}
+    }}]
+    for doc in applications_collection.aggregate(pipeline):
+        job_id = str(doc['_id']['job_id'])
+        job = jobs.get(job_id)
+        if job is None:
+            continue  # orphaned applications are not reported anywhere
+        keys = [GLOBAL_ROLLUP, _job_key(job_id)]
+        if job.get('department'):
+            key = _department_key(job['department'])
+            rollups.setdefault(key, empty(type='department', department=job['department']))
+            keys.append(key)
+        for key in keys:
+            rollup = rollups[key]
+            rollup['applications'] += doc['count']
+            rollup['score_sum'] += doc['score_sum']
+            rollup['scored'] += doc['scored']
+            status = doc['_id'].get('status') or 'pending'
+            rollup['status_counts'][status] = rollup['status_counts'].get(status, 0) + doc['count']
+
+    analytics_rollups_collection.delete_many({})
+    analytics_rollups_collection.insert_many([{'_id': key, **rollup} for key, rollup in rollups.items()])
+    analytics_cache.clear()
+    return len(rollups)
@@ -15,6 +15,8 @@ import math
 from collections import Counter
 from difflib import SequenceMatcher
 
+from utils.sections import segment_sections, get_section_text
+
 
 # ============== SKILL CATEGORIES ==============
 TECHNICAL_SKILLS = {
@@ -425,7 +427,7 @@ def calculate_education_score(college, degree, resume_text, job):
     return final_score
 
 
-def calculate_formatting_score(resume_text):
+def calculate_formatting_score(resume_text, sections=None):
     """
     Calculate resume formatting and structure score
     ATS systems prefer well-structured resumes
@@ -436,11 +438,18 @@ def calculate_formatting_score(resume_text):
     score = 60  # Base score
     
     # Check for section headers (indicates good structure)
-    section_headers = ['experience', 'education', 'skills', 'projects', 'summary', 
-                       'objective', 'work history', 'employment', 'qualifications',
-                       'achievements', 'certifications', 'awards', 'languages']
-    
-    sections_found = sum(1 for header in section_headers if header in resume_text.lower())
+    if sections is None:
+        sections = segment_sections(resume_text)
+    
+    sections_found = len({section['name'] for section in sections})
+    if not sections_found:
+        # No heading lines (e.g. headings run into the text after PDF
+        # extraction): fall back to substring hits so these resumes score
+        # as they did before sections were detected
+        section_headers = ['experience', 'education', 'skills', 'projects', 'summary',
+                           'objective', 'work history', 'employment', 'qualifications',
+                           'achievements', 'certifications', 'awards', 'languages']
+        sections_found = sum(1 for header in section_headers if header in resume_text.lower())
     score += min(15, sections_found * 3)
     
     # Check for contact info patterns
@@ -592,7 +601,7 @@ def generate_ai_analysis(scores, matched_keywords, missing_keywords, matched_ski
     return full_analysis
 
 
-def score_resume(application, job, resume_text=None):
+def score_resume(application, job, resume_text=None, sections=None):
     """
     Main ATS scoring function
     Calculates comprehensive ATS score based on multiple factors
@@ -601,12 +610,22 @@ def score_resume(application, job, resume_text=None):
     # Get resume text if available
     if resume_text is None:
         resume_text = application.get('resume_text', '')
+    if sections is None:
+        sections = segment_sections(resume_text)
     
     # Combine all available text from application
     experience_text = application.get('experience', '')
     cover_letter = application.get('cover_letter', '')
     combined_resume_text = f"{resume_text} {experience_text} {cover_letter}"
     
+    # Scope experience and skill detection to the relevant sections when the
+    # resume has them, falling back to the full text otherwise
+    experience_scope = get_section_text(resume_text, sections, 'summary', 'experience', 'projects') or resume_text
+    if any(section['name'] == 'skills' for section in sections):
+        skills_scope = get_section_text(resume_text, sections, 'skills', 'experience', 'projects', 'summary')
+    else:
+        skills_scope = resume_text
+    
     resume_skills = application.get('skills', [])
     college = application.get('college', '')
     degree = application.get('degree', '')
@@ -617,16 +636,18 @@ def score_resume(application, job, resume_text=None):
     keyword_score, matched_keywords, missing_keywords = calculate_keyword_match_score(combined_resume_text, job)
     
     # 2. Skills Alignment Score (25% weight)
-    skill_score, matched_skills, missing_skills = calculate_skills_alignment_score(resume_skills, combined_resume_text, job)
+    skill_score, matched_skills, missing_skills = calculate_skills_alignment_score(
+        resume_skills, f"{skills_scope} {experience_text} {cover_letter}", job)
     
     # 3. Experience Match Score (20% weight)
-    experience_score, years_exp, years_required = calculate_experience_match_score(combined_resume_text, experience_text, job)
+    experience_score, years_exp, years_required = calculate_experience_match_score(
+        f"{experience_scope} {experience_text} {cover_letter}", experience_text, job)
     
     # 4. Education Score (10% weight)
     education_score = calculate_education_score(college, degree, combined_resume_text, job)
     
     # 5. Resume Formatting Score (10% weight)
-    formatting_score = calculate_formatting_score(resume_text)
+    formatting_score = calculate_formatting_score(resume_text, sections)
     
     # 6. Action Verbs Score (5% weight)
     action_score = calculate_action_verbs_score(combined_resume_text)
@@ -671,12 +692,17 @@ def score_resume(application, job, resume_text=None):
     return scores
 
 
-def get_ats_breakdown(application, job, resume_text=None):
+def get_ats_breakdown(application, job, resume_text=None, sections=None):
     """
     Get detailed ATS score breakdown for display
     Returns structured data for frontend visualization
     """
-    scores = score_resume(application, job, resume_text)
+    if resume_text is None:
+        resume_text = application.get('resume_text', '')
+    if sections is None:
+        sections = segment_sections(resume_text)
+    
+    scores = score_resume(application, job, resume_text, sections)
     
     return {
         'overall': {
@@ -733,7 +759,8 @@ def get_ats_breakdown(application, job, resume_text=None):
             }
         ],
         'analysis': scores['ai_analysis'],
-        'recommendations': _extract_recommendations(scores)
+        'recommendations': _extract_recommendations(scores),
+        'sections': sections  # Character offsets into resume_text for highlighting
     }
 
 
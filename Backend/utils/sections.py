@@ -0,0 +1,82 @@
+"""
+Resume section segmentation.
+Splits extracted resume text into sections (summary, experience, education,
+skills, projects, ...) and records their character offsets so scorers can
+work on the relevant slice and the UI can highlight sections.
+"""
+
+import re
+
+
+# Heading phrases per section (matched against whole, normalized lines)
+SECTION_HEADINGS = {
+    'summary': [
+        'summary', 'professional summary', 'career summary', 'profile', 'professional profile',
+        'objective', 'career objective', 'about me', 'about',
+    ],
+    'experience': [
+        'experience', 'work experience', 'professional experience', 'relevant experience',
+        'work history', 'employment', 'employment history', 'internships', 'internship',
+        'internship experience',
+    ],
+    'education': [
+        'education', 'educational background', 'academic background', 'academics',
+        'educational qualifications', 'academic qualifications', 'qualifications',
+    ],
+    'skills': [
+        'skills', 'technical skills', 'key skills', 'core skills', 'skill set', 'skillset',
+        'core competencies', 'competencies', 'technologies', 'tools and technologies',
+    ],
+    'projects': [
+        'projects', 'academic projects', 'personal projects', 'key projects', 'project experience',
+    ],
+    'certifications': ['certifications', 'certificates', 'licenses and certifications'],
+    'achievements': ['achievements', 'awards', 'honors', 'honours', 'awards and achievements'],
+    'languages': ['languages', 'languages known'],
+}
+
+_HEADING_LOOKUP = {
+    phrase: name for name, phrases in SECTION_HEADINGS.items() for phrase in phrases
+}
+
+_LINE_PATTERN = re.compile(r'[^\n]*\n?')
+
+
+def _normalize_heading(line):
+    """Lowercase a candidate heading line and strip bullets/punctuation"""
+    line = line.strip().lower()
+    line = re.sub(r'^[\W_]+|[\W_]+$', '', line)
+    line = line.replace('&', 'and')
+    return re.sub(r'\s+', ' ', line)
+
+
+def segment_sections(text):
+    """
+    Find section boundaries in resume text.
+    Returns a list of {'name', 'start', 'end'} dicts, where start is the
+    offset of the heading line and end is the start of the next heading.
+    """
+    if not text:
+        return []
+
+    headings = []
+    for match in _LINE_PATTERN.finditer(text):
+        line = match.group(0)
+        if not line or len(line) > 60:
+            continue
+        name = _HEADING_LOOKUP.get(_normalize_heading(line))
+        if name:
+            headings.append((name, match.start()))
+
+    sections = []
+    for i, (name, start) in enumerate(headings):
+        end = headings[i + 1][1] if i + 1 < len(headings) else len(text)
+        sections.append({'name': name, 'start': start, 'end': end})
+    return sections
+
+
+def get_section_text(text, sections, *names):
+    """Concatenate the slices of text belonging to the named sections"""
+    if not text or not sections:
+        return ""
+    return "\n".join(text[s['start']:s['end']] for s in sections if s['name'] in names)
@@ -1,3 +1,16 @@
+import hashlib
+import io
+import os
+import time
+from datetime import datetime
+
+from config.database import extraction_cache_collection
+from config.settings import EXTRACTION_MAX_PAGES, EXTRACTION_MAX_CHARS
+from utils.extraction_pool import run_isolated, ExtractionError
+from utils.sections import segment_sections
+from utils.ocr import awaits_ocr
+from utils.ocr_queue import enqueue_ocr
+
 # Optional: For PDF text extraction
 try:
     import PyPDF2
@@ -13,19 +26,57 @@ except ImportError:
     DOCX_SUPPORT = False
     print("python-docx not installed. DOCX text extraction disabled.")
 
+# Bump whenever extraction output changes so stale cache entries are ignored
+EXTRACTOR_VERSION = '3'
+
+
+def _open_source(source):
+    """Open a file path, or wrap raw bytes already held in memory"""
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return io.BytesIO(source)
+    return open(source, 'rb')
+
+
+def _read_pdf(source):
+    """
+    Parse a PDF (path or bytes) and return (text, page_count).
+    Stops early once the page or character budget is reached.
+    """
+    with _open_source(source) as file:
+        pdf_reader = PyPDF2.PdfReader(file)
+        parts = []
+        chars = 0
+        for page in pdf_reader.pages[:EXTRACTION_MAX_PAGES]:
+            page_text = page.extract_text() or ""
+            parts.append(page_text)
+            chars += len(page_text)
+            if chars >= EXTRACTION_MAX_CHARS:
+                break
+        return "".join(parts)[:EXTRACTION_MAX_CHARS], len(pdf_reader.pages)
+
+
+def _read_docx(source):
+    """Parse a DOCX (path or bytes) and return (text, page_count); DOCX has no fixed pages"""
+    with _open_source(source) as file:
+        doc = Document(file)
+    parts = []
+    chars = 0
+    for para in doc.paragraphs:
+        parts.append(para.text)
+        chars += len(para.text) + 1
+        if chars >= EXTRACTION_MAX_CHARS:
+            break
+    return "\n".join(parts)[:EXTRACTION_MAX_CHARS], None
+
 
 def extract_text_from_pdf(file_path):
     """Extract text from PDF file"""
     if not PDF_SUPPORT:
         return ""
     try:
-        text = ""
-        with open(file_path, 'rb') as file:
-            pdf_reader = PyPDF2.PdfReader(file)
-            for page in pdf_reader.pages:
-                text += page.extract_text() or ""
+        text, _ = run_isolated(_read_pdf, file_path)
         return text
-    except Exception as e:
+    except ExtractionError as e:
         print(f"Error extracting PDF text: {e}")
         return ""
 
@@ -35,9 +86,141 @@ def extract_text_from_docx(file_path):
     if not DOCX_SUPPORT:
         return ""
     try:
-        doc = Document(file_path)
-        text = "\n".join([para.text for para in doc.paragraphs])
+        text, _ = run_isolated(_read_docx, file_path)
         return text
-    except Exception as e:
+    except ExtractionError as e:
         print(f"Error extracting DOCX text: {e}")
         return ""
+
+
+def file_sha256(file_path):
+    """Compute the SHA-256 hex digest of a file"""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as file:
+        for chunk in iter(lambda: file.read(64 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def save_upload(file_storage, dest_path, chunk_size=64 * 1024):
+    """
+    Stream an uploaded file to dest_path in a single pass.
+    Returns (data, sha256) so the caller can extract from memory
+    without reopening the file from disk.
+    """
+    digest = hashlib.sha256()
+    chunks = []
+    stream = file_storage.stream
+    with open(dest_path, 'wb') as out:
+        for chunk in iter(lambda: stream.read(chunk_size), b''):
+            out.write(chunk)
+            digest.update(chunk)
+            chunks.append(chunk)
+    return b''.join(chunks), digest.hexdigest()
+
+
+def _get_cached_extraction(sha256):
+    """Look up a cached extraction result for the given content hash"""
+    try:
+        return extraction_cache_collection.find_one({
+            '_id': sha256,
+            'extractor_version': EXTRACTOR_VERSION
+        })
+    except Exception as e:
+        print(f"Extraction cache lookup failed: {e}")
+        return None
+
+
+def _store_cached_extraction(sha256, file_type, text, sections, page_count, elapsed_ms, ocr_pending=False):
+    """Save an extraction result keyed by content hash"""
+    try:
+        extraction_cache_collection.replace_one(
+            {'_id': sha256},
+            {
+                '_id': sha256,
+                'extractor_version': EXTRACTOR_VERSION,
+                'file_type': file_type,
+                'text': text,
+                'sections': sections,
+                'page_count': page_count,
+                'ocr': False,
+                'ocr_pending': ocr_pending,
+                'extraction_ms': elapsed_ms,
+                'created_at': datetime.now()
+            },
+            upsert=True
+        )
+    except Exception as e:
+        print(f"Extraction cache store failed: {e}")
+
+
+def _extract_cached(source, file_ext, sha256, raise_errors=False):
+    """
+    Extract text and section offsets from a path or bytes,
+    consulting the hash-keyed cache first. Returns (text, sections).
+    A busy or failed worker pool gives ("", []) unless raise_errors,
+    in which case the ExtractionError propagates so the caller can retry.
+    """
+    if file_ext == 'pdf':
+        if not PDF_SUPPORT:
+            return "", []
+        reader = _read_pdf
+    elif file_ext in ['doc', 'docx']:
+        if not DOCX_SUPPORT:
+            return "", []
+        reader = _read_docx
+    else:
+        return "", []
+
+    cached = _get_cached_extraction(sha256)
+    if cached:
+        text = cached.get('text', '')
+        sections = cached.get('sections')
+        if sections is None:
+            sections = segment_sections(text)
+        if cached.get('ocr_pending'):
+            # e.g. queued by a process that has since exited
+            enqueue_ocr(sha256, source)
+        return text, sections
+
+    started = time.perf_counter()
+    try:
+        text, page_count = run_isolated(reader, source)
+    except ExtractionError as e:
+        print(f"Error extracting {file_ext.upper()} text: {e}")
+        if raise_errors:
+            raise
+        return "", []
+    
+    sections = segment_sections(text)
+    elapsed_ms = round((time.perf_counter() - started) * 1000, 2)
+
+    # Image-only or garbled PDFs are OCRed in the background (see utils/ocr_queue.py);
+    # the text layer is returned now and replaced once OCR finishes
+    ocr_pending = awaits_ocr(text, file_ext)
+    _store_cached_extraction(sha256, file_ext, text, sections, page_count, elapsed_ms, ocr_pending)
+    if ocr_pending:
+        enqueue_ocr(sha256, source)
+    return text, sections
+
+
+def extract_resume_text(file_path, raise_errors=False):
+    """
+    Extract text from a PDF or DOCX resume, returning (text, sections).
+    Results are cached by the SHA-256 of the file bytes, so re-uploads of the
+    same file and later re-reads skip PyPDF2/python-docx entirely.
+    """
+    if not file_path or not os.path.exists(file_path) or '.' not in file_path:
+        return "", []
+
+    file_ext = file_path.rsplit('.', 1)[1].lower()
+    return _extract_cached(file_path, file_ext, file_sha256(file_path), raise_errors)
+
+
+def extract_resume_bytes(data, file_ext, sha256=None, raise_errors=False):
+    """Extract (text, sections) from resume bytes already in memory (e.g. a fresh upload)"""
+    if not data:
+        return "", []
+    if sha256 is None:
+        sha256 = hashlib.sha256(data).hexdigest()
+    return _extract_cached(data, file_ext.lower(), sha256, raise_errors)
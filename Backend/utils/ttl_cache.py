@@ -0,0 +1,169 @@
+"""
+Bounded TTL cache with single-flight computation.
+
+Kept free of application imports so any module (including utils.helpers)
+can build its own cache on top of it.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+
+class _Flight:
+    """One in-progress computation that concurrent callers wait on"""
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.value = None
+        self.error = None
+        self.stale = False
+
+
+class TTLCache:
+    """
+    Bounded LRU cache whose entries expire after ttl seconds.
+    get_or_compute() coalesces concurrent misses for the same key so only
+    one caller runs the computation; the rest wait for its result.
+    A ttl of 0 disables storing but still coalesces concurrent calls.
+    With cache_none=False a computation returning None is not stored.
+    get_or_compute_async() is the coroutine version; it does not coalesce,
+    but like get_or_compute() it drops a result whose key was invalidated
+    while it was being computed.
+    """
+
+    def __init__(self, maxsize=256, ttl=30, cache_none=True):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.cache_none = cache_none
+        self._data = OrderedDict()  # key -> (expires_at, value)
+        self._inflight = {}
+        self._awaiting = {}  # key -> [_Flight] of get_or_compute_async() calls
+        self._lock = threading.Lock()
+        self._metrics = {'hits': 0, 'misses': 0, 'coalesced': 0, 'evictions': 0, 'invalidations': 0}
+
+    def _lookup(self, key, now):
+        entry = self._data.get(key)
+        if entry is None:
+            return False, None
+        if entry[0] <= now:
+            del self._data[key]
+            return False, None
+        self._data.move_to_end(key)
+        return True, entry[1]
+
+    def _store(self, key, value, now):
+        if self.ttl <= 0 or self.maxsize <= 0:
+            return
+        self._data[key] = (now + self.ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+            self._metrics['evictions'] += 1
+
+    def get(self, key, default=None):
+        """Return a live cached value or default"""
+        with self._lock:
+            found, value = self._lookup(key, time.monotonic())
+            self._metrics['hits' if found else 'misses'] += 1
+            return value if found else default
+
+    def set(self, key, value):
+        with self._lock:
+            self._store(key, value, time.monotonic())
+
+    def get_or_compute(self, key, compute):
+        """Return the cached value for key, computing it at most once concurrently"""
+        with self._lock:
+            found, value = self._lookup(key, time.monotonic())
+            if found:
+                self._metrics['hits'] += 1
+                return value
+            flight = self._inflight.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._inflight[key] = _Flight()
+                self._metrics['misses'] += 1
+            else:
+                self._metrics['coalesced'] += 1
+
+        if not leader:
+            flight.event.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value
+
+        try:
+            flight.value = compute()
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+                # A write that invalidated the key mid-computation makes this result stale
+                if flight.error is None and not flight.stale and (self.cache_none or flight.value is not None):
+                    self._store(key, flight.value, time.monotonic())
+            flight.event.set()
+        return flight.value
+
+    async def get_or_compute_async(self, key, compute):
+        """Return the cached value for key, awaiting compute() on a miss"""
+        with self._lock:
+            found, value = self._lookup(key, time.monotonic())
+            self._metrics['hits' if found else 'misses'] += 1
+            if found:
+                return value
+            flight = _Flight()
+            self._awaiting.setdefault(key, []).append(flight)
+
+        try:
+            flight.value = await compute()
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                flights = self._awaiting[key]
+                flights.remove(flight)
+                if not flights:
+                    del self._awaiting[key]
+                # Same rule as get_or_compute(): an invalidation mid-computation wins
+                if flight.error is None and not flight.stale and (self.cache_none or flight.value is not None):
+                    self._store(key, flight.value, time.monotonic())
+        return flight.value
+
+    def _in_progress(self, key):
+        flights = list(self._awaiting.get(key, ()))
+        if key in self._inflight:
+            flights.append(self._inflight[key])
+        return flights
+
+    def invalidate(self, *keys):
+        """Drop the given keys (and mark in-flight computations of them stale)"""
+        with self._lock:
+            for key in keys:
+                self._data.pop(key, None)
+                for flight in self._in_progress(key):
+                    flight.stale = True
+            self._metrics['invalidations'] += 1
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            for flight in self._inflight.values():
+                flight.stale = True
+            for flights in self._awaiting.values():
+                for flight in flights:
+                    flight.stale = True
+            self._metrics['invalidations'] += 1
+
+    def metrics(self):
+        """Snapshot of hit/miss counters"""
+        with self._lock:
+            metrics = dict(self._metrics)
+            metrics['size'] = len(self._data)
+        lookups = metrics['hits'] + metrics['misses'] + metrics['coalesced']
+        metrics['hit_rate'] = round((metrics['hits'] + metrics['coalesced']) / lookups, 3) if lookups else 0
+        metrics['ttl'] = self.ttl
+        return metrics
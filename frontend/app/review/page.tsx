@@ -283,6 +283,24 @@ export default function ReviewPage() {
     }
   };
 
+  // The list endpoint returns summaries only; load the AI analysis on demand
+  const selectResume = async (resume: Resume) => {
+    setSelectedResume(resume);
+    if (resume.aiAnalysis) return;
+
+    try {
+      const response = await fetch(`http://localhost:5000/api/applications/${resume.id}`);
+      const data = await response.json();
+      if (response.ok && data.application) {
+        const aiAnalysis = data.application.ai_analysis || "";
+        setResumes((prev) => prev.map((r) => (r.id === resume.id ? { ...r, aiAnalysis } : r)));
+        setSelectedResume((current) => (current?.id === resume.id ? { ...current, aiAnalysis } : current));
+      }
+    } catch (error) {
+      console.error("Failed to fetch application details:", error);
+    }
+  };
+
   if (!mounted || !isAuthenticated) {
     return (
       <main className="min-h-screen bg-background flex items-center justify-center">
@@ -448,7 +466,7 @@ export default function ReviewPage() {
               filteredResumes.map((resume, index) => (
                 <div
                   key={resume.id}
-                  onClick={() => setSelectedResume(resume)}
+                  onClick={() => selectResume(resume)}
                   className={`bg-card rounded-2xl p-5 border cursor-pointer transition-all duration-200 ${
                     selectedResume?.id === resume.id
                       ? "border-primary shadow-lg ring-1 ring-primary/20"